@@ -0,0 +1,47 @@
+"""HIRA institution snapshot (local spatial index) - 027"""
+import asyncio
+import asyncpg
+import os
+
+SQL = (
+    "CREATE TABLE IF NOT EXISTS hira_institutions ("
+    "ykiho VARCHAR(200) PRIMARY KEY,"
+    "kind VARCHAR(20) NOT NULL,"
+    "name VARCHAR(200) NOT NULL,"
+    "address VARCHAR(500),"
+    "phone VARCHAR(50),"
+    "clinic_type VARCHAR(100),"
+    "cl_cd_nm VARCHAR(50),"
+    "dgsbjt_codes VARCHAR(200),"
+    "latitude DOUBLE PRECISION NOT NULL,"
+    "longitude DOUBLE PRECISION NOT NULL,"
+    "geo_cell INTEGER NOT NULL,"
+    "beds INTEGER DEFAULT 0,"
+    "doctors INTEGER DEFAULT 0,"
+    "pharmacists INTEGER DEFAULT 0,"
+    "established VARCHAR(20),"
+    "sido_cd VARCHAR(10),"
+    "sggu_cd VARCHAR(10),"
+    "snapshot_at TIMESTAMP NOT NULL DEFAULT NOW()"
+    ");\n"
+    "CREATE INDEX IF NOT EXISTS ix_hira_inst_kind_cell ON hira_institutions(kind, geo_cell);\n"
+    "CREATE INDEX IF NOT EXISTS ix_hira_inst_snapshot ON hira_institutions(kind, snapshot_at);\n"
+)
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        print("OK: 027_hira_institutions migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,34 @@
+"""Simulation baseline bundles (sggu x clinic_type) - 028"""
+import asyncio
+import asyncpg
+import os
+
+SQL = (
+    "CREATE TABLE IF NOT EXISTS simulation_baselines ("
+    "sggu_cd VARCHAR(5) NOT NULL,"
+    "clinic_type VARCHAR(50) NOT NULL,"
+    "bundle JSON NOT NULL,"
+    "source VARCHAR(20) NOT NULL DEFAULT 'nightly',"
+    "built_at TIMESTAMP NOT NULL DEFAULT NOW(),"
+    "PRIMARY KEY (sggu_cd, clinic_type)"
+    ");\n"
+    "CREATE INDEX IF NOT EXISTS ix_simulation_baselines_built_at ON simulation_baselines(built_at);\n"
+)
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        print("OK: 028_simulation_baselines migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
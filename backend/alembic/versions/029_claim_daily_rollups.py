@@ -0,0 +1,53 @@
+"""Claim daily rollups (user x claim_date x status) + backfill - 029"""
+import asyncio
+import asyncpg
+import os
+
+SQL = (
+    "CREATE TABLE IF NOT EXISTS claim_daily_rollups ("
+    "user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,"
+    "claim_date DATE NOT NULL,"
+    "status claimstatus NOT NULL,"
+    "claim_count INTEGER NOT NULL DEFAULT 0,"
+    "total_amount BIGINT NOT NULL DEFAULT 0,"
+    "approved_amount BIGINT NOT NULL DEFAULT 0,"
+    "rejected_amount BIGINT NOT NULL DEFAULT 0,"
+    "risk_score_sum BIGINT NOT NULL DEFAULT 0,"
+    "risk_low_count INTEGER NOT NULL DEFAULT 0,"
+    "risk_medium_count INTEGER NOT NULL DEFAULT 0,"
+    "risk_high_count INTEGER NOT NULL DEFAULT 0,"
+    "PRIMARY KEY (user_id, claim_date, status)"
+    ");\n"
+)
+
+# 기존 청구로 집계 재계산 (재실행해도 결과 동일)
+BACKFILL_SQL = (
+    "TRUNCATE claim_daily_rollups;\n"
+    "INSERT INTO claim_daily_rollups (user_id, claim_date, status, claim_count, total_amount, "
+    "approved_amount, rejected_amount, risk_score_sum, risk_low_count, risk_medium_count, risk_high_count) "
+    "SELECT user_id, claim_date, status, COUNT(*), COALESCE(SUM(total_amount), 0), "
+    "COALESCE(SUM(approved_amount), 0), COALESCE(SUM(rejected_amount), 0), COALESCE(SUM(risk_score), 0), "
+    "COUNT(*) FILTER (WHERE risk_level = 'LOW'), COUNT(*) FILTER (WHERE risk_level = 'MEDIUM'), "
+    "COUNT(*) FILTER (WHERE risk_level = 'HIGH') "
+    "FROM insurance_claims GROUP BY user_id, claim_date, status;\n"
+)
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        async with conn.transaction():
+            await conn.execute(BACKFILL_SQL)
+        print("OK: 029_claim_daily_rollups migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,47 @@
+"""HIRA code search trigram indexes (code columns + name columns) - 030"""
+import asyncio
+import asyncpg
+import os
+
+# CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 한 문장씩 실행해야 함
+STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # 코드 부분일치 (기존에는 code ILIKE '%q%'가 전체 스캔)
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_fee_code_trgm "
+    "ON hira_fee_codes USING gin (code gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_disease_code_trgm "
+    "ON hira_disease_codes USING gin (code gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_drug_code_trgm "
+    "ON hira_drug_codes USING gin (code gin_trgm_ops)",
+    # 명칭 인덱스 (모델에 정의돼 있으나 create_all 이전에 만들어진 테이블 대비)
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_fee_name_trgm "
+    "ON hira_fee_codes USING gin (name gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_disease_name_trgm "
+    "ON hira_disease_codes USING gin (name_kr gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_drug_product_trgm "
+    "ON hira_drug_codes USING gin (product_name gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hira_drug_ingredient_trgm "
+    "ON hira_drug_codes USING gin (ingredient_name gin_trgm_ops)",
+    "ANALYZE hira_fee_codes",
+    "ANALYZE hira_disease_codes",
+    "ANALYZE hira_drug_codes",
+]
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        for statement in STATEMENTS:
+            await conn.execute(statement)
+        print("OK: 030_hira_code_trgm_indexes migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
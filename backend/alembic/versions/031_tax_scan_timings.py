@@ -0,0 +1,26 @@
+"""Per-scanner timings on tax scan results - 031"""
+import asyncio
+import asyncpg
+import os
+
+SQL = (
+    "ALTER TABLE tax_scan_results ADD COLUMN IF NOT EXISTS scanner_timings JSONB NOT NULL DEFAULT '{}'::jsonb;\n"
+)
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        print("OK: 031_tax_scan_timings migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
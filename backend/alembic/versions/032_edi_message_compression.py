@@ -0,0 +1,26 @@
+"""Compressed EDI message payloads - 032"""
+import asyncio
+import asyncpg
+import os
+
+SQL = (
+    "ALTER TABLE edi_message_logs ADD COLUMN IF NOT EXISTS xml_message_gz BYTEA;\n"
+)
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        print("OK: 032_edi_message_compression migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
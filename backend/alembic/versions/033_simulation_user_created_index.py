@@ -0,0 +1,28 @@
+"""Simulation listing index (user_id, created_at, id) - 033"""
+import asyncio
+import asyncpg
+import os
+
+# CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+SQL = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_simulations_user_created "
+    "ON simulations (user_id, created_at, id)"
+)
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        print("OK: 033_simulation_user_created_index migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
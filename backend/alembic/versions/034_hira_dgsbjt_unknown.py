@@ -0,0 +1,24 @@
+"""HIRA snapshot: unresolved dgsbjtCd codes per institution - 034"""
+import asyncio
+import asyncpg
+import os
+
+SQL = "ALTER TABLE hira_institutions ADD COLUMN IF NOT EXISTS dgsbjt_unknown VARCHAR(200)"
+
+
+async def run():
+    db_url = os.environ.get("DATABASE_URL", "")
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    dsn = db_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(SQL)
+        print("OK: 034_hira_dgsbjt_unknown migration completed")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -2,11 +2,11 @@ from typing import AsyncGenerator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from ..core.database import async_session
 from ..core.security import get_current_user, TokenData, RoleChecker, UserRole, verify_token
 from ..models.user import User
+from ..services.principal_cache import principal_cache
 
 # Optional bearer scheme (doesn't require auth)
 optional_bearer = HTTPBearer(auto_error=False)
@@ -44,25 +44,22 @@ async def get_current_active_user(
     db: AsyncSession = Depends(get_db),
     token_data: TokenData = Depends(get_current_user)
 ) -> User:
-    """Get current active user from database."""
-    result = await db.execute(
-        select(User).where(User.id == token_data.user_id)
-    )
-    user = result.scalar_one_or_none()
+    """Get current active user (short-TTL principal cache, falls back to database)."""
+    principal = await principal_cache.get(db, token_data.user_id)
 
-    if not user:
+    if not principal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user"
         )
 
-    return user
+    return await principal_cache.attach_user(db, principal)
 
 
 # Role-based access control dependencies
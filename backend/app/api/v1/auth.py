@@ -12,7 +12,7 @@ from ...schemas.user import (
 )
 from ...models.user import User
 from ...core.security import (
-    get_password_hash, verify_password,
+    get_password_hash_async, verify_password_async,
     create_access_token, create_refresh_token, verify_token,
     get_current_user, TokenData
 )
@@ -42,7 +42,7 @@ async def register(
     # Create user
     user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash_async(user_data.password),
         full_name=user_data.full_name,
         phone=user_data.phone,
         role=user_data.role,
@@ -68,7 +68,10 @@ async def login(
     )
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    valid, new_hash = (
+        await verify_password_async(credentials.password, user.hashed_password) if user else (False, None)
+    )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -80,6 +83,10 @@ async def login(
             detail="User account is disabled"
         )
 
+    # 해시 비용(BCRYPT_ROUNDS)이 바뀌었으면 새 비용으로 재해시
+    if new_hash:
+        user.hashed_password = new_hash
+
     # Update last login
     user.last_login = datetime.utcnow()
     await db.commit()
@@ -247,7 +254,7 @@ async def reset_password(
         await db.commit()
         raise HTTPException(status_code=400, detail="토큰이 만료되었습니다. 다시 요청해주세요.")
 
-    user.hashed_password = get_password_hash(data.new_password)
+    user.hashed_password = await get_password_hash_async(data.new_password)
     user.reset_token = None
     user.reset_token_expires = None
     await db.commit()
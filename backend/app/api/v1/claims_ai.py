@@ -266,9 +266,18 @@ async def full_ai_pre_review(
     if not dx_codes and not tx_codes:
         tx_codes = [i.code for i in items]
 
-    # rejection_patterns 조회
-    patterns_result = await db.execute(select(RejectionPattern))
-    rejection_patterns = patterns_result.scalars().all()
+    # rejection_patterns 조회 — 파이프라인이 참조하는 dx × tx 조합만 (전체 테이블 로드 대신)
+    rejection_patterns = []
+    if dx_codes and tx_codes:
+        patterns_result = await db.execute(
+            select(RejectionPattern).where(
+                and_(
+                    RejectionPattern.diagnosis_code.in_(dx_codes),
+                    RejectionPattern.treatment_code.in_(tx_codes),
+                )
+            )
+        )
+        rejection_patterns = patterns_result.scalars().all()
 
     # 5단계 파이프라인 실행
     analysis = _run_5stage_pipeline(dx_codes, tx_codes, items, rejection_patterns)
@@ -22,9 +22,10 @@ from ...models.user import User
 from ...models.service_subscription import ServiceSubscription, ServiceType
 from ...models.insurance_claim import (
     InsuranceClaim, ClaimItem, ClaimBatch,
-    ClaimStatus, RiskLevel, ClaimItemType,
+    ClaimStatus, ClaimItemType,
 )
 from ...models.claims_ai import PeerBenchmark, RejectionPattern
+from ...services.claims_analytics import claims_analytics_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -237,116 +238,11 @@ async def analytics_dashboard(
     current_user: User = Depends(get_current_active_user),
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
-    """분석 대시보드 종합 데이터"""
-    result = await db.execute(
-        select(InsuranceClaim).where(InsuranceClaim.user_id == current_user.id)
-    )
-    claims = result.scalars().all()
-
-    if not claims:
+    """분석 대시보드 종합 데이터 (일별 집계 테이블에서 SQL 합산)"""
+    dashboard = await claims_analytics_service.dashboard(db, current_user.id, date.today())
+    if dashboard is None:
         return _demo_dashboard()
-
-    today = date.today()
-    thirty_days_ago = today - timedelta(days=30)
-
-    # 최근 30일 청구
-    recent = [c for c in claims if c.claim_date and c.claim_date >= thirty_days_ago]
-    all_claims = claims
-
-    # 요약 통계
-    total_amount = sum(c.total_amount for c in recent)
-    accepted_claims = [c for c in recent if c.status == ClaimStatus.ACCEPTED]
-    rejected_claims = [c for c in recent if c.status == ClaimStatus.REJECTED]
-    partial_claims = [c for c in recent if c.status == ClaimStatus.PARTIAL]
-    resolved = [c for c in recent if c.status in (ClaimStatus.ACCEPTED, ClaimStatus.PARTIAL, ClaimStatus.REJECTED)]
-
-    accepted_amount = sum(c.approved_amount or 0 for c in resolved)
-    rejected_amount = sum(c.rejected_amount or 0 for c in resolved)
-    total_resolved = sum(c.total_amount for c in resolved)
-
-    acceptance_rate = round(accepted_amount / total_resolved * 100, 1) if total_resolved > 0 else 0
-    rejection_rate = round(rejected_amount / total_resolved * 100, 1) if total_resolved > 0 else 0
-
-    avg_risk_score = round(sum(c.risk_score or 0 for c in recent) / len(recent), 1) if recent else 0
-    high_risk_count = sum(1 for c in recent if c.risk_level == RiskLevel.HIGH)
-
-    # 리스크 분포
-    risk_dist = {"LOW": 0, "MEDIUM": 0, "HIGH": 0}
-    for c in recent:
-        if c.risk_level:
-            risk_dist[c.risk_level.value] = risk_dist.get(c.risk_level.value, 0) + 1
-
-    # 상태 분포
-    status_breakdown = defaultdict(int)
-    for c in all_claims:
-        if c.status:
-            status_breakdown[c.status.value] += 1
-
-    # 월별 트렌드 (최근 6개월)
-    monthly_trends = []
-    for i in range(5, -1, -1):
-        month_start = today.replace(day=1) - timedelta(days=30 * i)
-        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
-        month_str = month_start.strftime("%Y-%m")
-
-        month_claims = [c for c in all_claims if c.claim_date and month_start <= c.claim_date <= month_end]
-        m_accepted = sum(1 for c in month_claims if c.status == ClaimStatus.ACCEPTED)
-        m_rejected = sum(1 for c in month_claims if c.status == ClaimStatus.REJECTED)
-        m_partial = sum(1 for c in month_claims if c.status == ClaimStatus.PARTIAL)
-        m_total_amount = sum(c.total_amount for c in month_claims)
-        m_rejected_amount = sum(c.rejected_amount or 0 for c in month_claims)
-
-        monthly_trends.append({
-            "month": month_str,
-            "total_claims": len(month_claims),
-            "accepted": m_accepted,
-            "rejected": m_rejected,
-            "partial": m_partial,
-            "total_amount": m_total_amount,
-            "rejected_amount": m_rejected_amount,
-        })
-
-    # 자주 삭감되는 코드 (항목 기반 분석)
-    top_rejected_codes = []
-    items_result = await db.execute(
-        select(ClaimItem).where(
-            ClaimItem.claim_id.in_([c.id for c in rejected_claims + partial_claims])
-        )
-    )
-    rejected_items = items_result.scalars().all()
-
-    code_stats = defaultdict(lambda: {"count": 0, "amount": 0, "name": ""})
-    for item in rejected_items:
-        code_stats[item.code]["count"] += 1
-        code_stats[item.code]["amount"] += item.total_price
-        code_stats[item.code]["name"] = item.name
-
-    for code, stats in sorted(code_stats.items(), key=lambda x: x[1]["count"], reverse=True)[:5]:
-        top_rejected_codes.append({
-            "code": code,
-            "name": stats["name"],
-            "rejection_count": stats["count"],
-            "total_amount": stats["amount"],
-        })
-
-    return {
-        "period": f"{thirty_days_ago.isoformat()} ~ {today.isoformat()}",
-        "summary": {
-            "total_claims": len(recent),
-            "total_amount": total_amount,
-            "accepted_amount": accepted_amount,
-            "rejected_amount": rejected_amount,
-            "acceptance_rate": acceptance_rate,
-            "rejection_rate": rejection_rate,
-            "avg_risk_score": avg_risk_score,
-            "high_risk_count": high_risk_count,
-        },
-        "monthly_trends": monthly_trends,
-        "risk_distribution": risk_dist,
-        "top_rejected_codes": top_rejected_codes,
-        "status_breakdown": dict(status_breakdown),
-        "is_demo": False,
-    }
+    return {**dashboard, "is_demo": False}
 
 
 @router.get("/trends")
@@ -356,49 +252,10 @@ async def claim_trends(
     current_user: User = Depends(get_current_active_user),
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
-    """월별 청구 트렌드"""
-    today = date.today()
-    start_date = today.replace(day=1) - timedelta(days=30 * (months - 1))
-
-    result = await db.execute(
-        select(InsuranceClaim).where(
-            and_(
-                InsuranceClaim.user_id == current_user.id,
-                InsuranceClaim.claim_date >= start_date,
-            )
-        )
-    )
-    claims = result.scalars().all()
-
-    if not claims:
+    """월별 청구 트렌드 (달력 월 기준)"""
+    trends = await claims_analytics_service.trends(db, current_user.id, months, date.today())
+    if trends is None:
         return _demo_trends(months)
-
-    trends = []
-    for i in range(months - 1, -1, -1):
-        month_start = today.replace(day=1) - timedelta(days=30 * i)
-        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
-        month_str = month_start.strftime("%Y-%m")
-
-        month_claims = [c for c in claims if c.claim_date and month_start <= c.claim_date <= month_end]
-        accepted = sum(1 for c in month_claims if c.status == ClaimStatus.ACCEPTED)
-        rejected = sum(1 for c in month_claims if c.status == ClaimStatus.REJECTED)
-        partial = sum(1 for c in month_claims if c.status == ClaimStatus.PARTIAL)
-        total_amount = sum(c.total_amount for c in month_claims)
-        rejected_amount = sum(c.rejected_amount or 0 for c in month_claims)
-
-        total = len(month_claims)
-        trends.append({
-            "month": month_str,
-            "total_claims": total,
-            "accepted": accepted,
-            "rejected": rejected,
-            "partial": partial,
-            "total_amount": total_amount,
-            "rejected_amount": rejected_amount,
-            "acceptance_rate": round(accepted / total * 100, 1) if total > 0 else 0,
-            "rejection_rate": round((rejected + partial) / total * 100, 1) if total > 0 else 0,
-        })
-
     return {"trends": trends, "months": months, "is_demo": False}
 
 
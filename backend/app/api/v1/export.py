@@ -1,12 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from io import BytesIO
 
 from ...models.prospect import ProspectType, ProspectStatus
 from ...services.prospect import prospect_service
-from ..deps import get_db, require_sales_rep
+from ..deps import require_sales_rep
 from ...core.security import TokenData
 
 router = APIRouter()
@@ -17,13 +15,13 @@ async def export_excel(
     type: Optional[ProspectType] = Query(None, description="잠재지 유형"),
     status: Optional[ProspectStatus] = Query(None, description="상태"),
     min_score: Optional[int] = Query(None, ge=0, le=100, description="최소 적합도 점수"),
-    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(require_sales_rep)
 ):
     """
     Excel 내보내기
 
     조건에 맞는 잠재 개원지 목록을 Excel 파일로 다운로드합니다.
+    (write-only 워크북 — 행 수와 무관하게 메모리 일정)
     """
     filters = {
         "prospect_type": type,
@@ -31,14 +29,8 @@ async def export_excel(
         "min_score": min_score
     }
 
-    excel_data = await prospect_service.export_prospects(
-        db=db,
-        format="excel",
-        filters=filters
-    )
-
     return StreamingResponse(
-        BytesIO(excel_data),
+        prospect_service.stream_export("excel", filters),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": "attachment; filename=prospects.xlsx"}
     )
@@ -49,13 +41,13 @@ async def export_csv(
     type: Optional[ProspectType] = Query(None, description="잠재지 유형"),
     status: Optional[ProspectStatus] = Query(None, description="상태"),
     min_score: Optional[int] = Query(None, ge=0, le=100, description="최소 적합도 점수"),
-    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(require_sales_rep)
 ):
     """
     CSV 내보내기
 
     조건에 맞는 잠재 개원지 목록을 CSV 파일로 다운로드합니다.
+    (서버사이드 커서로 읽으면서 바로 전송)
     """
     filters = {
         "prospect_type": type,
@@ -63,14 +55,8 @@ async def export_csv(
         "min_score": min_score
     }
 
-    csv_data = await prospect_service.export_prospects(
-        db=db,
-        format="csv",
-        filters=filters
-    )
-
     return StreamingResponse(
-        BytesIO(csv_data),
+        prospect_service.stream_export("csv", filters),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=prospects.csv"}
     )
@@ -3,8 +3,8 @@
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional, List
-from math import radians, sin, cos, sqrt, atan2
 
+from ...core.geo import annotate_distances
 from ...services.external_api import external_api_service
 from ...schemas.hira import (
     NearbyHospitalsRequest, NearbyHospitalsResponse,
@@ -41,21 +41,6 @@ REGION_CODES = {
 }
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
-    """두 좌표 간 거리 계산 (미터)"""
-    R = 6371000  # 지구 반경 (미터)
-
-    lat1_rad = radians(lat1)
-    lat2_rad = radians(lat2)
-    delta_lat = radians(lat2 - lat1)
-    delta_lon = radians(lon2 - lon1)
-
-    a = sin(delta_lat/2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
-
-    return int(R * c)
-
-
 @router.get("/hospitals/nearby", response_model=NearbyHospitalsResponse)
 async def get_nearby_hospitals(
     latitude: float = Query(..., description="위도"),
@@ -88,14 +73,7 @@ async def get_nearby_hospitals(
         )
 
     # 거리 계산 및 정렬
-    for h in hospitals:
-        h["distance_m"] = calculate_distance(
-            latitude, longitude,
-            h.get("latitude", 0), h.get("longitude", 0)
-        )
-
-    hospitals = [h for h in hospitals if h["distance_m"] <= radius_m]
-    hospitals.sort(key=lambda x: x["distance_m"])
+    hospitals = annotate_distances(latitude, longitude, hospitals, radius_m=radius_m, field="distance_m")
 
     items = [HospitalWithRevenue(**h) for h in hospitals]
 
@@ -271,14 +249,7 @@ async def get_nearby_pharmacies(
     )
 
     # 거리 계산 및 정렬
-    for p in pharmacies:
-        p["distance_m"] = calculate_distance(
-            latitude, longitude,
-            p.get("latitude", 0), p.get("longitude", 0)
-        )
-
-    pharmacies = [p for p in pharmacies if p["distance_m"] <= radius_m]
-    pharmacies.sort(key=lambda x: x["distance_m"])
+    pharmacies = annotate_distances(latitude, longitude, pharmacies, radius_m=radius_m, field="distance_m")
 
     if include_stats:
         # 각 약국의 인근 병원 정보 조회
@@ -8,7 +8,7 @@ HIRA 코드 검색 엔드포인트 (자동완성)
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, or_
+from sqlalchemy import select, and_, func
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
@@ -20,6 +20,11 @@ from ...models.user import User
 from ...models.service_subscription import ServiceSubscription, ServiceType
 from ...models.hira_code import HIRAFeeCode, HIRADiseaseCode, HIRADrugCode
 from ...models.claims_ai import RejectionPattern
+from ...core.config import settings
+from ...services.hira_code_search import (
+    disease_code_dict, disease_code_search_index, drug_code_dict, drug_code_search_index,
+    fee_code_dict, fee_code_search_index, ranked_search,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -131,20 +136,16 @@ async def search_fee_codes(
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
     """수가코드 검색 (자동완성)"""
-    result = await db.execute(
-        select(HIRAFeeCode).where(
-            and_(
-                HIRAFeeCode.is_active == True,
-                or_(
-                    HIRAFeeCode.code.ilike(f"%{q}%"),
-                    HIRAFeeCode.name.ilike(f"%{q}%"),
-                ),
-            )
-        ).limit(limit)
-    )
-    codes = result.scalars().all()
+    data = None
+    if settings.HIRA_FEE_SEARCH_IN_MEMORY:
+        data = await fee_code_search_index.search(q, limit)
+    if data is None:
+        result = await db.execute(
+            ranked_search(HIRAFeeCode, HIRAFeeCode.code, [HIRAFeeCode.name], q, limit)
+        )
+        data = [fee_code_dict(c) for c in result.scalars().all()]
 
-    if not codes:
+    if not data:
         # 데모 데이터 폴백
         q_lower = q.lower()
         matches = [
@@ -160,20 +161,8 @@ async def search_fee_codes(
         }
 
     return {
-        "data": [
-            {
-                "code": c.code,
-                "name": c.name,
-                "name_en": c.name_en,
-                "category": c.category,
-                "unit_price": c.unit_price,
-                "insurance_type": c.insurance_type,
-                "max_frequency": c.max_frequency,
-                "frequency_period_days": c.frequency_period_days,
-            }
-            for c in codes
-        ],
-        "total": len(codes),
+        "data": data,
+        "total": len(data),
         "is_demo": False,
     }
 
@@ -187,20 +176,16 @@ async def search_disease_codes(
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
     """상병코드 검색 (KCD-7, 자동완성)"""
-    result = await db.execute(
-        select(HIRADiseaseCode).where(
-            and_(
-                HIRADiseaseCode.is_active == True,
-                or_(
-                    HIRADiseaseCode.code.ilike(f"%{q}%"),
-                    HIRADiseaseCode.name_kr.ilike(f"%{q}%"),
-                ),
-            )
-        ).limit(limit)
-    )
-    codes = result.scalars().all()
+    data = None
+    if settings.HIRA_CODE_SEARCH_IN_MEMORY:
+        data = await disease_code_search_index.search(q, limit)
+    if data is None:
+        result = await db.execute(
+            ranked_search(HIRADiseaseCode, HIRADiseaseCode.code, [HIRADiseaseCode.name_kr], q, limit)
+        )
+        data = [disease_code_dict(c) for c in result.scalars().all()]
 
-    if not codes:
+    if not data:
         q_lower = q.lower()
         matches = [
             c for c in DEMO_DISEASE_CODES
@@ -215,19 +200,8 @@ async def search_disease_codes(
         }
 
     return {
-        "data": [
-            {
-                "code": c.code,
-                "name_kr": c.name_kr,
-                "name_en": c.name_en,
-                "chapter": c.chapter,
-                "is_chronic": c.is_chronic,
-                "is_rare": c.is_rare,
-                "common_procedures": c.common_procedures,
-            }
-            for c in codes
-        ],
-        "total": len(codes),
+        "data": data,
+        "total": len(data),
         "is_demo": False,
     }
 
@@ -241,21 +215,19 @@ async def search_drug_codes(
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
     """약품코드 검색 (자동완성)"""
-    result = await db.execute(
-        select(HIRADrugCode).where(
-            and_(
-                HIRADrugCode.is_active == True,
-                or_(
-                    HIRADrugCode.code.ilike(f"%{q}%"),
-                    HIRADrugCode.product_name.ilike(f"%{q}%"),
-                    HIRADrugCode.ingredient_name.ilike(f"%{q}%"),
-                ),
+    data = None
+    if settings.HIRA_CODE_SEARCH_IN_MEMORY:
+        data = await drug_code_search_index.search(q, limit)
+    if data is None:
+        result = await db.execute(
+            ranked_search(
+                HIRADrugCode, HIRADrugCode.code,
+                [HIRADrugCode.product_name, HIRADrugCode.ingredient_name], q, limit,
             )
-        ).limit(limit)
-    )
-    codes = result.scalars().all()
+        )
+        data = [drug_code_dict(c) for c in result.scalars().all()]
 
-    if not codes:
+    if not data:
         q_lower = q.lower()
         matches = [
             c for c in DEMO_DRUG_CODES
@@ -272,22 +244,8 @@ async def search_drug_codes(
         }
 
     return {
-        "data": [
-            {
-                "code": c.code,
-                "product_name": c.product_name,
-                "ingredient_name": c.ingredient_name,
-                "manufacturer": c.manufacturer,
-                "insurance_price": c.insurance_price,
-                "insurance_type": c.insurance_type,
-                "is_narcotic": c.is_narcotic,
-                "is_antibiotic": c.is_antibiotic,
-                "requires_monitoring": c.requires_monitoring,
-                "dosage_form": c.dosage_form,
-            }
-            for c in codes
-        ],
-        "total": len(codes),
+        "data": data,
+        "total": len(data),
         "is_demo": False,
     }
 
@@ -4,12 +4,12 @@ from sqlalchemy import select, and_, or_
 from typing import Optional, List
 from pydantic import BaseModel
 from enum import Enum
-from math import radians, sin, cos, sqrt, atan2
 
 from ..deps import get_db
 from ...models.hospital import Hospital
 from ...models.prospect import ProspectLocation, ProspectStatus
 from ...models.pharmacy import PharmacySlot, SlotStatus
+from ...core.geo import annotate_distances
 from ...services.external_api import external_api_service
 
 router = APIRouter()
@@ -273,18 +273,6 @@ async def get_marker_detail(
     return {"error": "Marker not found"}
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
-    """두 좌표 간 거리 계산 (미터)"""
-    R = 6371000
-    lat1_rad = radians(lat1)
-    lat2_rad = radians(lat2)
-    delta_lat = radians(lat2 - lat1)
-    delta_lon = radians(lon2 - lon1)
-    a = sin(delta_lat/2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(delta_lon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
-    return int(R * c)
-
-
 @router.get("/hira/hospitals")
 async def get_hira_hospitals_on_map(
     latitude: float = Query(..., description="중심 위도"),
@@ -304,29 +292,23 @@ async def get_hira_hospitals_on_map(
         clinic_type=clinic_type
     )
 
-    # 거리 계산 및 마커 형식 변환
-    markers = []
-    for h in hospitals:
-        h_lat = h.get("latitude", 0)
-        h_lng = h.get("longitude", 0)
-        distance = calculate_distance(latitude, longitude, h_lat, h_lng)
-
-        if distance <= radius_m:
-            markers.append(MapMarker(
-                id=h.get("ykiho", ""),
-                lat=h_lat,
-                lng=h_lng,
-                title=h.get("name", ""),
-                type=MarkerType.HOSPITAL,
-                info=MarkerInfo(
-                    address=h.get("address"),
-                    specialty=h.get("clinic_type"),
-                    est_revenue=h.get("est_monthly_revenue")
-                )
-            ))
-
-    # 거리순 정렬
-    markers.sort(key=lambda m: calculate_distance(latitude, longitude, m.lat, m.lng))
+    # 거리 계산 + 반경 필터 + 거리순 정렬 후 마커 형식 변환
+    nearby = annotate_distances(latitude, longitude, hospitals, radius_m=radius_m, field="distance_m")
+    markers = [
+        MapMarker(
+            id=h.get("ykiho", ""),
+            lat=h["latitude"],
+            lng=h["longitude"],
+            title=h.get("name", ""),
+            type=MarkerType.HOSPITAL,
+            info=MarkerInfo(
+                address=h.get("address"),
+                specialty=h.get("clinic_type"),
+                est_revenue=h.get("est_monthly_revenue")
+            )
+        )
+        for h in nearby
+    ]
 
     return {
         "markers": markers,
@@ -352,30 +334,24 @@ async def get_hira_pharmacies_on_map(
         radius_m=radius_m
     )
 
-    # 거리 계산 및 마커 형식 변환
-    markers = []
-    for p in pharmacies:
-        p_lat = p.get("latitude", 0)
-        p_lng = p.get("longitude", 0)
-        distance = calculate_distance(latitude, longitude, p_lat, p_lng)
-
-        if distance <= radius_m:
-            markers.append({
-                "id": p.get("ykiho", ""),
-                "lat": p_lat,
-                "lng": p_lng,
-                "title": p.get("name", ""),
-                "type": "pharmacy_hira",
-                "info": {
-                    "address": p.get("address"),
-                    "phone": p.get("phone"),
-                    "pharmacists": p.get("pharmacists"),
-                    "distance_m": distance
-                }
-            })
-
-    # 거리순 정렬
-    markers.sort(key=lambda m: m["info"]["distance_m"])
+    # 거리 계산 + 반경 필터 + 거리순 정렬 후 마커 형식 변환
+    nearby = annotate_distances(latitude, longitude, pharmacies, radius_m=radius_m, field="distance_m")
+    markers = [
+        {
+            "id": p.get("ykiho", ""),
+            "lat": p["latitude"],
+            "lng": p["longitude"],
+            "title": p.get("name", ""),
+            "type": "pharmacy_hira",
+            "info": {
+                "address": p.get("address"),
+                "phone": p.get("phone"),
+                "pharmacists": p.get("pharmacists"),
+                "distance_m": p["distance_m"]
+            }
+        }
+        for p in nearby
+    ]
 
     return {
         "markers": markers,
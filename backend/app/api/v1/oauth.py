@@ -367,12 +367,12 @@ async def process_oauth_user(db: AsyncSession, user_info: OAuthUserInfo) -> dict
 
     if not user:
         # 새 사용자 생성
-        from app.core.security import get_password_hash
+        from app.core.security import get_password_hash_async
         temp_password = secrets.token_urlsafe(32)
 
         user = User(
             email=user_info.email,
-            hashed_password=get_password_hash(temp_password),
+            hashed_password=await get_password_hash_async(temp_password),
             full_name=user_info.name,
             role=UserRole.DOCTOR,  # 기본 역할
             is_active=True,
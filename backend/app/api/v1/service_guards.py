@@ -5,13 +5,13 @@ FastAPI Depends()로 사용하여 활성 서비스 구독이 필요한 엔드포
 """
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
 
 from ..deps import get_db, get_current_active_user
 from ...models.user import User, UserRole
 from ...models.service_subscription import (
-    ServiceSubscription, ServiceType, ServiceSubStatus
+    ServiceSubscription, ServiceType, ServiceTier, ServiceSubStatus
 )
+from ...services.principal_cache import principal_cache
 
 
 def require_active_service(service_type: ServiceType):
@@ -37,18 +37,11 @@ def require_active_service(service_type: ServiceType):
                 status=ServiceSubStatus.ACTIVE,
             )
 
-        result = await db.execute(
-            select(ServiceSubscription).where(
-                and_(
-                    ServiceSubscription.user_id == current_user.id,
-                    ServiceSubscription.service_type == service_type,
-                    ServiceSubscription.status == ServiceSubStatus.ACTIVE,
-                )
-            )
-        )
-        sub = result.scalar_one_or_none()
+        # 활성 구독 여부는 principal 캐시 (구독 상태 변경 시 무효화)
+        principal = await principal_cache.get(db, current_user.id)
+        entitlement = principal.services.get(service_type.value) if principal else None
 
-        if not sub:
+        if not entitlement:
             service_names = {
                 ServiceType.HOMEPAGE: "홈페이지 제작",
                 ServiceType.PROGRAM: "프로그램 개발",
@@ -60,6 +53,13 @@ def require_active_service(service_type: ServiceType):
                 detail=f"활성 {name} 구독이 필요합니다. 구독을 시작해주세요.",
             )
 
-        return sub
+        sub_id, tier = entitlement
+        return ServiceSubscription(
+            id=sub_id,
+            user_id=current_user.id,
+            service_type=service_type,
+            tier=ServiceTier(tier),
+            status=ServiceSubStatus.ACTIVE,
+        )
 
     return _check
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -543,8 +543,8 @@ async def download_report(
                 detail="Simulation not found for admin PDF generation",
             )
 
-        pdf_bytes = pdf_generator_service.generate_simulation_report_pdf(
-            simulation, simulation.demographics_data or {}
+        pdf_bytes = await pdf_generator_service.render_simulation_report_pdf(
+            simulation, simulation.demographics_data or {}, variant="demographics"
         )
         filename = f"메디플라톤_상권분석_{simulation.clinic_type}_{datetime.now().strftime('%Y%m%d')}.pdf"
         return StreamingResponse(
@@ -579,18 +579,26 @@ async def download_report(
 
 @router.get("/my/simulations", response_model=SimulationListResponse)
 async def get_my_simulations(
-    page: int = 1,
-    page_size: int = 10,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (있으면 page 대신 사용)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """내 시뮬레이션 목록"""
-    result = await simulation_service.get_user_simulations(
-        db=db,
-        user_id=current_user.id,
-        page=page,
-        page_size=page_size
-    )
+    """내 시뮬레이션 목록 (요약)"""
+    try:
+        result = await simulation_service.get_user_simulations(
+            db=db,
+            user_id=current_user.id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다.",
+        )
     return result
 
 
@@ -787,7 +795,7 @@ async def pay_report(
 
     # PDF 생성
     try:
-        pdf_bytes = pdf_generator_service.generate_simulation_report_pdf(
+        pdf_bytes = await pdf_generator_service.render_simulation_report_pdf(
             simulation, ai_analysis
         )
 
@@ -849,8 +857,8 @@ async def admin_download_simulation_pdf(
             detail="Simulation not found",
         )
 
-    pdf_bytes = pdf_generator_service.generate_simulation_report_pdf(
-        simulation, simulation.demographics_data or {}
+    pdf_bytes = await pdf_generator_service.render_simulation_report_pdf(
+        simulation, simulation.demographics_data or {}, variant="demographics"
     )
 
     filename = f"메디플라톤_상권분석_{simulation.clinic_type}_{datetime.now().strftime('%Y%m%d')}.pdf"
@@ -905,9 +913,9 @@ async def download_report_pdf(
             detail="Simulation not found"
         )
 
-    # PDF 재생성 (항상 최신 버전)
+    # PDF — 리포트 내용(HTML 해시)이 바뀐 경우에만 재렌더링, 그 외에는 캐시
     ai_analysis = report.report_content or {}
-    pdf_bytes = pdf_generator_service.generate_simulation_report_pdf(
+    pdf_bytes = await pdf_generator_service.render_simulation_report_pdf(
         simulation, ai_analysis
     )
 
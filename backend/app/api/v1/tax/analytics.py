@@ -21,7 +21,7 @@ from ....models.user import User
 from ....models.service_subscription import ServiceSubscription, ServiceType
 from ....models.tax_correction import TaxCorrection, TaxDeduction, TaxCorrectionStatus, DeductionCategory
 from ....models.tax_regulation import TaxPeerBenchmark
-from ....models.tax_scan import TaxScanResult
+from ....models.tax_scan import TaxScanResult, SCHEDULED_SCAN_TYPE
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -459,10 +459,15 @@ async def get_savings_potential(
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
     """절감 잠재액 계산"""
-    # 최근 스캔 결과 조회
+    # 최근 스캔 결과 조회 (월간 자동 스캔 제외)
     scan_result = await db.execute(
         select(TaxScanResult)
-        .where(TaxScanResult.user_id == current_user.id)
+        .where(
+            and_(
+                TaxScanResult.user_id == current_user.id,
+                TaxScanResult.scan_type != SCHEDULED_SCAN_TYPE,
+            )
+        )
         .order_by(TaxScanResult.created_at.desc())
         .limit(1)
     )
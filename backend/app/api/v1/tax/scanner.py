@@ -19,7 +19,7 @@ from ..service_guards import require_active_service
 from ....models.user import User
 from ....models.service_subscription import ServiceSubscription, ServiceType
 from ....models.tax_correction import TaxCorrection, TaxDeduction, DeductionCategory
-from ....models.tax_scan import TaxScanResult, TaxScanStatus, FindingSeverity
+from ....models.tax_scan import TaxScanResult, TaxScanStatus, FindingSeverity, SCHEDULED_SCAN_TYPE
 from ....models.tax_filing import TaxFilingHistory
 
 logger = logging.getLogger(__name__)
@@ -347,10 +347,15 @@ async def get_latest_scan(
     current_user: User = Depends(get_current_active_user),
     sub: ServiceSubscription = Depends(require_active_service(ServiceType.EMR)),
 ):
-    """최근 스캔 결과 조회"""
+    """최근 스캔 결과 조회 (월간 자동 스캔 제외)"""
     result = await db.execute(
         select(TaxScanResult)
-        .where(TaxScanResult.user_id == current_user.id)
+        .where(
+            and_(
+                TaxScanResult.user_id == current_user.id,
+                TaxScanResult.scan_type != SCHEDULED_SCAN_TYPE,
+            )
+        )
         .order_by(TaxScanResult.created_at.desc())
         .limit(1)
     )
@@ -0,0 +1,371 @@
+"""
+채팅 WebSocket 연결 관리 (다중 노드)
+
+- 연결마다 제한 크기 송신 큐 + 송신 태스크 → 룸 전송은 큐에 넣기만 하므로 느린 클라이언트가 룸 전체를 막지 않음
+  (큐가 가득 찬 연결은 1013으로 닫아 재접속 유도)
+- 룸/유저 메시지는 로컬 연결에 바로 전달하고 Redis pub/sub(chat:room:{id}, chat:user:{id})로 다른 노드에 전파
+  · 각 노드는 로컬 연결이 있는 룸/유저 채널만 구독, 자기 노드가 보낸 메시지는 무시
+- 접속자(presence): 룸별 sorted set (member "user_id|node_id", score 만료 시각), 주기적으로 갱신
+  → 노드가 죽어도 PRESENCE_TTL 뒤 자동 정리
+- 제어 채널(chat:control): 모든 노드가 항상 구독. on_control로 등록한 핸들러에 전달 (채팅방 권한 캐시 무효화 등)
+- Redis 장애 시 로컬 연결만으로 동작 (단일 노드 동작과 동일)
+
+Usage:
+    conn = await chat_hub.connect(websocket, room_id, user_id)
+    await chat_hub.send_to_room(room_id, {...}, exclude_user=user_id)
+    online = await chat_hub.get_room_users(room_id)
+    await chat_hub.disconnect(conn, room_id)
+"""
+import asyncio
+import json
+import time
+from typing import Callable, Dict, List, Optional, Set
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+from fastapi import WebSocket
+
+from .config import settings
+from .logging import get_logger
+from .redis import UNAVAILABLE_BACKOFF_SECONDS, get_redis, mark_unavailable
+
+logger = get_logger("mediplaton.chat_hub")
+
+# 연결별 송신 큐 크기 (초과 시 느린 클라이언트로 보고 연결 종료)
+SEND_QUEUE_SIZE = 256
+# 메시지 1건 송신 제한 시간 (초)
+SEND_TIMEOUT = 10.0
+# 접속자 항목 수명 / 갱신 주기 (초)
+PRESENCE_TTL = 60.0
+PRESENCE_REFRESH_INTERVAL = 20.0
+
+ROOM_CHANNEL = "chat:room:{}"
+USER_CHANNEL = "chat:user:{}"
+PRESENCE_KEY = "chat:presence:{}"
+CONTROL_CHANNEL = "chat:control"
+
+
+class Connection:
+    """WebSocket 1개 + 송신 큐"""
+
+    def __init__(self, websocket: WebSocket, user_id: str):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.closed = False
+        self._sender = asyncio.create_task(self._pump())
+
+    async def _pump(self):
+        try:
+            while True:
+                payload = await self.queue.get()
+                await asyncio.wait_for(self.websocket.send_text(payload), timeout=SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"Chat send to user {self.user_id} stopped: {e}")
+            self.closed = True
+
+    def send_payload(self, payload: str):
+        """직렬화된 메시지를 큐에 넣음 (대기 없음)"""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning(f"Chat send queue full for user {self.user_id}, closing slow connection")
+            self.closed = True
+            self._sender.cancel()
+            asyncio.create_task(self._close(1013, "Send queue overflow"))
+
+    def send(self, message: dict):
+        self.send_payload(json.dumps(message, ensure_ascii=False))
+
+    async def _close(self, code: int, reason: str):
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+
+    def stop(self):
+        self.closed = True
+        self._sender.cancel()
+
+
+class ConnectionManager:
+    """룸/유저별 로컬 연결 + Redis pub/sub 전파 + Redis 접속자 관리"""
+
+    def __init__(self):
+        self.node_id = uuid4().hex
+        # room_id -> user_id -> 연결들 (여러 탭/기기)
+        self.rooms: Dict[int, Dict[str, Set[Connection]]] = {}
+        # user_id -> 연결들 (채팅 + 알림)
+        self.user_connections: Dict[str, Set[Connection]] = {}
+        self._pubsub_client: Optional[aioredis.Redis] = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._presence_task: Optional[asyncio.Task] = None
+        self._control_handlers: Dict[str, Callable[[dict], None]] = {}
+
+    # ---- 연결 관리 ----
+
+    async def connect(self, websocket: WebSocket, room_id: int, user_id: str) -> Connection:
+        """채팅 WebSocket 연결 (accept + 룸 등록 + 접속자 기록)"""
+        await websocket.accept()
+        conn = Connection(websocket, user_id)
+        new_room = room_id not in self.rooms
+        self.rooms.setdefault(room_id, {}).setdefault(user_id, set()).add(conn)
+        await self._add_user_connection(conn)
+        if new_room:
+            await self._subscribe(ROOM_CHANNEL.format(room_id))
+        await self._presence_add(room_id, [user_id])
+        logger.info(f"User {user_id} connected to room {room_id}")
+        return conn
+
+    async def disconnect(self, conn: Connection, room_id: int):
+        """채팅 WebSocket 연결 해제"""
+        conn.stop()
+        users = self.rooms.get(room_id, {})
+        user_conns = users.get(conn.user_id)
+        if user_conns is not None:
+            user_conns.discard(conn)
+            if not user_conns:
+                del users[conn.user_id]
+                await self._presence_remove(room_id, conn.user_id)
+        if room_id in self.rooms and not users:
+            del self.rooms[room_id]
+            await self._unsubscribe(ROOM_CHANNEL.format(room_id))
+        await self._remove_user_connection(conn)
+        logger.info(f"User {conn.user_id} disconnected from room {room_id}")
+
+    async def connect_user(self, websocket: WebSocket, user_id: str) -> Connection:
+        """알림 WebSocket 연결 (유저 채널만)"""
+        await websocket.accept()
+        conn = Connection(websocket, user_id)
+        await self._add_user_connection(conn)
+        return conn
+
+    async def disconnect_user(self, conn: Connection):
+        conn.stop()
+        await self._remove_user_connection(conn)
+
+    async def _add_user_connection(self, conn: Connection):
+        new_user = conn.user_id not in self.user_connections
+        self.user_connections.setdefault(conn.user_id, set()).add(conn)
+        if new_user:
+            await self._subscribe(USER_CHANNEL.format(conn.user_id))
+
+    async def _remove_user_connection(self, conn: Connection):
+        conns = self.user_connections.get(conn.user_id)
+        if conns is None:
+            return
+        conns.discard(conn)
+        if not conns:
+            del self.user_connections[conn.user_id]
+            await self._unsubscribe(USER_CHANNEL.format(conn.user_id))
+
+    # ---- 전송 ----
+
+    def _deliver_room(self, room_id: int, payload: str, exclude_user: Optional[str]):
+        for user_id, conns in self.rooms.get(room_id, {}).items():
+            if exclude_user and user_id == exclude_user:
+                continue
+            for conn in conns:
+                conn.send_payload(payload)
+
+    def _deliver_user(self, user_id: str, payload: str):
+        for conn in self.user_connections.get(user_id, ()):
+            conn.send_payload(payload)
+
+    async def _publish(self, channel: str, payload: str, exclude_user: Optional[str] = None):
+        redis = get_redis()
+        if redis is None:
+            return
+        envelope = json.dumps({"origin": self.node_id, "exclude_user": exclude_user, "payload": payload})
+        try:
+            await redis.publish(channel, envelope)
+        except Exception as e:
+            mark_unavailable(e)
+
+    async def send_to_room(self, room_id: int, message: dict, exclude_user: Optional[str] = None):
+        """룸의 모든 연결(모든 노드)에 메시지 전송"""
+        payload = json.dumps(message, ensure_ascii=False)
+        self._deliver_room(room_id, payload, exclude_user)
+        await self._publish(ROOM_CHANNEL.format(room_id), payload, exclude_user)
+
+    async def send_to_user(self, user_id: str, message: dict):
+        """유저의 모든 연결(모든 노드)에 메시지 전송"""
+        payload = json.dumps(message, ensure_ascii=False)
+        self._deliver_user(user_id, payload)
+        await self._publish(USER_CHANNEL.format(user_id), payload)
+
+    # ---- 제어 메시지 ----
+
+    def on_control(self, kind: str, handler: Callable[[dict], None]):
+        """다른 노드가 broadcast_control로 보낸 제어 메시지 핸들러 등록"""
+        self._control_handlers[kind] = handler
+
+    async def broadcast_control(self, kind: str, data: dict):
+        """다른 모든 노드에 제어 메시지 전송 (이 노드는 호출자가 직접 처리)"""
+        await self._publish(CONTROL_CHANNEL, json.dumps({"kind": kind, "data": data}))
+
+    def ensure_listening(self):
+        """제어 채널 구독 시작 (연결이 아직 없는 노드에서도 제어 메시지를 받도록)"""
+        self._ensure_background()
+
+    # ---- 접속자 ----
+
+    def _local_room_users(self, room_id: int) -> List[str]:
+        return list(self.rooms.get(room_id, {}).keys())
+
+    async def get_room_users(self, room_id: int) -> List[str]:
+        """룸 접속자 (전체 노드). Redis 장애 시 이 노드 접속자만"""
+        redis = get_redis()
+        if redis is None:
+            return self._local_room_users(room_id)
+        try:
+            members = await redis.zrangebyscore(PRESENCE_KEY.format(room_id), time.time(), "+inf")
+        except Exception as e:
+            mark_unavailable(e)
+            return self._local_room_users(room_id)
+        users = {m.decode().split("|", 1)[0] for m in members}
+        users.update(self._local_room_users(room_id))
+        return sorted(users)
+
+    async def _presence_add(self, room_id: int, user_ids: List[str]):
+        self._ensure_background()
+        redis = get_redis()
+        if redis is None or not user_ids:
+            return
+        key = PRESENCE_KEY.format(room_id)
+        now = time.time()
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, {f"{uid}|{self.node_id}": now + PRESENCE_TTL for uid in user_ids})
+                pipe.zremrangebyscore(key, "-inf", now)
+                pipe.expire(key, int(PRESENCE_TTL * 2))
+                await pipe.execute()
+        except Exception as e:
+            mark_unavailable(e)
+
+    async def _presence_remove(self, room_id: int, user_id: str):
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.zrem(PRESENCE_KEY.format(room_id), f"{user_id}|{self.node_id}")
+        except Exception as e:
+            mark_unavailable(e)
+
+    async def _refresh_presence(self):
+        while True:
+            await asyncio.sleep(PRESENCE_REFRESH_INTERVAL)
+            for room_id in list(self.rooms):
+                await self._presence_add(room_id, self._local_room_users(room_id))
+
+    # ---- Redis 구독 ----
+
+    def _ensure_background(self):
+        if self._presence_task is None or self._presence_task.done():
+            self._presence_task = asyncio.create_task(self._refresh_presence())
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    def _channels(self) -> List[str]:
+        return [ROOM_CHANNEL.format(r) for r in self.rooms] + [USER_CHANNEL.format(u) for u in self.user_connections]
+
+    async def _subscribe(self, channel: str):
+        self._ensure_background()
+        if self._pubsub is None:
+            return  # 리스너가 (재)연결하면서 현재 채널 전체를 구독
+        try:
+            await self._pubsub.subscribe(channel)
+        except Exception as e:
+            logger.warning(f"Chat pub/sub subscribe failed ({channel}): {e}")
+
+    async def _unsubscribe(self, channel: str):
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(channel)
+        except Exception as e:
+            logger.warning(f"Chat pub/sub unsubscribe failed ({channel}): {e}")
+
+    async def _open_pubsub(self):
+        # 구독 연결은 응답 대기가 길어 공유 클라이언트(socket_timeout=1s)와 분리
+        if self._pubsub_client is None:
+            self._pubsub_client = aioredis.from_url(
+                settings.REDIS_URL,
+                socket_connect_timeout=1.0,
+                health_check_interval=30,
+            )
+        pubsub = self._pubsub_client.pubsub(ignore_subscribe_messages=True)
+        # 노드/제어 채널은 항상 구독 (구독 채널이 0개면 get_message 불가)
+        channels = self._channels()
+        await pubsub.subscribe(f"chat:node:{self.node_id}", CONTROL_CHANNEL, *channels)
+        self._pubsub = pubsub
+        # 구독하는 동안 새로 생긴 룸/유저
+        missing = set(self._channels()) - set(channels)
+        if missing:
+            await pubsub.subscribe(*missing)
+
+    def _dispatch(self, channel: str, data: bytes):
+        envelope = json.loads(data)
+        if envelope.get("origin") == self.node_id:
+            return
+        if channel == CONTROL_CHANNEL:
+            control = json.loads(envelope["payload"])
+            handler = self._control_handlers.get(control.get("kind"))
+            if handler is not None:
+                handler(control.get("data") or {})
+            return
+        kind, _, target = channel.rpartition(":")
+        if kind == "chat:room":
+            self._deliver_room(int(target), envelope["payload"], envelope.get("exclude_user"))
+        elif kind == "chat:user":
+            self._deliver_user(target, envelope["payload"])
+
+    async def _listen(self):
+        if not settings.REDIS_URL:
+            return
+        while True:
+            try:
+                await self._open_pubsub()
+                while True:
+                    message = await self._pubsub.get_message(timeout=1.0)
+                    if message is None or message.get("type") != "message":
+                        continue
+                    channel = message["channel"]
+                    channel = channel.decode() if isinstance(channel, bytes) else channel
+                    try:
+                        self._dispatch(channel, message["data"])
+                    except Exception as e:
+                        logger.error(f"Chat pub/sub message dropped ({channel}): {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Chat pub/sub connection lost, retrying in {UNAVAILABLE_BACKOFF_SECONDS:.0f}s: {e}")
+                await self._close_pubsub()
+                await asyncio.sleep(UNAVAILABLE_BACKOFF_SECONDS)
+
+    async def _close_pubsub(self):
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    async def close(self):
+        """FastAPI lifespan 종료 시 — 백그라운드 태스크/구독 연결 정리"""
+        for task in (self._listener, self._presence_task):
+            if task is not None:
+                task.cancel()
+        await self._close_pubsub()
+        if self._pubsub_client is not None:
+            await self._pubsub_client.aclose()
+            self._pubsub_client = None
+
+
+# 전역 인스턴스
+chat_hub = ConnectionManager()
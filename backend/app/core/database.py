@@ -1,8 +1,9 @@
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
+from uuid import uuid4
 import asyncio
 import logging
 import os
@@ -11,18 +12,71 @@ from .config import settings
 
 logger = logging.getLogger("mediplaton.database")
 
-# Create async engine (Fly.io internal connections don't need SSL)
-connect_args = {}
-if os.getenv("FLY_APP_NAME"):
-    # Fly.io internal connections - disable SSL completely
-    connect_args["ssl"] = False
-
-engine = create_async_engine(
-    settings.async_database_url,
-    echo=settings.DATABASE_ECHO,
-    poolclass=NullPool,
-    connect_args=connect_args,
-)
+POOL_MODES = ("pooled", "pgbouncer", "null")
+
+# 풀 이벤트 카운터 (물리 연결 수, 체크아웃 수, pre-ping 실패 등)
+_pool_counters: Dict[str, int] = {"connects": 0, "checkouts": 0, "invalidated": 0, "peak_checked_out": 0}
+
+
+def _build_engine(mode: str) -> AsyncEngine:
+    """풀 모드별 async 엔진 생성"""
+    if mode not in POOL_MODES:
+        raise ValueError(f"Unknown DB_POOL_MODE: {mode} (expected one of {POOL_MODES})")
+
+    connect_args: Dict[str, Any] = {}
+    if os.getenv("FLY_APP_NAME"):
+        # Fly.io internal connections - disable SSL completely
+        connect_args["ssl"] = False
+
+    if mode == "pooled":
+        connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+        pool_kwargs: Dict[str, Any] = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+    else:
+        pool_kwargs = {"poolclass": NullPool}
+        if mode == "pgbouncer":
+            # transaction 모드는 트랜잭션마다 서버 커넥션이 바뀌므로 prepared statement 재사용 불가.
+            # 이름 충돌을 피하려고 매번 고유 이름 사용 (PgBouncer는 server_reset_query = DISCARD ALL)
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+    new_engine = create_async_engine(
+        settings.async_database_url,
+        echo=settings.DATABASE_ECHO,
+        connect_args=connect_args,
+        **pool_kwargs,
+    )
+    _attach_pool_metrics(new_engine)
+    return new_engine
+
+
+def _attach_pool_metrics(target: AsyncEngine):
+    pool = target.sync_engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_conn, record):
+        _pool_counters["connects"] += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):
+        _pool_counters["checkouts"] += 1
+        checked_out = getattr(pool, "checkedout", None)
+        if checked_out is not None:
+            _pool_counters["peak_checked_out"] = max(_pool_counters["peak_checked_out"], checked_out())
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_conn, record, exception):
+        _pool_counters["invalidated"] += 1
+
+
+pool_mode = settings.DB_POOL_MODE
+engine = _build_engine(pool_mode)
 
 # Create async session factory
 async_session = async_sessionmaker(
@@ -37,6 +91,39 @@ async_session = async_sessionmaker(
 Base = declarative_base()
 
 
+def use_null_pool():
+    """
+    엔진을 NullPool로 교체 (Celery 워커 프로세스 시작 시)
+
+    Celery 태스크는 태스크마다 새 이벤트 루프를 만들기 때문에 asyncpg 커넥션을 루프 간에 재사용할 수 없다.
+    async_session은 같은 객체를 유지하고 bind만 바꾸므로 기존 import 경로는 그대로 동작한다.
+    """
+    global engine, pool_mode
+    if pool_mode == "null":
+        return
+    engine = _build_engine("null")
+    pool_mode = "null"
+    async_session.configure(bind=engine)
+
+
+def get_db_pool_stats() -> Dict[str, Any]:
+    """DB 풀 메트릭 (체크아웃 중 커넥션 수, 포화도, 누적 이벤트)"""
+    pool = engine.sync_engine.pool
+    stats: Dict[str, Any] = {"mode": pool_mode, **_pool_counters}
+    if pool_mode == "pooled":
+        capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+        checked_out = pool.checkedout()
+        stats.update({
+            "size": pool.size(),
+            "checked_out": checked_out,
+            "idle": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "capacity": capacity,
+            "saturation": round(checked_out / capacity, 3) if capacity else None,
+        })
+    return stats
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session."""
     async with async_session() as session:
@@ -80,3 +167,8 @@ async def init_db():
             else:
                 raise
     raise RuntimeError(f"Database init failed after 10 retries: {last_err}")
+
+
+async def close_db():
+    """풀 커넥션 정리 (FastAPI lifespan 종료 시)"""
+    await engine.dispose()
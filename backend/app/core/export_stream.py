@@ -0,0 +1,74 @@
+"""
+대용량 내보내기 스트리밍 (CSV / XLSX)
+- 입력: 행 배치 비동기 이터레이터 (DB 서버사이드 커서의 partitions 등)
+- CSV: 배치마다 바로 인코딩해 내보냄 → 첫 배치 직후 첫 바이트 도착, 메모리는 배치 1개분
+- XLSX: openpyxl write-only 모드 (행을 임시 파일로 흘려 씀, 셀 객체를 메모리에 두지 않음).
+  zip 컨테이너라 저장이 끝난 뒤 임시 파일을 청크 단위로 전송
+
+Usage:
+    return StreamingResponse(csv_stream(header, batches), media_type="text/csv")
+"""
+import asyncio
+import csv
+import io
+import tempfile
+from typing import Any, AsyncIterator, List, Sequence
+
+# XLSX 임시 파일 전송 청크 크기
+XLSX_CHUNK_BYTES = 64 * 1024
+
+Row = Sequence[Any]
+
+
+async def csv_stream(
+    header: Row,
+    batches: AsyncIterator[List[Row]],
+    encoding: str = "utf-8-sig",
+) -> AsyncIterator[bytes]:
+    """행 배치 → CSV 바이트 청크 (배치당 1청크). utf-8-sig면 BOM은 첫 청크에만"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    writer.writerow(header)
+    yield drain().encode(encoding)
+
+    # BOM 이후 청크는 BOM 없이 인코딩
+    body_encoding = "utf-8" if encoding.lower() == "utf-8-sig" else encoding
+    async for batch in batches:
+        writer.writerows(batch)
+        yield drain().encode(body_encoding)
+
+
+def _append_rows(ws, batch: List[Row]):
+    for row in batch:
+        ws.append(row)
+
+
+async def xlsx_stream(
+    header: Row,
+    batches: AsyncIterator[List[Row]],
+    sheet_title: str = "Sheet1",
+) -> AsyncIterator[bytes]:
+    """행 배치 → XLSX 바이트 청크. 행 추가·저장은 스레드에서 실행 (이벤트 루프 블로킹 방지)"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_title)
+    ws.append(list(header))
+    async for batch in batches:
+        await asyncio.to_thread(_append_rows, ws, batch)
+
+    with tempfile.TemporaryFile() as output:
+        await asyncio.to_thread(wb.save, output)
+        output.seek(0)
+        while True:
+            chunk = await asyncio.to_thread(output.read, XLSX_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
@@ -0,0 +1,100 @@
+"""
+외부 데이터 소스 동시 수집 (fan-out)
+- 소스별 데드라인 (asyncio.wait_for)
+- 부분 결과: 실패/타임아웃 소스는 기본값으로 대체하고 나머지는 그대로 사용
+- 소스별 소요 시간 기록 (어떤 업스트림이 느린지 추적)
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .logging import get_logger
+
+logger = get_logger("mediplaton.fanout")
+
+
+@dataclass
+class Source:
+    """수집 대상 소스 1개"""
+    name: str
+    factory: Callable[[], Awaitable[Any]]
+    timeout: float = 10.0
+    # 실패/타임아웃 시 사용할 값. callable이면 호출 결과 사용 (mutable 기본값 공유 방지)
+    default: Any = None
+
+    def fallback(self) -> Any:
+        return self.default() if callable(self.default) else self.default
+
+
+@dataclass
+class GatherResult:
+    """fan-out 결과 묶음"""
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    total_ms: int = 0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.results.get(name, default)
+
+    @property
+    def failed(self) -> List[str]:
+        return [n for n, t in self.timings.items() if t["status"] != "ok"]
+
+    def summary(self) -> Dict[str, Any]:
+        """응답/로그용 요약 (느린 순 정렬)"""
+        return {
+            "total_ms": self.total_ms,
+            "sources": dict(
+                sorted(self.timings.items(), key=lambda kv: kv[1]["ms"], reverse=True)
+            ),
+        }
+
+
+async def _run_source(source: Source) -> tuple[str, Any, Dict[str, Any]]:
+    started = time.perf_counter()
+    try:
+        value = await asyncio.wait_for(source.factory(), timeout=source.timeout)
+        status = "ok"
+    except asyncio.TimeoutError:
+        logger.warning(f"fan-out source '{source.name}' timed out after {source.timeout}s")
+        value = source.fallback()
+        status = "timeout"
+    except Exception as e:
+        logger.warning(f"fan-out source '{source.name}' failed: {e}")
+        value = source.fallback()
+        status = "error"
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    return source.name, value, {"ms": elapsed_ms, "status": status}
+
+
+async def gather_sources(sources: List[Source], label: str = "fanout") -> GatherResult:
+    """
+    여러 소스를 동시에 실행하고 부분 결과를 반환
+
+    Usage:
+        result = await gather_sources([
+            Source("demographics", lambda: api.get_demographics(lat, lng), timeout=15),
+            Source("commercial", lambda: api.get_commercial_data(lat, lng), default=dict),
+        ])
+        result["demographics"], result.summary()
+    """
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(_run_source(s) for s in sources))
+
+    gathered = GatherResult()
+    for name, value, timing in outcomes:
+        gathered.results[name] = value
+        gathered.timings[name] = timing
+    gathered.total_ms = int((time.perf_counter() - started) * 1000)
+
+    slowest: Optional[str] = max(gathered.timings, key=lambda n: gathered.timings[n]["ms"], default=None)
+    logger.info(
+        f"{label}: {len(sources)} sources in {gathered.total_ms}ms "
+        f"(slowest={slowest}, failed={gathered.failed or '-'})",
+        extra={"extra": {"fanout": label, **gathered.summary()}},
+    )
+    return gathered
@@ -0,0 +1,124 @@
+"""
+좌표 거리 계산 (NumPy 벡터화)
+- 기준점 1개 → 좌표 배열 전체 haversine 거리를 한 번에 계산
+- 반경 필터 / k-최근접 선택 (거리순 인덱스 반환)
+- dict 목록 헬퍼: 서비스·API 코드의 `for h in hospitals: haversine(...)` 루프 대체
+
+좌표가 0/None인 항목은 NaN으로 취급해 반경 필터에서 자동 제외된다.
+
+Usage:
+    nearby = annotate_distances(lat, lng, hospitals, radius_m=1000)  # distance 키 추가 + 거리순
+    idx, dist = within_radius(lat, lng, lats, lngs, 500)
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+# 위도 1° 거리(m) — 반경 → bbox 환산용
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 간 거리(m) — 단건 계산용 (배열이면 distances_m 사용)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = math.radians(lat2 - lat1)
+    dlam = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def distances_m(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """기준점 → 각 좌표 거리(m) 배열"""
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlam = np.radians(lngs - lng)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlam / 2) ** 2
+    # 부동소수 오차로 a가 1을 살짝 넘으면 sqrt(1-a)가 NaN이 되므로 clip
+    return EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def within_radius(
+    lat: float,
+    lng: float,
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    radius_m: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """반경 내 좌표 (인덱스, 거리) — 거리순"""
+    dist = distances_m(lat, lng, lats, lngs)
+    idx = np.flatnonzero(dist <= radius_m)
+    order = np.argsort(dist[idx], kind="stable")
+    idx = idx[order]
+    return idx, dist[idx]
+
+
+def k_nearest(
+    lat: float,
+    lng: float,
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    k: int,
+    radius_m: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """가장 가까운 k개 (인덱스, 거리) — 거리순. 전체 정렬 대신 argpartition 사용"""
+    dist = distances_m(lat, lng, lats, lngs)
+    valid = ~np.isnan(dist)
+    if radius_m is not None:
+        valid &= dist <= radius_m
+    idx = np.flatnonzero(valid)
+    if k < len(idx):
+        idx = idx[np.argpartition(dist[idx], k)[:k]]
+    idx = idx[np.argsort(dist[idx], kind="stable")]
+    return idx, dist[idx]
+
+
+def coords_array(
+    items: Sequence[Dict[str, Any]],
+    lat_key: str = "latitude",
+    lng_key: str = "longitude",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """dict 목록 → (위도 배열, 경도 배열). 0/None/파싱 불가 좌표는 NaN"""
+    def _coord(value: Any) -> float:
+        try:
+            return float(value) or math.nan
+        except (TypeError, ValueError):
+            return math.nan
+
+    n = len(items)
+    lats = np.fromiter((_coord(it.get(lat_key)) for it in items), dtype=np.float64, count=n)
+    lngs = np.fromiter((_coord(it.get(lng_key)) for it in items), dtype=np.float64, count=n)
+    return lats, lngs
+
+
+def annotate_distances(
+    lat: float,
+    lng: float,
+    items: Sequence[Dict[str, Any]],
+    radius_m: Optional[float] = None,
+    field: str = "distance",
+    lat_key: str = "latitude",
+    lng_key: str = "longitude",
+) -> List[Dict[str, Any]]:
+    """
+    각 항목에 거리(m, 정수)를 기록하고 거리순 목록 반환
+
+    좌표 없는 항목은 항상 제외, radius_m 지정 시 반경 밖 항목도 제외.
+    """
+    if not items:
+        return []
+    lats, lngs = coords_array(items, lat_key, lng_key)
+    if radius_m is None:
+        radius_m = math.inf
+    idx, dist = within_radius(lat, lng, lats, lngs, radius_m)
+
+    result = []
+    for i, d in zip(idx.tolist(), np.rint(dist).astype(np.int64).tolist()):
+        item = items[i]
+        item[field] = d
+        result.append(item)
+    return result
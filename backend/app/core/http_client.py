@@ -0,0 +1,164 @@
+"""
+공유 HTTP 클라이언트 레지스트리
+- 업스트림 호스트별 커넥션 풀 (keep-alive 재사용, 호스트별 커넥션 상한)
+- HTTP/2: h2 설치 + 호스트가 ALPN으로 지원할 때만 사용 (아니면 HTTP/1.1)
+- 이벤트 루프별로 클라이언트를 분리 (Celery 태스크는 태스크마다 새 루프를 만들고,
+  루프를 닫기 전에 close_task_loop가 close_http_clients()로 그 루프의 풀을 닫음)
+- 풀 메트릭 (요청 수, 커넥션 수/유휴/사용 중)
+
+Usage:
+    async with pooled_client("kakao") as client:
+        resp = await client.get(url, params=params, timeout=8.0)
+"""
+import asyncio
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from .logging import get_logger
+
+logger = get_logger("mediplaton.http_client")
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# 풀별 설정: (max_connections, max_keepalive_connections, http2)
+POOL_CONFIG: Dict[str, tuple[int, int, bool]] = {
+    "data_go_kr": (50, 20, False),  # apis.data.go.kr — HIRA/MOIS/소진공/건축HUB 게이트웨이
+    "localdata": (10, 5, False),    # www.localdata.go.kr
+    "kakao": (20, 10, True),        # dapi.kakao.com
+    "vworld": (10, 5, True),        # api.vworld.kr
+    "naver": (10, 5, True),         # openapi.naver.com
+    "solapi": (10, 5, True),        # api.solapi.com
+    "toss": (20, 10, True),         # api.tosspayments.com
+    "default": (20, 10, False),
+}
+
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# loop -> {pool name -> client}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_request_counts: Dict[str, int] = defaultdict(int)
+_error_counts: Dict[str, int] = defaultdict(int)
+
+
+def _build_client(name: str) -> httpx.AsyncClient:
+    max_conn, max_keepalive, http2 = POOL_CONFIG.get(name, POOL_CONFIG["default"])
+
+    async def _on_request(request: httpx.Request):
+        _request_counts[name] += 1
+
+    async def _on_response(response: httpx.Response):
+        if response.status_code >= 500:
+            _error_counts[name] += 1
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_conn,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        http2=http2 and HTTP2_AVAILABLE,
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+def get_http_client(name: str = "default") -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공유 클라이언트 반환 (없으면 생성)"""
+    loop = asyncio.get_running_loop()
+    pools = _clients.get(loop)
+    if pools is None:
+        # 안전망: close_http_clients() 없이 닫힌 루프의 항목은 레지스트리에서만 제거
+        # (커넥션이 루프를 참조해 GC되지 않음). 소켓은 GC 때까지 남으므로 누락된 정리 경로로 기록
+        for stale in [l for l in list(_clients.keys()) if l.is_closed()]:
+            leaked = _clients.pop(stale, None) or {}
+            if leaked:
+                logger.warning(f"HTTP client pools {list(leaked)} left open on a closed event loop")
+        pools = {}
+        _clients[loop] = pools
+
+    client = pools.get(name)
+    if client is None or client.is_closed:
+        client = _build_client(name)
+        pools[name] = client
+    return client
+
+
+@asynccontextmanager
+async def pooled_client(name: str = "default") -> AsyncIterator[httpx.AsyncClient]:
+    """
+    `async with httpx.AsyncClient() as client:` 대체용
+
+    블록을 빠져나가도 클라이언트를 닫지 않고 커넥션을 풀에 반납한다.
+    """
+    yield get_http_client(name)
+
+
+async def init_http_clients():
+    """앱 시작 시 현재 루프에 모든 풀 생성 (FastAPI lifespan)"""
+    for name in POOL_CONFIG:
+        get_http_client(name)
+    logger.info(f"HTTP client pools initialized: {list(POOL_CONFIG)} (http2={HTTP2_AVAILABLE})")
+
+
+async def close_http_clients():
+    """현재 루프의 모든 풀 종료 (FastAPI lifespan 종료 / Celery 태스크 루프 종료 전)"""
+    loop = asyncio.get_running_loop()
+    pools = _clients.pop(loop, None) or {}
+    for client in pools.values():
+        await client.aclose()
+
+
+def reset_http_clients():
+    """fork 이후 부모 프로세스의 소켓을 물려받지 않도록 레지스트리 초기화 (Celery worker_process_init)"""
+    _clients.clear()
+    _request_counts.clear()
+    _error_counts.clear()
+
+
+def _pool_connection_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    # httpx는 풀 상태를 공개 API로 노출하지 않음 — httpcore 풀을 직접 조회
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return {}
+    idle = sum(1 for c in connections if c.is_idle())
+    return {
+        "connections": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+    }
+
+
+def get_pool_stats(loop: Optional[asyncio.AbstractEventLoop] = None) -> Dict[str, Any]:
+    """풀별 메트릭 (요청 수, 5xx 수, 커넥션 상태)"""
+    try:
+        loop = loop or asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    pools = _clients.get(loop, {}) if loop else {}
+
+    stats: Dict[str, Any] = {}
+    for name in sorted(set(POOL_CONFIG) | set(_request_counts)):
+        max_conn, max_keepalive, http2 = POOL_CONFIG.get(name, POOL_CONFIG["default"])
+        entry: Dict[str, Any] = {
+            "requests": _request_counts.get(name, 0),
+            "server_errors": _error_counts.get(name, 0),
+            "max_connections": max_conn,
+            "max_keepalive": max_keepalive,
+            "http2": http2 and HTTP2_AVAILABLE,
+        }
+        client = pools.get(name)
+        if client is not None and not client.is_closed:
+            entry.update(_pool_connection_stats(client))
+        stats[name] = entry
+    return stats
@@ -0,0 +1,86 @@
+"""
+PDF 렌더링 워커 풀
+- WeasyPrint write_pdf는 CPU 바운드 동기 호출(수 초)이라 이벤트 루프에서 직접 부르면 전체 API가 멈춤
+- 별도 프로세스 풀에서 렌더링 (GIL 회피, 렌더러 크래시가 API 프로세스로 번지지 않음)
+- 이 모듈은 워커 프로세스가 spawn으로 다시 import하므로 weasyprint 외 무거운 import 금지
+
+Usage:
+    pdf_bytes = await render_pdf_async(html, css)
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from .logging import get_logger
+
+logger = get_logger("mediplaton.pdf_render")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def render_pdf(html: str, css: str) -> bytes:
+    """HTML + CSS → PDF (동기). 워커 프로세스에서 실행"""
+    from weasyprint import CSS, HTML
+
+    # WeasyPrint 60.x 호환성 — write_pdf의 stylesheets 인자가 PDF 내부 호출
+    # 시 TypeError 발생하는 경우가 있음. 안전을 위해 CSS를 HTML <style> 태그에
+    # 인라인 임베드하고 write_pdf를 인자 없이 호출.
+    if "<style>" not in html:
+        html_with_style = html.replace("</head>", f"<style>{css}</style></head>", 1)
+        if html_with_style == html:
+            # </head> 없으면 <html> 다음에 삽입
+            html_with_style = f"<style>{css}</style>\n{html}"
+    else:
+        html_with_style = html
+
+    try:
+        return HTML(string=html_with_style, base_url=".").write_pdf()
+    except TypeError as e:
+        # 폴백: stylesheets 인자 시도 (구 API)
+        logger.warning(f"WeasyPrint write_pdf() failed: {e}, retrying with stylesheets arg")
+        return HTML(string=html, base_url=".").write_pdf(stylesheets=[CSS(string=css)])
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    from .config import settings
+
+    if settings.PDF_RENDER_WORKERS <= 0:
+        return None
+    if _pool is None:
+        # fork는 부모의 이벤트 루프·커넥션 풀·스레드 상태를 복제하므로 spawn 사용
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+async def render_pdf_async(html: str, css: str) -> bytes:
+    """
+    워커 풀에서 PDF 렌더링. PDF_RENDER_WORKERS=0이면 스레드에서 실행
+    (워커 프로세스가 죽으면 풀을 버리고 다음 호출에서 새로 생성)
+    """
+    global _pool
+    pool = _get_pool()
+    if pool is None:
+        return await asyncio.to_thread(render_pdf, html, css)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, render_pdf, html, css)
+    except BrokenProcessPool:
+        logger.error("PDF render pool broken, recreating on next call")
+        pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        raise
+
+
+def shutdown_render_pool():
+    """워커 풀 종료 (FastAPI lifespan 종료 시)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -4,9 +4,12 @@ API Rate Limiting 및 캐싱
 import time
 import hashlib
 import json
+import math
+import pickle
+import sys
 from typing import Optional, Callable, Any
 from functools import wraps
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import asyncio
 
 from fastapi import Request, HTTPException, status
@@ -15,36 +18,66 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from .config import settings
 from .logging import get_logger
+from .redis import get_redis, mark_unavailable
 
 logger = get_logger("mediplaton.rate_limit")
 
 
+# GCRA(Generic Cell Rate Algorithm) — "window_seconds 동안 max_requests회"를
+# 요청 간격 T = window/max, 버스트 max로 표현. 키당 TAT(다음 허용 이론 시각) 하나만 저장 → O(1)
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+if new_tat - now > window then
+  return {1, 0, tat + interval - window - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {0, math.floor((window - (new_tat - now)) / interval), new_tat - now}
+"""
+
+
+def _gcra(tat: float, now: float, max_requests: int, window_seconds: int) -> tuple[bool, int, float, float]:
+    """
+    GCRA 1회 판정 (로컬 폴백용, Lua 스크립트와 같은 계산)
+
+    Returns:
+        (is_limited, remaining, 새 TAT, 리셋까지 남은 초)
+    """
+    interval = window_seconds / max_requests
+    tat = max(tat, now)
+    new_tat = tat + interval
+    if new_tat - now > window_seconds:
+        # 다음 요청이 허용되는 시각까지
+        return True, 0, tat, tat + interval - window_seconds - now
+    remaining = int((window_seconds - (new_tat - now)) // interval)
+    return False, remaining, new_tat, new_tat - now
+
+
 class InMemoryRateLimiter:
     """
-    인메모리 Rate Limiter
-    프로덕션에서는 Redis 기반으로 변경 권장
+    인메모리 Rate Limiter (GCRA)
+    프로세스 단위라 멀티 워커/멀티 인스턴스에서는 한도가 워커 수만큼 늘어남 —
+    RedisRateLimiter의 Redis 장애 시 폴백으로 사용
     """
 
     def __init__(self):
-        self.requests = defaultdict(list)  # ip/user -> [timestamps]
+        self.tats: dict[str, float] = {}  # ip/user -> TAT
         self.cleanup_interval = 60  # 60초마다 정리
         self.last_cleanup = time.time()
 
     def _cleanup(self):
-        """오래된 요청 기록 정리"""
+        """TAT가 지난(버스트가 다 회복된) 키 정리"""
         now = time.time()
         if now - self.last_cleanup < self.cleanup_interval:
             return
 
-        keys_to_remove = []
-        for key, timestamps in self.requests.items():
-            # 1시간 이상 된 기록 제거
-            self.requests[key] = [t for t in timestamps if now - t < 3600]
-            if not self.requests[key]:
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self.requests[key]
+        for key in [k for k, tat in self.tats.items() if tat <= now]:
+            del self.tats[key]
 
         self.last_cleanup = now
 
@@ -63,84 +96,163 @@ class InMemoryRateLimiter:
         self._cleanup()
 
         now = time.time()
-        window_start = now - window_seconds
+        limited, remaining, new_tat, reset_after = _gcra(
+            self.tats.get(key, now), now, max_requests, window_seconds
+        )
+        if not limited:
+            self.tats[key] = new_tat
+        return limited, remaining, math.ceil(now + reset_after)
+
+
+class RedisRateLimiter:
+    """
+    Redis Rate Limiter (GCRA, Lua 스크립트 1회 왕복)
+    - 모든 워커/인스턴스가 같은 한도를 공유
+    - Redis 미설정/장애 시 InMemoryRateLimiter로 폴백 (get_redis() 백오프 동안)
+    """
 
-        # 윈도우 내 요청만 필터링
-        recent_requests = [t for t in self.requests[key] if t > window_start]
-        self.requests[key] = recent_requests
+    KEY_PREFIX = "rl"
+
+    def __init__(self, fallback: Optional[InMemoryRateLimiter] = None):
+        self.fallback = fallback or InMemoryRateLimiter()
+        self._script = None
+
+    async def is_rate_limited(
+        self,
+        key: str,
+        max_requests: int,
+        window_seconds: int
+    ) -> tuple[bool, int, int]:
+        """
+        Rate limit 체크
+
+        Returns:
+            (is_limited, remaining, reset_time)
+        """
+        redis = get_redis()
+        if redis is None:
+            return self.fallback.is_rate_limited(key, max_requests, window_seconds)
+
+        if self._script is None:
+            self._script = redis.register_script(_GCRA_LUA)
+        interval_ms = window_seconds * 1000 / max_requests
+        try:
+            limited, remaining, reset_after_ms = await self._script(
+                keys=[f"{self.KEY_PREFIX}:{key}"],
+                args=[interval_ms, window_seconds * 1000],
+                client=redis,
+            )
+        except Exception as e:
+            mark_unavailable(e)
+            return self.fallback.is_rate_limited(key, max_requests, window_seconds)
 
-        remaining = max(0, max_requests - len(recent_requests))
-        reset_time = int(window_start + window_seconds)
+        reset_time = math.ceil(time.time() + int(reset_after_ms) / 1000)
+        return bool(limited), int(remaining), reset_time
 
-        if len(recent_requests) >= max_requests:
-            return True, remaining, reset_time
 
-        # 새 요청 기록
-        self.requests[key].append(now)
-        return False, remaining - 1, reset_time
+def _estimate_size(value: Any) -> int:
+    """캐시 항목 크기 추정 (bytes) — pickle 가능하면 직렬화 크기, 아니면 얕은 크기"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
 
 
 class InMemoryCache:
     """
-    인메모리 캐시
-    프로덕션에서는 Redis 기반으로 변경 권장
+    인메모리 LRU 캐시 (프로세스 로컬)
+    - get/set/delete O(1): OrderedDict LRU + 항목별 만료 시각 (만료는 조회 시 지연 제거)
+    - 용량 상한은 항목 수가 아닌 추정 바이트 합계
+    - 태그 무효화: set(..., tags=[...]) 후 invalidate_tag(tag)
+    - hit/miss/eviction/expired 카운터
     """
 
-    def __init__(self, max_size: int = 1000):
-        self.cache: dict[str, tuple[Any, float]] = {}  # key -> (value, expire_time)
-        self.max_size = max_size
-
-    def _cleanup(self):
-        """만료된 캐시 정리"""
-        now = time.time()
-        expired_keys = [
-            key for key, (_, expire_time) in self.cache.items()
-            if expire_time < now
-        ]
-        for key in expired_keys:
-            del self.cache[key]
-
-        # 최대 크기 초과 시 오래된 항목 제거
-        if len(self.cache) > self.max_size:
-            sorted_keys = sorted(
-                self.cache.keys(),
-                key=lambda k: self.cache[k][1]
-            )
-            for key in sorted_keys[:len(self.cache) - self.max_size]:
-                del self.cache[key]
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        # key -> (value, expire_time, size, tags)
+        self.cache: "OrderedDict[str, tuple[Any, float, int, tuple[str, ...]]]" = OrderedDict()
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.tags: dict[str, set[str]] = defaultdict(set)  # tag -> keys
+        self.counters: dict[str, int] = defaultdict(int)
+
+    def _remove(self, key: str) -> None:
+        _, _, size, tags = self.cache.pop(key)
+        self.current_bytes -= size
+        for tag in tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
 
     def get(self, key: str) -> Optional[Any]:
         """캐시 조회"""
-        if key not in self.cache:
+        entry = self.cache.get(key)
+        if entry is None:
+            self.counters["misses"] += 1
             return None
 
-        value, expire_time = self.cache[key]
-        if time.time() > expire_time:
-            del self.cache[key]
+        if time.time() > entry[1]:
+            self._remove(key)
+            self.counters["expired"] += 1
+            self.counters["misses"] += 1
             return None
 
-        return value
+        self.cache.move_to_end(key)
+        self.counters["hits"] += 1
+        return entry[0]
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300):
-        """캐시 저장"""
-        self._cleanup()
-        expire_time = time.time() + ttl_seconds
-        self.cache[key] = (value, expire_time)
+    def set(self, key: str, value: Any, ttl_seconds: int = 300, tags: Optional[list[str]] = None):
+        """캐시 저장 (용량 초과 시 가장 오래 안 쓴 항목부터 제거)"""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"Cache skip (too large: {size} bytes): {key}")
+            return
+
+        if key in self.cache:
+            self._remove(key)
+
+        while self.cache and self.current_bytes + size > self.max_bytes:
+            oldest = next(iter(self.cache))
+            if self.cache[oldest][1] < time.time():
+                self.counters["expired"] += 1
+            else:
+                self.counters["evictions"] += 1
+            self._remove(oldest)
+
+        tag_tuple = tuple(tags or ())
+        self.cache[key] = (value, time.time() + ttl_seconds, size, tag_tuple)
+        self.current_bytes += size
+        for tag in tag_tuple:
+            self.tags[tag].add(key)
 
     def delete(self, key: str):
         """캐시 삭제"""
         if key in self.cache:
-            del self.cache[key]
-
-    def clear_pattern(self, pattern: str):
-        """패턴에 맞는 캐시 삭제"""
-        keys_to_delete = [k for k in self.cache.keys() if pattern in k]
-        for key in keys_to_delete:
-            del self.cache[key]
+            self._remove(key)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """태그가 붙은 항목 모두 삭제. 삭제 건수 반환"""
+        keys = list(self.tags.get(tag, ()))
+        for key in keys:
+            if key in self.cache:
+                self._remove(key)
+        return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """캐시 메트릭"""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            **self.counters,
+            "entries": len(self.cache),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.counters["hits"] / lookups, 3) if lookups else None,
+        }
 
 
 # 전역 인스턴스
-rate_limiter = InMemoryRateLimiter()
+rate_limiter = RedisRateLimiter()
 cache = InMemoryCache()
 
 
@@ -151,6 +263,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     - 인증되지 않은 요청: 분당 30회
     - 인증된 요청: 분당 100회
     - 특정 엔드포인트는 더 엄격하게 제한
+    - 카운터는 Redis에 두어 워커/인스턴스 간 공유 (장애 시 프로세스 로컬로 폴백)
     """
 
     # 엔드포인트별 Rate Limit 설정
@@ -204,7 +317,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 max_requests, window_seconds = self.DEFAULT_ANONYMOUS_LIMIT
 
         # Rate limit 체크
-        is_limited, remaining, reset_time = rate_limiter.is_rate_limited(
+        is_limited, remaining, reset_time = await rate_limiter.is_rate_limited(
             f"{key}:{path}",
             max_requests,
             window_seconds
@@ -219,13 +332,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
-                    "retry_after": reset_time - int(time.time()),
+                    "retry_after": max(1, reset_time - int(time.time())),
                 },
                 headers={
                     "X-RateLimit-Limit": str(max_requests),
                     "X-RateLimit-Remaining": str(remaining),
                     "X-RateLimit-Reset": str(reset_time),
-                    "Retry-After": str(reset_time - int(time.time())),
+                    "Retry-After": str(max(1, reset_time - int(time.time()))),
                 }
             )
 
@@ -243,33 +356,49 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 def cached(
     ttl_seconds: int = 300,
     key_builder: Optional[Callable[..., str]] = None,
-    invalidate_on: Optional[list[str]] = None
+    tags: Optional[list[str]] = None,
 ):
     """
     API 응답 캐싱 데코레이터
 
+    - 같은 키의 동시 미스는 한 번만 실행 (single-flight, 나머지 호출자는 결과 공유)
+    - 캐시 항목에 함수 경로(`module.func`)와 tags가 태그로 붙음 → invalidate_cache(tag)
+
     Usage:
         @cached(ttl_seconds=60)
         async def get_stats():
             ...
 
-        @cached(key_builder=lambda user_id: f"user:{user_id}")
+        @cached(key_builder=lambda user_id: f"user:{user_id}", tags=["users"])
         async def get_user(user_id: str):
             ...
+
+        invalidate_cache("users")
     """
     def decorator(func: Callable):
+        func_tag = f"{func.__module__}.{func.__name__}"
+        entry_tags = [func_tag, *(tags or [])]
+        inflight: dict[str, asyncio.Task] = {}
+
+        def build_key(args, kwargs) -> str:
+            if key_builder:
+                return key_builder(*args, **kwargs)
+            # 기본: 함수 이름 + 인자 해시
+            args_hash = hashlib.md5(
+                json.dumps([str(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())],
+                          ensure_ascii=False).encode()
+            ).hexdigest()[:8]
+            return f"{func_tag}:{args_hash}"
+
+        async def load(cache_key: str, args, kwargs):
+            result = await func(*args, **kwargs)
+            cache.set(cache_key, result, ttl_seconds, tags=entry_tags)
+            logger.debug(f"Cache set: {cache_key} (TTL: {ttl_seconds}s)")
+            return result
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # 캐시 키 생성
-            if key_builder:
-                cache_key = key_builder(*args, **kwargs)
-            else:
-                # 기본: 함수 이름 + 인자 해시
-                args_hash = hashlib.md5(
-                    json.dumps([str(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())],
-                              ensure_ascii=False).encode()
-                ).hexdigest()[:8]
-                cache_key = f"{func.__module__}.{func.__name__}:{args_hash}"
+            cache_key = build_key(args, kwargs)
 
             # 캐시 조회
             cached_value = cache.get(cache_key)
@@ -277,26 +406,36 @@ def cached(
                 logger.debug(f"Cache hit: {cache_key}")
                 return cached_value
 
-            # 함수 실행
-            result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-
-            # 캐시 저장
-            cache.set(cache_key, result, ttl_seconds)
-            logger.debug(f"Cache set: {cache_key} (TTL: {ttl_seconds}s)")
-
-            return result
+            if not asyncio.iscoroutinefunction(func):
+                result = func(*args, **kwargs)
+                cache.set(cache_key, result, ttl_seconds, tags=entry_tags)
+                return result
+
+            # 같은 키로 실행 중인 호출이 있으면 그 결과를 기다림
+            task = inflight.get(cache_key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.create_task(load(cache_key, args, kwargs))
+                inflight[cache_key] = task
+                task.add_done_callback(
+                    lambda t, k=cache_key: inflight.pop(k, None) if inflight.get(k) is t else None
+                )
+            else:
+                cache.counters["coalesced"] += 1
+            # 대기 중인 호출자가 취소돼도 공유 실행은 계속 진행
+            return await asyncio.shield(task)
 
         return wrapper
     return decorator
 
 
-def invalidate_cache(pattern: str):
+def invalidate_cache(tag: str) -> int:
     """
-    패턴에 맞는 캐시 무효화
+    태그에 해당하는 캐시 무효화
 
     Usage:
-        invalidate_cache("user:123")  # 특정 사용자 캐시 삭제
-        invalidate_cache("stats")     # 통계 관련 캐시 삭제
+        invalidate_cache("users")                         # @cached(tags=["users"]) 항목 전체
+        invalidate_cache("app.services.stats.get_stats")  # 특정 함수의 캐시 전체
     """
-    cache.clear_pattern(pattern)
-    logger.debug(f"Cache invalidated: {pattern}")
+    removed = cache.invalidate_tag(tag)
+    logger.debug(f"Cache invalidated: {tag} ({removed} entries)")
+    return removed
@@ -0,0 +1,61 @@
+"""
+공유 Redis 클라이언트
+- 이벤트 루프별 클라이언트 (Celery 태스크는 태스크마다 새 루프를 만듦)
+- Redis 장애 시 일정 시간 호출을 건너뛰고 None 반환 → 호출자는 로컬 폴백 사용
+"""
+import asyncio
+import time
+import weakref
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from .config import settings
+from .logging import get_logger
+
+logger = get_logger("mediplaton.redis")
+
+# 장애 감지 후 재시도까지 대기 시간
+UNAVAILABLE_BACKOFF_SECONDS = 30.0
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = weakref.WeakKeyDictionary()
+_unavailable_until = 0.0
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """
+    현재 이벤트 루프의 Redis 클라이언트 반환
+
+    최근에 장애가 감지됐으면 None (호출자는 인메모리 폴백 사용)
+    """
+    if not settings.REDIS_URL or time.monotonic() < _unavailable_until:
+        return None
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        for stale in [l for l in list(_clients.keys()) if l.is_closed()]:
+            _clients.pop(stale, None)
+        client = aioredis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=1.0,
+            socket_timeout=1.0,
+            health_check_interval=30,
+        )
+        _clients[loop] = client
+    return client
+
+
+def mark_unavailable(error: Exception):
+    """Redis 호출 실패 시 호출 — 백오프 동안 get_redis()가 None 반환"""
+    global _unavailable_until
+    if time.monotonic() >= _unavailable_until:
+        logger.warning(f"Redis unavailable, using local fallback for {UNAVAILABLE_BACKOFF_SECONDS:.0f}s: {error}")
+    _unavailable_until = time.monotonic() + UNAVAILABLE_BACKOFF_SECONDS
+
+
+async def close_redis():
+    """현재 루프의 Redis 클라이언트 종료 (FastAPI lifespan 종료 시)"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,5 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -8,9 +10,14 @@ from pydantic import BaseModel
 import secrets
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 저장된 해시의 비용이 BCRYPT_ROUNDS와 다르면 needs_update → 로그인 시 재해시
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 security = HTTPBearer()
 
+# bcrypt 전용 스레드 풀 — 해시 1회가 수백 ms라 이벤트 루프에서 직접 부르면 워커 전체가 멈춤.
+# 워커 수를 제한해 로그인 폭주 시에도 다른 요청이 쓸 CPU를 남김 (초과 요청은 풀 큐에서 대기)
+_hash_pool: Optional[ThreadPoolExecutor] = None
+
 
 class TokenData(BaseModel):
     user_id: str
@@ -34,6 +41,41 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def _get_hash_pool() -> ThreadPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ThreadPoolExecutor(
+            max_workers=max(1, settings.PASSWORD_HASH_WORKERS),
+            thread_name_prefix="password-hash",
+        )
+    return _hash_pool
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password in the hash pool.
+
+    Returns (valid, new_hash). new_hash is set when the stored hash uses an outdated
+    scheme or cost and should replace it.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash in the hash pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), pwd_context.hash, password)
+
+
+def shutdown_hash_pool():
+    """해시 스레드 풀 종료 (FastAPI lifespan 종료 시)"""
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
 def create_access_token(
     subject: Union[str, dict],
     role: str,
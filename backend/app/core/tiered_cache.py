@@ -0,0 +1,229 @@
+"""
+공공데이터 API 응답 2단 캐시
+- L1: 프로세스 내 LRU (TTL)
+- L2: Redis (인스턴스 간 공유, Redis 장애 시 L1만 사용)
+- 소스별 TTL: fresh 기간 + stale 허용 기간 (stale-while-revalidate)
+- single-flight: 같은 키의 동시 미스는 한 번만 업스트림 호출
+  (프로세스 내: in-flight 태스크 공유 / 인스턴스 간: Redis SET NX 락)
+
+Usage:
+    hospitals = await tiered_cache.get_or_fetch(
+        "hira_hospitals", f"{sido}:{sggu}:{dgsbjt}",
+        lambda: self._fetch_hira_hospitals_uncached(...),
+    )
+"""
+import asyncio
+import json
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .logging import get_logger
+from .redis import get_redis, mark_unavailable
+
+logger = get_logger("mediplaton.tiered_cache")
+
+
+# 소스별 (fresh TTL, stale 허용 기간) 초 — 원천 데이터 갱신 주기 기준
+CACHE_POLICIES: Dict[str, Tuple[int, int]] = {
+    "hira_hospitals": (6 * 3600, 24 * 3600),       # 심평원 병원 목록 (sido, sggu, dgsbjtCd)
+    "mois_demographics": (24 * 3600, 72 * 3600),   # 행안부 인구 (월 단위 갱신)
+    "localdata_closure": (24 * 3600, 72 * 3600),   # LOCALDATA 시군구 폐업 이력
+    "vworld_building": (7 * 86400, 30 * 86400),    # 건축물 메타 (좌표)
+    "naver_trend": (24 * 3600, 48 * 3600),         # 네이버 검색 트렌드 (월 단위)
+}
+DEFAULT_POLICY = (3600, 3600)
+
+KEY_PREFIX = "tc"
+LOCK_TTL_MS = 30000
+# 다른 인스턴스가 가져오는 중일 때 L2 폴링 (간격, 횟수)
+LOCK_POLL_INTERVAL = 0.2
+LOCK_POLL_ATTEMPTS = 25
+
+
+class TieredCache:
+    """L1(LRU) + L2(Redis) 캐시"""
+
+    def __init__(self, l1_max_items: int = 512):
+        # key -> (payload json, fresh_until, expires_at)
+        self._l1: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+        self.l1_max_items = l1_max_items
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._revalidating: set[str] = set()
+        self._background: set[asyncio.Task] = set()
+        self.stats: Dict[str, int] = defaultdict(int)
+
+    # ── L1 ───────────────────────────────────────────────
+    def _l1_get(self, key: str) -> Optional[Tuple[str, float, float]]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry[2]:
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return entry
+
+    def _l1_set(self, key: str, entry: Tuple[str, float, float]):
+        self._l1[key] = entry
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_max_items:
+            self._l1.popitem(last=False)
+
+    # ── L2 ───────────────────────────────────────────────
+    async def _l2_get(self, key: str) -> Optional[Tuple[str, float, float]]:
+        redis = get_redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(key)
+        except Exception as e:
+            mark_unavailable(e)
+            return None
+        if raw is None:
+            return None
+        try:
+            wrapper = json.loads(raw)
+            return wrapper["v"], wrapper["f"], wrapper["e"]
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    async def _l2_set(self, key: str, entry: Tuple[str, float, float]):
+        redis = get_redis()
+        if redis is None:
+            return
+        payload, fresh_until, expires_at = entry
+        ttl = max(1, int(expires_at - time.time()))
+        try:
+            await redis.set(key, json.dumps({"v": payload, "f": fresh_until, "e": expires_at}), ex=ttl)
+        except Exception as e:
+            mark_unavailable(e)
+
+    async def _lock(self, key: str) -> bool:
+        """인스턴스 간 single-flight 락. Redis가 없으면 항상 획득"""
+        redis = get_redis()
+        if redis is None:
+            return True
+        try:
+            return bool(await redis.set(f"{key}:lock", "1", nx=True, px=LOCK_TTL_MS))
+        except Exception as e:
+            mark_unavailable(e)
+            return True
+
+    async def _unlock(self, key: str):
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(f"{key}:lock")
+        except Exception as e:
+            mark_unavailable(e)
+
+    # ── 조회 ─────────────────────────────────────────────
+    async def get_or_fetch(
+        self,
+        source: str,
+        key: str,
+        fetcher: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        캐시 조회, 없으면 fetcher 실행 후 저장
+
+        - fresh: 캐시값 반환
+        - stale: 캐시값 반환 + 백그라운드 갱신
+        - miss: single-flight로 fetcher 실행. cache_if(value)가 False면 저장하지 않음
+          (업스트림 실패 시 빈 결과를 돌려주는 클라이언트가 많아 기본은 truthy만 저장)
+
+        항상 호출자별 독립 사본을 반환한다 (캐시값 변경이 다른 요청에 새지 않도록).
+        """
+        full_key = f"{KEY_PREFIX}:{source}:{key}"
+        now = time.time()
+
+        entry = self._l1_get(full_key)
+        if entry is not None:
+            self.stats["l1_hit"] += 1
+        else:
+            entry = await self._l2_get(full_key)
+            if entry is not None:
+                self.stats["l2_hit"] += 1
+                self._l1_set(full_key, entry)
+
+        if entry is not None:
+            payload, fresh_until, _ = entry
+            if now >= fresh_until:
+                self.stats["stale"] += 1
+                self._revalidate(source, full_key, fetcher, cache_if)
+            return json.loads(payload)
+
+        self.stats["miss"] += 1
+        payload = await self._single_flight(source, full_key, fetcher, cache_if)
+        return json.loads(payload)
+
+    def _single_flight(self, source, full_key, fetcher, cache_if) -> Awaitable[str]:
+        task = self._inflight.get(full_key)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load(source, full_key, fetcher, cache_if))
+            self._inflight[full_key] = task
+            task.add_done_callback(lambda t, k=full_key: self._inflight.pop(k, None) if self._inflight.get(k) is t else None)
+        else:
+            self.stats["coalesced"] += 1
+        # 대기 중인 호출자가 취소돼도 공유 태스크는 계속 진행
+        return asyncio.shield(task)
+
+    async def _load(self, source, full_key, fetcher, cache_if) -> str:
+        locked = await self._lock(full_key)
+        try:
+            if not locked:
+                # 다른 인스턴스가 가져오는 중 — L2에 채워질 때까지 잠시 대기
+                for _ in range(LOCK_POLL_ATTEMPTS):
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+                    entry = await self._l2_get(full_key)
+                    if entry is not None:
+                        self.stats["l2_hit"] += 1
+                        self._l1_set(full_key, entry)
+                        return entry[0]
+
+            self.stats["fetch"] += 1
+            value = await fetcher()
+            payload = json.dumps(value, ensure_ascii=False, default=str)
+            if cache_if(value):
+                fresh_ttl, stale_ttl = CACHE_POLICIES.get(source, DEFAULT_POLICY)
+                now = time.time()
+                entry = (payload, now + fresh_ttl, now + fresh_ttl + stale_ttl)
+                self._l1_set(full_key, entry)
+                await self._l2_set(full_key, entry)
+            return payload
+        finally:
+            if locked:
+                await self._unlock(full_key)
+
+    def _revalidate(self, source, full_key, fetcher, cache_if):
+        if full_key in self._revalidating or full_key in self._inflight:
+            return
+        self._revalidating.add(full_key)
+
+        async def refresh():
+            try:
+                await self._single_flight(source, full_key, fetcher, cache_if)
+            except Exception as e:
+                logger.warning(f"Background revalidation failed ({full_key}): {e}")
+            finally:
+                self._revalidating.discard(full_key)
+
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def invalidate_local(self, source: Optional[str] = None):
+        """L1 비우기 (source 지정 시 해당 소스만)"""
+        if source is None:
+            self._l1.clear()
+            return
+        prefix = f"{KEY_PREFIX}:{source}:"
+        for key in [k for k in self._l1 if k.startswith(prefix)]:
+            del self._l1[key]
+
+
+# 전역 인스턴스
+tiered_cache = TieredCache()
@@ -37,6 +37,30 @@ SIDO_HAENG_TO_HIRA: Dict[str, str] = {
 }
 
 
+# 시도 약칭 (행안부 2자리 → 검색 키워드용 이름, 카카오 주소 1depth 표기)
+SIDO_HAENG_NAMES: Dict[str, str] = {
+    "11": "서울",
+    "26": "부산",
+    "27": "대구",
+    "28": "인천",
+    "29": "광주",
+    "30": "대전",
+    "31": "울산",
+    "36": "세종",
+    "41": "경기",
+    "42": "강원",
+    "43": "충북",
+    "44": "충남",
+    "45": "전북",
+    "46": "전남",
+    "47": "경북",
+    "48": "경남",
+    "50": "제주",
+    "51": "강원",  # 강원특별자치도 신규 코드
+    "52": "전북",  # 전북특별자치도 신규 코드
+}
+
+
 # HIRA 시군구 코드 매핑 (행안부 4자리 → HIRA 6자리)
 # 형식: 행안부 시도(2) + 시군구(2) → HIRA 6자리
 SGGU_HAENG_TO_HIRA: Dict[str, str] = {
@@ -106,3 +130,10 @@ def haeng_to_hira_codes(region_code: str) -> Tuple[str, str]:
         hira_sggu = SGGU_HAENG_TO_HIRA.get(sggu4, "")
 
     return (hira_sido, hira_sggu)
+
+
+def haeng_to_sido_name(region_code: str) -> str:
+    """행안부 지역코드 → 시도 약칭 ("1168010100" → "서울"). 매핑 실패 시 ""."""
+    if not region_code or len(region_code) < 2:
+        return ""
+    return SIDO_HAENG_NAMES.get(region_code[:2], "")
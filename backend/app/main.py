@@ -6,9 +6,16 @@ from contextlib import asynccontextmanager
 import logging
 
 from .core.config import settings
-from .core.database import init_db
+from .core.database import init_db, close_db, get_db_pool_stats
+from .core.http_client import init_http_clients, close_http_clients, get_pool_stats
+from .core.redis import close_redis
+from .core.chat_hub import chat_hub
+from .services.chat_writer import chat_writer
+from .core.pdf_render import shutdown_render_pool
+from .core.security import shutdown_hash_pool
 from .core.logging import setup_logging, LoggingMiddleware, get_logger
-from .core.rate_limit import RateLimitMiddleware
+from .core.rate_limit import RateLimitMiddleware, cache
+from .core.tiered_cache import tiered_cache
 from .api.v1 import api_router
 from .api.v1.websocket import router as websocket_router
 
@@ -27,9 +34,17 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     await init_db()
     logger.info("Database initialized")
+    await init_http_clients()
     yield
     # Shutdown
     logger.info("Shutting down application")
+    await close_http_clients()
+    await chat_hub.close()
+    await chat_writer.close()
+    await close_redis()
+    await close_db()
+    shutdown_render_pool()
+    shutdown_hash_pool()
 
 
 app = FastAPI(
@@ -153,6 +168,18 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/pools")
+async def pool_stats():
+    """커넥션 풀 메트릭 (외부 API HTTP 풀 + DB 풀)"""
+    return {"http": get_pool_stats(), "db": get_db_pool_stats()}
+
+
+@app.get("/health/caches")
+async def cache_stats():
+    """캐시 메트릭 (프로세스 로컬 LRU + 공공데이터 2단 캐시)"""
+    return {"memory": cache.get_stats(), "tiered": dict(tiered_cache.stats)}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
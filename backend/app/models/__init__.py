@@ -1,7 +1,7 @@
 from .user import User, UserRole
 from .pharmacy import PharmacySlot, Bid
 from .prospect import ProspectLocation, UserAlert
-from .simulation import Simulation, SimulationReport
+from .simulation import Simulation, SimulationReport, SimulationBaseline
 from .hospital import Hospital, CommercialData
 from .listing import RealEstateListing
 from .payment import Payment, Subscription, UsageCredit, PaymentStatus, PaymentMethod
@@ -48,7 +48,7 @@ from .broker_board import (
 )
 from .emr_analytics import EMRDailyMetrics
 from .insurance_claim import (
-    InsuranceClaim, ClaimItem, ClaimBatch,
+    InsuranceClaim, ClaimItem, ClaimBatch, ClaimDailyRollup,
     ClaimStatus, RiskLevel, ClaimItemType,
 )
 from .tax_correction import (
@@ -133,6 +133,8 @@ from .visit import Visit, VisitDiagnosis, VisitProcedure, VisitStatus
 from .appointment import Appointment, AppointmentStatus
 from .prescription import Prescription, PrescriptionItem, PrescriptionStatus
 from .bill import Bill, BillItem, EmrPayment, BillStatus, PaymentMethod as BillPaymentMethod
+# 심평원 요양기관 스냅샷 (공간 인덱스)
+from .hira_institution import HiraInstitution, HiraInstitutionKind
 
 __all__ = [
     "User",
@@ -143,6 +145,7 @@ __all__ = [
     "UserAlert",
     "Simulation",
     "SimulationReport",
+    "SimulationBaseline",
     "Hospital",
     "CommercialData",
     "RealEstateListing",
@@ -251,6 +254,7 @@ __all__ = [
     "InsuranceClaim",
     "ClaimItem",
     "ClaimBatch",
+    "ClaimDailyRollup",
     "ClaimStatus",
     "RiskLevel",
     "ClaimItemType",
@@ -367,4 +371,7 @@ __all__ = [
     "EmrPayment",
     "BillStatus",
     "BillPaymentMethod",
+    # 심평원 요양기관 스냅샷
+    "HiraInstitution",
+    "HiraInstitutionKind",
 ]
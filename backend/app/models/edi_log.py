@@ -3,11 +3,13 @@ EDI 송수신 로그 모델
 
 - EDIMessageLog: 심평원 EDI 메시지 로그
 """
+import gzip
 import uuid
 import enum
 from datetime import datetime
+from typing import Optional
 from sqlalchemy import (
-    Column, String, Integer, Text, DateTime, ForeignKey, Boolean, Index
+    Column, String, Integer, Text, DateTime, ForeignKey, Boolean, Index, LargeBinary
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
@@ -49,7 +51,9 @@ class EDIMessageLog(Base):
 
     # EDI 메시지 내용
     xml_message = Column(Text, nullable=True)
-    message_size_bytes = Column(Integer, nullable=True)
+    message_size_bytes = Column(Integer, nullable=True)  # 원본 XML 크기 (압축 전)
+    # 대용량 배치 송신 메시지는 gzip 압축본만 저장 (xml_message는 비움)
+    xml_message_gz = Column(LargeBinary, nullable=True)
 
     # 요양기관 정보
     ykiho = Column(String(20), nullable=True)  # 요양기관번호
@@ -82,3 +86,9 @@ class EDIMessageLog(Base):
         Index("ix_edi_message_id", "message_id"),
         Index("ix_edi_created", "created_at"),
     )
+
+    def get_xml_message(self) -> Optional[str]:
+        """원본 XML (압축 저장분은 해제해서 반환)"""
+        if self.xml_message_gz is not None:
+            return gzip.decompress(self.xml_message_gz).decode("utf-8")
+        return self.xml_message
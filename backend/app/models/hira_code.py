@@ -76,6 +76,8 @@ class HIRAFeeCode(Base):
     __table_args__ = (
         Index("ix_hira_fee_name_trgm", "name", postgresql_using="gin",
               postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_hira_fee_code_trgm", "code", postgresql_using="gin",
+              postgresql_ops={"code": "gin_trgm_ops"}),
         Index("ix_hira_fee_category", "category"),
         Index("ix_hira_fee_active", "is_active"),
     )
@@ -119,6 +121,8 @@ class HIRADiseaseCode(Base):
     __table_args__ = (
         Index("ix_hira_disease_name_trgm", "name_kr", postgresql_using="gin",
               postgresql_ops={"name_kr": "gin_trgm_ops"}),
+        Index("ix_hira_disease_code_trgm", "code", postgresql_using="gin",
+              postgresql_ops={"code": "gin_trgm_ops"}),
         Index("ix_hira_disease_chapter", "chapter"),
         Index("ix_hira_disease_chronic", "is_chronic"),
     )
@@ -170,6 +174,8 @@ class HIRADrugCode(Base):
               postgresql_ops={"product_name": "gin_trgm_ops"}),
         Index("ix_hira_drug_ingredient_trgm", "ingredient_name", postgresql_using="gin",
               postgresql_ops={"ingredient_name": "gin_trgm_ops"}),
+        Index("ix_hira_drug_code_trgm", "code", postgresql_using="gin",
+              postgresql_ops={"code": "gin_trgm_ops"}),
         Index("ix_hira_drug_atc", "atc_code"),
     )
 
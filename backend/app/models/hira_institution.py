@@ -0,0 +1,66 @@
+"""
+심평원(HIRA) 요양기관 전국 스냅샷 — 반경/영역 조회용 로컬 공간 인덱스
+
+매일 밤 getHospBasisList / getParmacyBasisList 전체를 받아 교체한다.
+PostGIS 없이 0.01° 격자 셀(geo_cell) B-tree 인덱스로 후보를 좁히고 거리 계산으로 확정.
+"""
+import math
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Float, DateTime, Index
+from ..core.database import Base
+
+
+# 격자 크기: 0.01° ≈ 위도 1.1km / 경도 0.9km (한국 위도 기준)
+GEO_CELL_DEGREES = 0.01
+_CELL_SCALE = 100
+_CELL_ROW_FACTOR = 100000
+
+
+def geo_cell(latitude: float, longitude: float) -> int:
+    """좌표 → 격자 셀 번호 (위도 행 * 100000 + 경도 열)"""
+    return math.floor(latitude * _CELL_SCALE) * _CELL_ROW_FACTOR + math.floor(longitude * _CELL_SCALE)
+
+
+def geo_cells_in_bbox(min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> list[int]:
+    """영역과 겹치는 모든 격자 셀 번호"""
+    rows = range(math.floor(min_lat * _CELL_SCALE), math.floor(max_lat * _CELL_SCALE) + 1)
+    cols = range(math.floor(min_lng * _CELL_SCALE), math.floor(max_lng * _CELL_SCALE) + 1)
+    return [r * _CELL_ROW_FACTOR + c for r in rows for c in cols]
+
+
+class HiraInstitutionKind:
+    HOSPITAL = "HOSPITAL"
+    PHARMACY = "PHARMACY"
+
+
+class HiraInstitution(Base):
+    """심평원 요양기관 스냅샷 (병원·의원·약국)"""
+    __tablename__ = "hira_institutions"
+
+    ykiho = Column(String(200), primary_key=True)  # 요양기관 기호 (암호화)
+    kind = Column(String(20), nullable=False)  # HOSPITAL / PHARMACY
+    name = Column(String(200), nullable=False)
+    address = Column(String(500), nullable=True)
+    phone = Column(String(50), nullable=True)
+    clinic_type = Column(String(100), nullable=True)  # _parse_hospital_data 기준 진료과/종별
+    cl_cd_nm = Column(String(50), nullable=True)  # 의료기관 종별
+    dgsbjt_codes = Column(String(200), nullable=True)  # 진료과 코드 ",01,05," (dgsbjtCd 필터 조회로 수집)
+    dgsbjt_unknown = Column(String(200), nullable=True)  # 조회 실패 + 직전 값 없음으로 미확정인 진료과 코드 ",05,"
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    geo_cell = Column(Integer, nullable=False)
+    beds = Column(Integer, default=0)
+    doctors = Column(Integer, default=0)
+    pharmacists = Column(Integer, default=0)
+    established = Column(String(20), nullable=True)
+    sido_cd = Column(String(10), nullable=True)
+    sggu_cd = Column(String(10), nullable=True)
+    snapshot_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_hira_inst_kind_cell", "kind", "geo_cell"),
+        Index("ix_hira_inst_snapshot", "kind", "snapshot_at"),
+    )
+
+    def __repr__(self):
+        return f"<HiraInstitution {self.kind} {self.name}>"
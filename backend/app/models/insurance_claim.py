@@ -4,6 +4,7 @@
 - InsuranceClaim: 심평원 보험청구 건
 - ClaimItem: 청구 항목 (진단/처치/약제)
 - ClaimBatch: 일괄 전송 배치
+- ClaimDailyRollup: 사용자×청구일×상태 일별 집계 (분석 대시보드용)
 """
 import uuid
 import enum
@@ -12,10 +13,10 @@ from sqlalchemy import (
     Column, String, Integer, BigInteger, Float, Text, DateTime, Date,
     ForeignKey, Boolean, Index
 )
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy import Enum as SQLEnum, event, inspect, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY, insert as pg_insert
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 
 from app.core.database import Base
 
@@ -215,3 +216,160 @@ class ClaimBatch(Base):
         Index("ix_batch_user", "user_id"),
         Index("ix_batch_status", "status"),
     )
+
+
+class ClaimDailyRollup(Base):
+    """
+    청구 일별 집계 (사용자 × 청구일 × 상태)
+
+    InsuranceClaim 변경 시 이 모듈의 Session flush 훅(_collect/_apply_claim_rollup_deltas)이 증감분을 반영한다.
+    분석 대시보드는 청구 전체 대신 이 테이블을 월/상태별로 합산한다.
+    """
+    __tablename__ = "claim_daily_rollups"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    claim_date = Column(Date, primary_key=True)
+    status = Column(SQLEnum(ClaimStatus), primary_key=True)
+
+    claim_count = Column(Integer, default=0, nullable=False)
+    total_amount = Column(BigInteger, default=0, nullable=False)
+    approved_amount = Column(BigInteger, default=0, nullable=False)
+    rejected_amount = Column(BigInteger, default=0, nullable=False)
+    risk_score_sum = Column(BigInteger, default=0, nullable=False)
+    risk_low_count = Column(Integer, default=0, nullable=False)
+    risk_medium_count = Column(Integer, default=0, nullable=False)
+    risk_high_count = Column(Integer, default=0, nullable=False)
+
+
+# ===== 일별 집계 증분 반영 =====
+# 청구 추가/수정/삭제가 flush될 때 이전 값 기여분을 빼고 새 값 기여분을 더한다.
+# 같은 트랜잭션에서 실행되므로 롤백 시 함께 취소되고, 동시 갱신도 col = col + delta로 안전.
+
+_ROLLUP_ATTRS = (
+    "user_id", "claim_date", "status", "total_amount",
+    "approved_amount", "rejected_amount", "risk_score", "risk_level",
+)
+_ROLLUP_METRICS = (
+    "claim_count", "total_amount", "approved_amount", "rejected_amount",
+    "risk_score_sum", "risk_low_count", "risk_medium_count", "risk_high_count",
+)
+_ROLLUP_DELTAS_KEY = "claim_rollup_deltas"
+_ROLLUP_REBUILD_KEY = "claim_rollup_rebuild_users"
+
+
+def _rollup_contribution(values: dict):
+    """청구 1건의 집계 기여분 → ((user_id, claim_date, status), 지표 튜플). 키가 없으면 None"""
+    if values["user_id"] is None or values["claim_date"] is None:
+        return None
+    # INSERT 전에는 컬럼 기본값이 아직 채워지지 않았을 수 있음
+    status = values["status"] or ClaimStatus.DRAFT
+    risk_level = values["risk_level"] or RiskLevel.LOW
+    risk_score = values["risk_score"] if values["risk_score"] is not None else 100
+    return (values["user_id"], values["claim_date"], status), (
+        1,
+        values["total_amount"] or 0,
+        values["approved_amount"] or 0,
+        values["rejected_amount"] or 0,
+        risk_score,
+        int(risk_level == RiskLevel.LOW),
+        int(risk_level == RiskLevel.MEDIUM),
+        int(risk_level == RiskLevel.HIGH),
+    )
+
+
+def _previous_rollup_values(claim: "InsuranceClaim"):
+    """flush 전 DB에 있던 값. 로드되지 않은 채 변경된 속성이 있으면 None (이전 값 불명)"""
+    state = inspect(claim)
+    values = {}
+    for attr in _ROLLUP_ATTRS:
+        history = state.attrs[attr].history
+        if history.deleted:
+            values[attr] = history.deleted[0]
+        elif history.unchanged:
+            values[attr] = history.unchanged[0]
+        elif history.added:
+            return None
+        else:
+            values[attr] = None
+    return values
+
+
+def _add_rollup_delta(deltas: dict, values: dict, sign: int):
+    contribution = _rollup_contribution(values)
+    if contribution is None:
+        return
+    key, metrics = contribution
+    current = deltas.setdefault(key, [0] * len(_ROLLUP_METRICS))
+    for i, value in enumerate(metrics):
+        current[i] += sign * value
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_claim_rollup_deltas(session, flush_context, instances):
+    deltas = session.info.setdefault(_ROLLUP_DELTAS_KEY, {})
+    for obj in session.new:
+        if isinstance(obj, InsuranceClaim):
+            _add_rollup_delta(deltas, {a: getattr(obj, a) for a in _ROLLUP_ATTRS}, +1)
+    for obj in session.deleted:
+        if isinstance(obj, InsuranceClaim):
+            previous = _previous_rollup_values(obj)
+            if previous is None:
+                session.info.setdefault(_ROLLUP_REBUILD_KEY, set()).add(obj.user_id)
+            else:
+                _add_rollup_delta(deltas, previous, -1)
+    for obj in session.dirty:
+        if not isinstance(obj, InsuranceClaim) or not session.is_modified(obj, include_collections=False):
+            continue
+        previous = _previous_rollup_values(obj)
+        if previous is None:
+            session.info.setdefault(_ROLLUP_REBUILD_KEY, set()).add(obj.user_id)
+            continue
+        _add_rollup_delta(deltas, previous, -1)
+        _add_rollup_delta(deltas, {a: getattr(obj, a) for a in _ROLLUP_ATTRS}, +1)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_claim_rollup_deltas(session, flush_context):
+    deltas = session.info.pop(_ROLLUP_DELTAS_KEY, None) or {}
+    rebuild_users = session.info.pop(_ROLLUP_REBUILD_KEY, None) or set()
+    rows = [
+        {"user_id": user_id, "claim_date": claim_date, "status": status, **dict(zip(_ROLLUP_METRICS, metrics))}
+        for (user_id, claim_date, status), metrics in deltas.items()
+        if user_id not in rebuild_users and any(metrics)
+    ]
+    connection = session.connection()
+    if rows:
+        stmt = pg_insert(ClaimDailyRollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "claim_date", "status"],
+            set_={m: getattr(ClaimDailyRollup, m) + stmt.excluded[m] for m in _ROLLUP_METRICS},
+        )
+        connection.execute(stmt)
+    for user_id in rebuild_users:
+        rebuild_claim_rollups(connection, user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_claim_rollup_deltas(session, previous_transaction):
+    # flush 실패로 after_flush까지 가지 못한 증감분이 다음 flush에 섞이지 않도록 폐기
+    session.info.pop(_ROLLUP_DELTAS_KEY, None)
+    session.info.pop(_ROLLUP_REBUILD_KEY, None)
+
+
+def claim_rollup_rebuild_sql(user_filter: str = "") -> str:
+    """insurance_claims → claim_daily_rollups 재계산 SQL (마이그레이션 029 백필과 같은 쿼리)"""
+    return (
+        "INSERT INTO claim_daily_rollups (user_id, claim_date, status, claim_count, total_amount, "
+        "approved_amount, rejected_amount, risk_score_sum, risk_low_count, risk_medium_count, risk_high_count) "
+        "SELECT user_id, claim_date, status, COUNT(*), COALESCE(SUM(total_amount), 0), "
+        "COALESCE(SUM(approved_amount), 0), COALESCE(SUM(rejected_amount), 0), COALESCE(SUM(risk_score), 0), "
+        "COUNT(*) FILTER (WHERE risk_level = 'LOW'), COUNT(*) FILTER (WHERE risk_level = 'MEDIUM'), "
+        "COUNT(*) FILTER (WHERE risk_level = 'HIGH') "
+        f"FROM insurance_claims {user_filter} GROUP BY user_id, claim_date, status"
+    )
+
+
+def rebuild_claim_rollups(connection, user_id) -> None:
+    """사용자 1명의 일별 집계를 청구 원본에서 다시 계산 (동기 Connection — flush 훅 / run_sync용)"""
+    connection.execute(text("DELETE FROM claim_daily_rollups WHERE user_id = :uid"), {"uid": user_id})
+    connection.execute(text(claim_rollup_rebuild_sql("WHERE user_id = :uid")), {"uid": user_id})
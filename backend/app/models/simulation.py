@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, BigInteger, Float, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, Integer, BigInteger, Float, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy import Enum as SQLEnum, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -77,6 +77,11 @@ class Simulation(Base):
     user = relationship("User", back_populates="simulations")
     report = relationship("SimulationReport", back_populates="simulation", uselist=False)
 
+    __table_args__ = (
+        # 내 시뮬레이션 목록 (COUNT + created_at 역순 keyset 페이지네이션)
+        Index("ix_simulations_user_created", "user_id", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Simulation {self.address} - {self.clinic_type}>"
 
@@ -129,3 +134,21 @@ class SimulationReport(Base):
 
     def __repr__(self):
         return f"<SimulationReport {self.simulation_id}>"
+
+
+class SimulationBaseline(Base):
+    """시뮬레이션 지역 기준값 번들 (시군구 × 진료과)
+
+    사용자와 무관하게 지역·진료과로만 결정되는 입력(지역 통계, 폐업률, 비급여 단가,
+    검색 트렌드, 시군구 동일과 의원 청구통계)을 미리 계산해 둔다.
+    """
+    __tablename__ = "simulation_baselines"
+
+    sggu_cd = Column(String(5), primary_key=True)  # 행안부 시도+시군구 5자리
+    clinic_type = Column(String(50), primary_key=True)
+    bundle = Column(JSON, nullable=False)
+    source = Column(String(20), nullable=False, default="nightly")  # nightly / live
+    built_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<SimulationBaseline {self.sggu_cd} {self.clinic_type}>"
@@ -15,6 +15,9 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.core.database import Base
 
+# 월간 자동 스캔 기록 유형 — 사용자가 실행한 스캔(FULL)과 구분, 최근 스캔 조회에서 제외
+SCHEDULED_SCAN_TYPE = "SCHEDULED"
+
 
 # ===== Enums =====
 
@@ -42,7 +45,7 @@ class TaxScanResult(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # 스캔 정보
-    scan_type = Column(String(30), default="FULL", nullable=False)  # FULL/PARTIAL/CATEGORY
+    scan_type = Column(String(30), default="FULL", nullable=False)  # FULL/PARTIAL/CATEGORY/SCHEDULED(월간 자동)
     tax_years = Column(JSONB, default=[], nullable=False)  # [2021, 2022, 2023, 2024, 2025]
     status = Column(SQLEnum(TaxScanStatus), default=TaxScanStatus.PENDING, nullable=False)
 
@@ -91,6 +94,16 @@ class TaxScanResult(Base):
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     duration_ms = Column(Integer, nullable=True)
+    scanner_timings = Column(JSONB, default={}, nullable=False)
+    """
+    {
+        "prefetch_ms": 12.4,
+        "slowest_ms": 3.1,
+        "scanners": [
+            {"tax_year": 2024, "category": "EQUIPMENT_DEPRECIATION", "duration_ms": 3.1, "findings": 1, "error": null}
+        ]
+    }
+    """
 
     # 메타
     model_version = Column(String(50), nullable=True)
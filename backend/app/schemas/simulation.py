@@ -642,12 +642,30 @@ def mask_sensitive_data(response: "SimulationResponse") -> "SimulationResponse":
     return masked
 
 
+class SimulationSummary(BaseModel):
+    """시뮬레이션 목록 항목 (저장된 컬럼만 — 상세 분석은 단건 조회에서)"""
+    simulation_id: UUID
+    address: str
+    clinic_type: str
+    size_pyeong: Optional[float] = None
+    budget_million: Optional[int] = None
+    est_revenue_avg: Optional[int] = None
+    est_cost_total: Optional[int] = None
+    monthly_profit_avg: Optional[int] = None
+    breakeven_months: Optional[int] = None
+    confidence_score: Optional[int] = None
+    recommendation: Optional[RecommendationType] = None
+    is_paid: bool = False
+    created_at: datetime
+
+
 class SimulationListResponse(BaseModel):
-    """시뮬레이션 목록 응답"""
-    items: List[SimulationResponse]
+    """시뮬레이션 목록 응답 (next_cursor로 다음 페이지 keyset 조회)"""
+    items: List[SimulationSummary]
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class ReportPurchaseRequest(BaseModel):
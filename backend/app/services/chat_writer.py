@@ -0,0 +1,338 @@
+"""
+WebSocket 채팅 저장 (write-behind)
+
+- 메시지: id/created_at을 앱에서 정해 INSERT 1회 + 커밋 (refresh 없음).
+  연락처가 감지된 경우만 탐지 로그를 같은 트랜잭션에서 먼저 기록
+- 채팅방 last_message/안읽음 수, 읽음 처리는 룸별로 모아 FLUSH_INTERVAL마다 한 트랜잭션으로 반영
+  · 같은 룸의 여러 메시지는 마지막 메시지 1건 + 안읽음 증가분 합계로 UPDATE 1회
+  · 읽음은 읽은 시각 이전 메시지만 (무제한 UPDATE 대신 room_id + created_at 범위)
+- 채팅방 참여자/상태는 ROOM_ACCESS_TTL 동안 캐시 (연결·메시지마다 재조회하지 않음)
+  · ChatRoom 상태/참여자 변경, Partner 사용자 변경이 커밋되면 ORM 이벤트로 이 노드의 항목을 지우고
+    chat_hub 제어 채널로 다른 노드에도 전달. Redis 장애 시 다른 노드는 ROOM_ACCESS_TTL 안에 만료
+
+Usage:
+    access = await chat_writer.room_access(room_id)
+    sender_type = access.sender_type(user_id)   # "user" / "partner" / None(권한 없음)
+    message_id, created_at = await chat_writer.save_message(access, user.id, sender_type, content, detection)
+    chat_writer.mark_read(room_id, user.id, sender_type)
+"""
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, insert, inspect, select, update
+from sqlalchemy.orm import Session, object_session
+
+from ..core.chat_hub import chat_hub
+from ..core.database import async_session
+from ..models.chat import ChatMessage, ChatMessageType, ChatRoom, ChatRoomStatus
+from ..models.escrow import ContactDetectionLog, DetectionAction
+from ..models.partner import Partner
+from .contact_detector import DetectionResult
+
+logger = logging.getLogger(__name__)
+
+# 채팅방/읽음 반영 주기 (초)
+FLUSH_INTERVAL = 0.5
+# 채팅방 참여자/상태 캐시 수명 (초)
+ROOM_ACCESS_TTL = 60.0
+ROOM_ACCESS_MAX_ENTRIES = 10000
+# 권한 캐시 무효화 제어 메시지 종류 / 전체 무효화 표시
+ROOM_ACCESS_CONTROL = "room_access"
+ALL_ROOMS = "*"
+# 권한에 영향을 주는 ChatRoom 컬럼
+ROOM_ACCESS_COLUMNS = ("status", "user_id", "partner_id")
+
+_SESSION_KEY = "chat_room_invalidate"
+
+
+@dataclass(frozen=True)
+class RoomAccess:
+    """채팅방 참여자/상태 (캐시용 값 객체)"""
+    room_id: int
+    user_id: str
+    partner_user_id: Optional[str]
+    is_active: bool
+
+    def sender_type(self, user_id: str) -> Optional[str]:
+        if user_id == self.user_id:
+            return "user"
+        if self.partner_user_id and user_id == self.partner_user_id:
+            return "partner"
+        return None
+
+
+@dataclass
+class _PendingRoom:
+    """룸별 미반영 변경"""
+    last_message: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+    last_message_by: Optional[UUID] = None
+    # 안읽음 수: 읽음 처리됐으면 0으로 재설정 후 증가분, 아니면 기존 값에 증가분
+    unread_added: Dict[str, int] = field(default_factory=lambda: {"user": 0, "partner": 0})
+    unread_reset: Dict[str, bool] = field(default_factory=lambda: {"user": False, "partner": False})
+    # 읽은 사용자 → 읽은 시각
+    reads: Dict[UUID, datetime] = field(default_factory=dict)
+
+
+class ChatWriter:
+    """WebSocket 채팅 메시지 저장 + 채팅방/읽음 write-behind"""
+
+    def __init__(self):
+        self._access: Dict[int, Tuple[float, Optional[RoomAccess]]] = {}
+        self._pending: Dict[int, _PendingRoom] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._pending_invalidations: Set[str] = set()
+        self._invalidation_task: Optional[asyncio.Task] = None
+
+    # ---- 채팅방 권한 ----
+
+    async def room_access(self, room_id: int) -> Optional[RoomAccess]:
+        """채팅방 참여자/상태 (캐시). 없는 방이면 None"""
+        cached = self._access.get(room_id)
+        if cached is not None and time.monotonic() - cached[0] < ROOM_ACCESS_TTL:
+            return cached[1]
+
+        # 캐시를 채우기 전에 다른 노드의 무효화 메시지 구독 시작
+        chat_hub.ensure_listening()
+        async with async_session() as db:
+            row = (await db.execute(
+                select(ChatRoom.user_id, ChatRoom.status, Partner.user_id.label("partner_user_id"))
+                .outerjoin(Partner, Partner.id == ChatRoom.partner_id)
+                .where(ChatRoom.id == room_id)
+            )).first()
+        access = None
+        if row is not None:
+            access = RoomAccess(
+                room_id=room_id,
+                user_id=str(row.user_id),
+                partner_user_id=str(row.partner_user_id) if row.partner_user_id else None,
+                is_active=row.status == ChatRoomStatus.ACTIVE,
+            )
+        if len(self._access) >= ROOM_ACCESS_MAX_ENTRIES:
+            self._access.clear()
+        self._access[room_id] = (time.monotonic(), access)
+        return access
+
+    def invalidate_room(self, room_id):
+        """채팅방 권한 캐시 제거 (room_id가 ALL_ROOMS면 전체) + 다른 노드 전달 예약"""
+        self._drop_access(room_id)
+        self._pending_invalidations.add(str(room_id))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if (
+            self._invalidation_task is None
+            or self._invalidation_task.done()
+            or self._invalidation_task.get_loop() is not loop
+        ):
+            self._invalidation_task = loop.create_task(self.flush_invalidations())
+
+    def _drop_access(self, room_id):
+        if str(room_id) == ALL_ROOMS:
+            self._access.clear()
+        else:
+            self._access.pop(int(room_id), None)
+
+    async def flush_invalidations(self):
+        """예약된 무효화를 다른 노드에 전달 (Celery 태스크는 루프 종료 전에 호출)"""
+        while self._pending_invalidations:
+            rooms, self._pending_invalidations = self._pending_invalidations, set()
+            await chat_hub.broadcast_control(ROOM_ACCESS_CONTROL, {"rooms": sorted(rooms)})
+
+    def _on_remote_invalidation(self, data: dict):
+        for room_id in data.get("rooms", ()):
+            self._drop_access(room_id)
+
+    # ---- 메시지 ----
+
+    async def save_message(
+        self,
+        access: RoomAccess,
+        sender_id: UUID,
+        sender_type: str,
+        content: str,
+        detection: DetectionResult,
+    ) -> Tuple[UUID, datetime]:
+        """메시지 INSERT (1 트랜잭션). 채팅방 갱신은 다음 flush에 반영"""
+        message_id = uuid.uuid4()
+        created_at = datetime.utcnow()
+        async with async_session() as db:
+            detection_id = None
+            if detection.detected:
+                detection_id = (await db.execute(
+                    insert(ContactDetectionLog)
+                    .values(
+                        user_id=sender_id,
+                        detected_pattern=detection.contact_type.value if detection.contact_type else "unknown",
+                        detected_value=detection.original_value[:50] if detection.original_value else "",
+                        original_content=content[:500],
+                        action_taken=DetectionAction.WARNING,
+                    )
+                    .returning(ContactDetectionLog.id)
+                )).scalar_one()
+            await db.execute(
+                insert(ChatMessage).values(
+                    id=message_id,
+                    room_id=access.room_id,
+                    sender_id=sender_id,
+                    sender_type=sender_type,
+                    message_type=ChatMessageType.TEXT,
+                    content=content,
+                    filtered_content=detection.filtered_content if detection.detected else None,
+                    contains_contact=detection.detected,
+                    contact_detection_id=detection_id,
+                    created_at=created_at,
+                )
+            )
+            await db.commit()
+
+        display = detection.filtered_content if detection.detected else content
+        pending = self._pending.setdefault(access.room_id, _PendingRoom())
+        pending.last_message = display[:100]
+        pending.last_message_at = created_at
+        pending.last_message_by = sender_id
+        pending.unread_added["partner" if sender_type == "user" else "user"] += 1
+        self._schedule()
+        return message_id, created_at
+
+    def mark_read(self, room_id: int, reader_id: UUID, reader_type: str):
+        """읽음 처리 예약 — 지금 시각 이전에 상대가 보낸 메시지"""
+        pending = self._pending.setdefault(room_id, _PendingRoom())
+        pending.reads[reader_id] = datetime.utcnow()
+        pending.unread_added[reader_type] = 0
+        pending.unread_reset[reader_type] = True
+        self._schedule()
+
+    # ---- flush ----
+
+    def _schedule(self):
+        if self._flusher is None or self._flusher.done():
+            self._wakeup = asyncio.Event()
+            self._flusher = asyncio.create_task(self._flush_loop())
+        self._wakeup.set()
+
+    async def _flush_loop(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(FLUSH_INTERVAL)
+            self._wakeup.clear()
+            await self.flush()
+
+    @staticmethod
+    def _room_values(pending: _PendingRoom) -> dict:
+        values = {}
+        if pending.last_message_at is not None:
+            values.update(
+                last_message=pending.last_message,
+                last_message_at=pending.last_message_at,
+                last_message_by=pending.last_message_by,
+            )
+        for side, column in (("user", ChatRoom.user_unread_count), ("partner", ChatRoom.partner_unread_count)):
+            added = pending.unread_added[side]
+            if pending.unread_reset[side]:
+                values[column.key] = added
+            elif added:
+                values[column.key] = column + added
+        return values
+
+    async def flush(self):
+        """모아둔 채팅방/읽음 변경을 한 트랜잭션으로 반영"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            async with async_session() as db:
+                for room_id, room in pending.items():
+                    values = self._room_values(room)
+                    if values:
+                        await db.execute(update(ChatRoom).where(ChatRoom.id == room_id).values(**values))
+                    for reader_id, read_at in room.reads.items():
+                        await db.execute(
+                            update(ChatMessage)
+                            .where(
+                                ChatMessage.room_id == room_id,
+                                ChatMessage.created_at <= read_at,
+                                ChatMessage.sender_id != reader_id,
+                                ChatMessage.is_read == False,
+                            )
+                            .values(is_read=True, read_at=read_at)
+                        )
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Chat room flush failed ({len(pending)} rooms), retrying next interval: {e}")
+            self._requeue(pending)
+
+    def _requeue(self, failed: Dict[int, _PendingRoom]):
+        """실패한 변경을 그 뒤에 쌓인 변경 앞에 다시 넣음"""
+        for room_id, old in failed.items():
+            new = self._pending.get(room_id)
+            if new is None:
+                self._pending[room_id] = old
+                continue
+            if new.last_message_at is None:
+                new.last_message = old.last_message
+                new.last_message_at = old.last_message_at
+                new.last_message_by = old.last_message_by
+            for side in ("user", "partner"):
+                if not new.unread_reset[side]:
+                    new.unread_added[side] += old.unread_added[side]
+                    new.unread_reset[side] = old.unread_reset[side]
+            for reader_id, read_at in old.reads.items():
+                new.reads.setdefault(reader_id, read_at)
+        self._schedule()
+
+    async def close(self):
+        """FastAPI lifespan 종료 시 — 남은 변경 반영"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+
+
+# 전역 인스턴스
+chat_writer = ChatWriter()
+chat_hub.on_control(ROOM_ACCESS_CONTROL, chat_writer._on_remote_invalidation)
+
+
+def _mark(target, room_id):
+    session = object_session(target)
+    if session is not None and room_id is not None:
+        session.info.setdefault(_SESSION_KEY, set()).add(room_id)
+
+
+@event.listens_for(ChatRoom, "after_update")
+def _room_changed(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[column].history.has_changes() for column in ROOM_ACCESS_COLUMNS):
+        _mark(target, target.id)
+
+
+@event.listens_for(ChatRoom, "after_delete")
+def _room_deleted(mapper, connection, target):
+    _mark(target, target.id)
+
+
+@event.listens_for(Partner, "after_update")
+def _partner_changed(mapper, connection, target):
+    # 파트너 계정 변경은 드물어 해당 파트너 방을 찾지 않고 전체 무효화
+    if inspect(target).attrs.user_id.history.has_changes():
+        _mark(target, ALL_ROOMS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for room_id in session.info.pop(_SESSION_KEY, ()):
+        chat_writer.invalidate_room(room_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session):
+    session.info.pop(_SESSION_KEY, None)
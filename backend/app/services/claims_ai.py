@@ -15,23 +15,28 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
 
+from .hira_code_cache import hira_fee_code_cache
+
 logger = logging.getLogger(__name__)
 
 
+async def _fee_codes(db: AsyncSession, claim_items: list, fee_codes: Optional[dict]) -> dict:
+    """항목 코드 → FeeCodeInfo. 파이프라인이 미리 조회한 값이 있으면 그대로 사용"""
+    if fee_codes is not None:
+        return fee_codes
+    return await hira_fee_code_cache.get_many(db, {item.code for item in claim_items})
+
+
 # Stage 1: Code Validation
-async def validate_codes(db: AsyncSession, claim_items: list) -> dict:
+async def validate_codes(db: AsyncSession, claim_items: list, fee_codes: Optional[dict] = None) -> dict:
     """HIRA 코드 레지스트리에서 유효성 확인"""
-    from app.models.hira_code import HIRAFeeCode, HIRADiseaseCode, HIRADrugCode
+    fee_codes = await _fee_codes(db, claim_items, fee_codes)
 
     results = []
     for item in claim_items:
-        # Check if code exists in HIRA registry
-        fee_result = await db.execute(
-            select(HIRAFeeCode).where(
-                and_(HIRAFeeCode.code == item.code, HIRAFeeCode.is_active == True)
-            )
-        )
-        fee_code = fee_result.scalar_one_or_none()
+        fee_code = fee_codes.get(item.code)
+        if fee_code is not None and not fee_code.is_active:
+            fee_code = None
         results.append({
             "code": item.code,
             "valid": fee_code is not None,
@@ -42,16 +47,15 @@ async def validate_codes(db: AsyncSession, claim_items: list) -> dict:
 
 
 # Stage 2: Rule Engine
-async def apply_rules(db: AsyncSession, claim_items: list, patient_info: dict) -> dict:
+async def apply_rules(
+    db: AsyncSession, claim_items: list, patient_info: dict, fee_codes: Optional[dict] = None,
+) -> dict:
     """빈도 한도, 수량 한도, 보험적용 여부 체크"""
-    from app.models.hira_code import HIRAFeeCode
+    fee_codes = await _fee_codes(db, claim_items, fee_codes)
 
     warnings = []
     for item in claim_items:
-        fee_result = await db.execute(
-            select(HIRAFeeCode).where(HIRAFeeCode.code == item.code)
-        )
-        fee_code = fee_result.scalar_one_or_none()
+        fee_code = fee_codes.get(item.code)
         if fee_code:
             if fee_code.max_frequency and hasattr(item, 'frequency_count') and item.frequency_count:
                 if item.frequency_count >= fee_code.max_frequency:
@@ -82,19 +86,25 @@ async def calculate_pass_probability(
     """rejection_patterns 테이블 기반 통과 확률 계산"""
     from app.models.claims_ai import RejectionPattern
 
+    # dx × tx 전체 조합을 IN 조회 1회로 가져옴
+    patterns = {}
+    if dx_codes and tx_codes:
+        result = await db.execute(
+            select(RejectionPattern).where(
+                and_(
+                    RejectionPattern.specialty_code == specialty_code,
+                    RejectionPattern.diagnosis_code.in_(set(dx_codes)),
+                    RejectionPattern.treatment_code.in_(set(tx_codes)),
+                )
+            )
+        )
+        for pattern in result.scalars():
+            patterns.setdefault((pattern.diagnosis_code, pattern.treatment_code), pattern)
+
     probabilities = []
     for dx in dx_codes:
         for tx in tx_codes:
-            result = await db.execute(
-                select(RejectionPattern).where(
-                    and_(
-                        RejectionPattern.specialty_code == specialty_code,
-                        RejectionPattern.diagnosis_code == dx,
-                        RejectionPattern.treatment_code == tx,
-                    )
-                )
-            )
-            pattern = result.scalar_one_or_none()
+            pattern = patterns.get((dx, tx))
             if pattern:
                 probabilities.append({
                     "dx": dx,
@@ -194,9 +204,10 @@ async def run_analysis_pipeline(db: AsyncSession, claim, items: list) -> dict:
             "patient_chart_no": claim.patient_chart_no,
         }
 
-        # Run pipeline stages
-        stage1 = await validate_codes(db, items)
-        stage2 = await apply_rules(db, items, patient_info)
+        # Run pipeline stages (수가코드는 한 번만 조회해 1·2단계가 공유)
+        fee_codes = await hira_fee_code_cache.get_many(db, {i.code for i in items})
+        stage1 = await validate_codes(db, items, fee_codes)
+        stage2 = await apply_rules(db, items, patient_info, fee_codes)
         stage3 = await calculate_pass_probability(
             db,
             claim.specialty_code or "00",
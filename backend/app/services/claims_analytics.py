@@ -0,0 +1,202 @@
+"""
+청구 분석 집계 서비스
+
+- 대시보드/트렌드 지표를 claim_daily_rollups(사용자×청구일×상태)에서 SQL로 합산
+  (청구 전체를 파이썬으로 읽어 반복 순회하던 방식 대체)
+- 집계 누락 감지: 집계 건수 합계가 실제 청구 건수와 다르면 해당 사용자 집계를 재계산
+  (마이그레이션 백필 전 데이터, 증분 반영 실패 대비)
+"""
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.insurance_claim import (
+    ClaimDailyRollup, ClaimItem, ClaimStatus, InsuranceClaim, rebuild_claim_rollups,
+)
+
+logger = logging.getLogger(__name__)
+
+RESOLVED_STATUSES = (ClaimStatus.ACCEPTED, ClaimStatus.PARTIAL, ClaimStatus.REJECTED)
+REJECTED_STATUSES = (ClaimStatus.REJECTED, ClaimStatus.PARTIAL)
+
+
+def month_starts(today: date, months: int) -> List[date]:
+    """최근 N개월 달력 월 1일 목록 (오래된 순, 이번 달 포함)"""
+    result = []
+    year, month = today.year, today.month
+    for _ in range(months):
+        result.append(date(year, month, 1))
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return result[::-1]
+
+
+class ClaimsAnalyticsService:
+    """청구 분석 집계 (일별 집계 테이블 기반)"""
+
+    async def _grouped_rollups(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        recent_from: date,
+    ) -> Optional[List[Any]]:
+        """
+        (상태, 월)별 합계 + recent_from 이후 합계 (FILTER) — 1회 조회
+
+        집계가 청구 원본과 어긋나면 재계산 후 다시 조회. 청구가 없으면 None.
+        """
+        R = ClaimDailyRollup
+        month = func.date_trunc("month", R.claim_date).label("month")
+        recent = R.claim_date >= recent_from
+        claim_total = (
+            select(func.count()).select_from(InsuranceClaim)
+            .where(InsuranceClaim.user_id == user_id)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                R.status,
+                month,
+                func.sum(R.claim_count).label("claims"),
+                func.sum(R.total_amount).label("total_amount"),
+                func.sum(R.rejected_amount).label("rejected_amount"),
+                func.coalesce(func.sum(R.claim_count).filter(recent), 0).label("r_claims"),
+                func.coalesce(func.sum(R.total_amount).filter(recent), 0).label("r_total_amount"),
+                func.coalesce(func.sum(R.approved_amount).filter(recent), 0).label("r_approved_amount"),
+                func.coalesce(func.sum(R.rejected_amount).filter(recent), 0).label("r_rejected_amount"),
+                func.coalesce(func.sum(R.risk_score_sum).filter(recent), 0).label("r_risk_score_sum"),
+                func.coalesce(func.sum(R.risk_low_count).filter(recent), 0).label("r_low"),
+                func.coalesce(func.sum(R.risk_medium_count).filter(recent), 0).label("r_medium"),
+                func.coalesce(func.sum(R.risk_high_count).filter(recent), 0).label("r_high"),
+                claim_total.label("claim_total"),
+            )
+            .where(R.user_id == user_id)
+            .group_by(R.status, month)
+        )
+
+        for attempt in range(2):
+            rows = (await db.execute(query)).all()
+            if rows:
+                claim_count = rows[0].claim_total
+                if sum(r.claims for r in rows) == claim_count:
+                    return [r for r in rows if r.claims]
+            else:
+                claim_count = (await db.execute(select(claim_total))).scalar() or 0
+                if claim_count == 0:
+                    return None
+            if attempt == 0:
+                logger.warning(f"Claim rollup out of sync for user {user_id}, rebuilding")
+                await db.run_sync(lambda sync_session: rebuild_claim_rollups(sync_session.connection(), user_id))
+        return [r for r in rows if r.claims]
+
+    @staticmethod
+    def _monthly(rows: List[Any], months: List[date]) -> List[Dict[str, Any]]:
+        buckets = {
+            m: {"total_claims": 0, "accepted": 0, "rejected": 0, "partial": 0, "total_amount": 0, "rejected_amount": 0}
+            for m in months
+        }
+        for r in rows:
+            bucket = buckets.get(r.month.date() if hasattr(r.month, "date") else r.month)
+            if bucket is None:
+                continue
+            bucket["total_claims"] += r.claims
+            bucket["total_amount"] += r.total_amount
+            bucket["rejected_amount"] += r.rejected_amount
+            if r.status == ClaimStatus.ACCEPTED:
+                bucket["accepted"] += r.claims
+            elif r.status == ClaimStatus.REJECTED:
+                bucket["rejected"] += r.claims
+            elif r.status == ClaimStatus.PARTIAL:
+                bucket["partial"] += r.claims
+        return [{"month": m.strftime("%Y-%m"), **buckets[m]} for m in months]
+
+    async def dashboard(self, db: AsyncSession, user_id: UUID, today: date) -> Optional[Dict[str, Any]]:
+        """분석 대시보드 지표. 청구가 없으면 None (호출자가 데모 데이터 사용)"""
+        thirty_days_ago = today - timedelta(days=30)
+        rows = await self._grouped_rollups(db, user_id, thirty_days_ago)
+        if rows is None:
+            return None
+
+        # 최근 30일 요약
+        recent_claims = sum(r.r_claims for r in rows)
+        resolved = [r for r in rows if r.status in RESOLVED_STATUSES]
+        accepted_amount = sum(r.r_approved_amount for r in resolved)
+        rejected_amount = sum(r.r_rejected_amount for r in resolved)
+        total_resolved = sum(r.r_total_amount for r in resolved)
+        risk_dist = {
+            "LOW": sum(r.r_low for r in rows),
+            "MEDIUM": sum(r.r_medium for r in rows),
+            "HIGH": sum(r.r_high for r in rows),
+        }
+
+        # 상태 분포 (전체 기간)
+        status_breakdown: Dict[str, int] = {}
+        for r in rows:
+            status_breakdown[r.status.value] = status_breakdown.get(r.status.value, 0) + r.claims
+
+        # 자주 삭감되는 코드 — 최근 30일 삭감/부분삭감 청구 항목을 코드별 집계
+        codes_result = await db.execute(
+            select(
+                ClaimItem.code,
+                func.max(ClaimItem.name).label("name"),
+                func.count().label("count"),
+                func.coalesce(func.sum(ClaimItem.total_price), 0).label("amount"),
+            )
+            .join(InsuranceClaim, ClaimItem.claim_id == InsuranceClaim.id)
+            .where(
+                and_(
+                    InsuranceClaim.user_id == user_id,
+                    InsuranceClaim.status.in_(REJECTED_STATUSES),
+                    InsuranceClaim.claim_date >= thirty_days_ago,
+                )
+            )
+            .group_by(ClaimItem.code)
+            .order_by(desc("count"))
+            .limit(5)
+        )
+        top_rejected_codes = [
+            {"code": c.code, "name": c.name, "rejection_count": c.count, "total_amount": c.amount}
+            for c in codes_result.all()
+        ]
+
+        return {
+            "period": f"{thirty_days_ago.isoformat()} ~ {today.isoformat()}",
+            "summary": {
+                "total_claims": recent_claims,
+                "total_amount": sum(r.r_total_amount for r in rows),
+                "accepted_amount": accepted_amount,
+                "rejected_amount": rejected_amount,
+                "acceptance_rate": round(accepted_amount / total_resolved * 100, 1) if total_resolved > 0 else 0,
+                "rejection_rate": round(rejected_amount / total_resolved * 100, 1) if total_resolved > 0 else 0,
+                "avg_risk_score": round(sum(r.r_risk_score_sum for r in rows) / recent_claims, 1) if recent_claims else 0,
+                "high_risk_count": risk_dist["HIGH"],
+            },
+            "monthly_trends": self._monthly(rows, month_starts(today, 6)),
+            "risk_distribution": risk_dist,
+            "top_rejected_codes": top_rejected_codes,
+            "status_breakdown": status_breakdown,
+        }
+
+    async def trends(self, db: AsyncSession, user_id: UUID, months: int, today: date) -> Optional[List[Dict[str, Any]]]:
+        """월별 청구 트렌드 (달력 월 기준). 청구가 없으면 None"""
+        starts = month_starts(today, months)
+        rows = await self._grouped_rollups(db, user_id, starts[0])
+        if rows is None or not any(r.r_claims for r in rows):
+            return None
+
+        trends = []
+        for bucket in self._monthly(rows, starts):
+            total = bucket["total_claims"]
+            trends.append({
+                **bucket,
+                "acceptance_rate": round(bucket["accepted"] / total * 100, 1) if total > 0 else 0,
+                "rejection_rate": round((bucket["rejected"] + bucket["partial"]) / total * 100, 1) if total > 0 else 0,
+            })
+        return trends
+
+
+# 전역 인스턴스
+claims_analytics_service = ClaimsAnalyticsService()
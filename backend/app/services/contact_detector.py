@@ -86,16 +86,51 @@ class ContactDetector:
     MASK_CHAR = "●"
     MASK_MESSAGE = "[연락처가 감지되어 숨김 처리되었습니다]"
 
+    # 유형별 트리거 — 각 패턴이 매칭되려면 반드시 포함하는 문자열 (대소문자 무시).
+    # 전체 트리거 정규식 1회로 대부분의 일반 메시지를 바로 통과시키고, 걸린 메시지만 해당 유형 패턴 실행
+    TRIGGERS = [
+        (r'0[1-6]|[공영][일이삼사오육칠팔구]|[영공일이삼사오육칠팔구]{10}', (ContactType.PHONE,)),
+        (r'@', (ContactType.EMAIL, ContactType.INSTAGRAM)),
+        (r'at|골뱅이', (ContactType.EMAIL,)),
+        (r'카카오|카톡|kakao|ktalk|플친|플러스친구', (ContactType.KAKAO,)),
+        (r'인스타|insta|ig', (ContactType.INSTAGRAM,)),
+        (r'http|www\.|\.(?:com|co\.kr|net|org|io)', (ContactType.URL,)),
+        (r'라인|line', (ContactType.LINE,)),
+    ]
+
+    _compiled: Optional[tuple] = None
+
+    @classmethod
+    def _compile(cls) -> tuple:
+        """패턴/트리거 컴파일 (클래스당 1회)"""
+        if cls.__dict__.get("_compiled") is None:
+            patterns = {
+                ContactType.PHONE: [re.compile(p, re.IGNORECASE) for p in cls.PHONE_PATTERNS],
+                ContactType.EMAIL: [re.compile(p, re.IGNORECASE) for p in cls.EMAIL_PATTERNS],
+                ContactType.KAKAO: [re.compile(p, re.IGNORECASE) for p in cls.KAKAO_PATTERNS],
+                ContactType.INSTAGRAM: [re.compile(p, re.IGNORECASE) for p in cls.INSTAGRAM_PATTERNS],
+                ContactType.URL: [re.compile(p, re.IGNORECASE) for p in cls.URL_PATTERNS],
+                ContactType.LINE: [re.compile(p, re.IGNORECASE) for p in cls.LINE_PATTERNS],
+            }
+            # 패턴과 같은 IGNORECASE로 원문에 적용 (소문자 변환은 'İ' 같은 문자를 패턴과 다르게 접어 놓침).
+            # 그룹으로 감싸지 않고 평탄한 선택지로 이어야 정규식 엔진의 첫 글자 사전 검사가 적용됨
+            any_trigger = re.compile("|".join(p for p, _ in cls.TRIGGERS), re.IGNORECASE)
+            triggers = [(re.compile(p, re.IGNORECASE), types) for p, types in cls.TRIGGERS]
+            cls._compiled = (patterns, any_trigger, triggers)
+        return cls._compiled
+
     def __init__(self):
-        # 모든 패턴 컴파일
-        self.patterns = {
-            ContactType.PHONE: [re.compile(p, re.IGNORECASE) for p in self.PHONE_PATTERNS],
-            ContactType.EMAIL: [re.compile(p, re.IGNORECASE) for p in self.EMAIL_PATTERNS],
-            ContactType.KAKAO: [re.compile(p, re.IGNORECASE) for p in self.KAKAO_PATTERNS],
-            ContactType.INSTAGRAM: [re.compile(p, re.IGNORECASE) for p in self.INSTAGRAM_PATTERNS],
-            ContactType.URL: [re.compile(p, re.IGNORECASE) for p in self.URL_PATTERNS],
-            ContactType.LINE: [re.compile(p, re.IGNORECASE) for p in self.LINE_PATTERNS],
-        }
+        self.patterns, self._any_trigger, self._triggers = self._compile()
+
+    def _triggered_types(self, content: str) -> set:
+        """내용에 트리거가 있는 연락처 유형"""
+        if not self._any_trigger.search(content):
+            return set()
+        types = set()
+        for trigger, trigger_types in self._triggers:
+            if trigger.search(content):
+                types.update(trigger_types)
+        return types
 
     def detect_and_filter(self, content: str) -> DetectionResult:
         """
@@ -116,40 +151,77 @@ class ContactDetector:
                 patterns_found=[]
             )
 
-        filtered_content = content
-        patterns_found = []
-        first_contact_type = None
-        first_original_value = None
+        triggered = self._triggered_types(content)
+        if not triggered:
+            return DetectionResult(
+                detected=False,
+                contact_type=None,
+                original_value=None,
+                filtered_content=content,
+                patterns_found=[]
+            )
 
-        # 각 패턴 유형별로 검사
+        # 유형/패턴 우선순위 순서로 원문에서 매칭 수집.
+        # 앞선 매칭과 겹치는 매칭은 겹치지 않는 나머지 부분만 전체 마스킹 (이미 마스킹된 부분은 그대로),
+        # 앞선 매칭에 완전히 덮이는 매칭은 기존처럼 탐지 목록에서 제외
+        patterns_found = []
+        pieces = []  # (시작, 끝, 유형, 전체 마스킹 여부)
+        first_match = None
         for contact_type, pattern_list in self.patterns.items():
+            if contact_type not in triggered:
+                continue
             for pattern in pattern_list:
-                matches = pattern.finditer(filtered_content)
-                for match in matches:
-                    original_value = match.group()
-
-                    # 첫 번째 탐지 결과 저장
-                    if first_contact_type is None:
-                        first_contact_type = contact_type
-                        first_original_value = original_value
-
+                for match in pattern.finditer(content):
+                    start, end = match.span()
+                    overlaps = sorted((p_start, p_end) for p_start, p_end, _, _ in pieces if p_start < end and start < p_end)
+                    if not overlaps:
+                        new_pieces = [(start, end, contact_type, False)]
+                    else:
+                        new_pieces = []
+                        cursor = start
+                        for p_start, p_end in overlaps:
+                            if cursor < p_start:
+                                new_pieces.append((cursor, p_start, contact_type, True))
+                            cursor = max(cursor, p_end)
+                        if cursor < end:
+                            new_pieces.append((cursor, end, contact_type, True))
+                    if not new_pieces:
+                        continue
+                    pieces.extend(new_pieces)
+                    if first_match is None:
+                        first_match = (contact_type, match.group())
                     patterns_found.append({
                         "type": contact_type.value,
-                        "value": self._partial_mask(original_value),
-                        "position": match.span()
+                        "value": self._partial_mask(match.group()),
+                        "position": (start, end),
                     })
 
-                    # 마스킹 처리
-                    masked_value = self._mask_value(original_value, contact_type)
-                    filtered_content = filtered_content.replace(original_value, masked_value, 1)
+        if first_match is None:
+            return DetectionResult(
+                detected=False,
+                contact_type=None,
+                original_value=None,
+                filtered_content=content,
+                patterns_found=[]
+            )
 
-        detected = len(patterns_found) > 0
+        # 마스킹 결과는 위치 순으로 한 번에 조립
+        parts = []
+        cursor = 0
+        for start, end, contact_type, full in sorted(pieces, key=lambda piece: piece[0]):
+            parts.append(content[cursor:start])
+            if full:
+                parts.append(self.MASK_CHAR * (end - start))
+            else:
+                parts.append(self._mask_value(content[start:end], contact_type))
+            cursor = end
+        parts.append(content[cursor:])
 
         return DetectionResult(
-            detected=detected,
-            contact_type=first_contact_type,
-            original_value=first_original_value,
-            filtered_content=filtered_content if detected else content,
+            detected=True,
+            contact_type=first_match[0],
+            original_value=first_match[1],
+            filtered_content="".join(parts),
             patterns_found=patterns_found
         )
 
@@ -185,7 +257,12 @@ class ContactDetector:
 
     def check_only(self, content: str) -> bool:
         """연락처 포함 여부만 확인 (마스킹 없이)"""
-        for pattern_list in self.patterns.values():
+        if not content:
+            return False
+        triggered = self._triggered_types(content)
+        for contact_type, pattern_list in self.patterns.items():
+            if contact_type not in triggered:
+                continue
             for pattern in pattern_list:
                 if pattern.search(content):
                     return True
@@ -0,0 +1,334 @@
+"""
+DUR (Drug Utilization Review) 규칙 인덱스
+
+처방마다 약물 쌍 × 상호작용 레코드를 전부 대조하던 방식을 미리 컴파일한 인덱스 조회로 대체
+- 상호작용: 순서 없는 약물 쌍(frozenset) → 레코드 목록 해시맵 (쌍당 O(1))
+- 연령 금기: 약물 코드 접두사 트라이 (코드 길이만큼만 탐색)
+- 중복 처방: 약물 코드 → 성분군 역방향 맵
+- drug_interactions 전체를 한 번 읽어 컴파일, sync_drug_interactions가 Redis 버전 키를 올리면
+  각 프로세스가 VERSION_CHECK_INTERVAL 안에 감지해 다시 컴파일 (Redis 장애 시 MAX_AGE 경과 후)
+
+Usage:
+    warnings, is_demo = await dur_engine.check(db, drug_codes, patient_age)
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.redis import get_redis, mark_unavailable
+from ..models.dur_check import DrugInteraction
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "dur:rules:version"
+# Redis 버전 확인 주기 (초)
+VERSION_CHECK_INTERVAL = 30.0
+# 버전 확인이 안 될 때 인덱스 최대 수명 (초)
+MAX_AGE = 3600.0
+
+
+# 데모 약물 상호작용 데이터
+DEMO_INTERACTIONS = [
+    {
+        "drug_code_a": "WARF001",
+        "drug_code_b": "ASPR001",
+        "interaction_type": "MAJOR",
+        "severity": "CRITICAL",
+        "description": "와파린(Warfarin)과 아스피린(Aspirin) 병용 시 출혈 위험 증가",
+        "mechanism": "혈소판 기능 억제와 항응고 작용 중복",
+        "clinical_effect": "중대 출혈, 소화관 출혈 위험 3배 이상 증가",
+        "management": "가능하면 병용 회피. 불가피할 경우 INR 모니터링 강화 및 위장관 보호제 투여",
+    },
+    {
+        "drug_code_a": "METO001",
+        "drug_code_b": "VERA001",
+        "interaction_type": "CONTRAINDICATED",
+        "severity": "CONTRAINDICATED",
+        "description": "메토프롤롤(Metoprolol)과 베라파밀(Verapamil) 병용 금기",
+        "mechanism": "이중 AV전도 억제: 심각한 서맥 및 심차단 유발",
+        "clinical_effect": "서맥, 심차단, 심부전 악화",
+        "management": "절대 병용 금기. 대체 약물 선택 필요",
+    },
+    {
+        "drug_code_a": "CIPR001",
+        "drug_code_b": "THEO001",
+        "interaction_type": "MAJOR",
+        "severity": "WARNING",
+        "description": "시프로플록사신(Ciprofloxacin)과 테오필린(Theophylline) 병용 주의",
+        "mechanism": "CYP1A2 억제에 의한 테오필린 혈중 농도 상승",
+        "clinical_effect": "테오필린 독성 (구역, 구토, 경련, 부정맥)",
+        "management": "테오필린 용량 50% 감량 또는 대체 항균제 사용",
+    },
+    {
+        "drug_code_a": "KETO001",
+        "drug_code_b": "STAT001",
+        "interaction_type": "MAJOR",
+        "severity": "CRITICAL",
+        "description": "케토코나졸(Ketoconazole)과 심바스타틴(Simvastatin) 병용 금기",
+        "mechanism": "CYP3A4 억제에 의한 스타틴 혈중 농도 현저히 상승",
+        "clinical_effect": "횡문근 융해증 위험 현저히 증가",
+        "management": "절대 병용 금기. 대체 항진균제 또는 대체 스타틴 선택",
+    },
+    {
+        "drug_code_a": "SSRI001",
+        "drug_code_b": "MAOI001",
+        "interaction_type": "CONTRAINDICATED",
+        "severity": "CONTRAINDICATED",
+        "description": "SSRI와 MAO 억제제 병용 절대 금기",
+        "mechanism": "세로토닌 과잉 축적",
+        "clinical_effect": "세로토닌 증후군 (고열, 경련, 사망 가능)",
+        "management": "절대 병용 금기. 최소 14일 세척 기간 필요",
+    },
+]
+
+# 연령 금기 규칙
+AGE_CONTRAINDICATIONS = [
+    {"drug_pattern": "ASPR", "min_age": None, "max_age": 18, "severity": "CRITICAL", "reason": "18세 미만 아스피린 투여 시 라이 증후군 위험"},
+    {"drug_pattern": "TETR", "min_age": None, "max_age": 8, "severity": "WARNING", "reason": "8세 미만 테트라사이클린 투여 시 치아 착색 및 골 성장 억제"},
+    {"drug_pattern": "FLUO", "min_age": None, "max_age": 18, "severity": "WARNING", "reason": "18세 미만 플루오로퀴놀론 투여 시 연골 손상 가능"},
+    {"drug_pattern": "METP", "min_age": 65, "max_age": None, "severity": "WARNING", "reason": "65세 이상 메트포르민 투여 시 신기능 평가 필요 (젖산산증 위험)"},
+]
+
+# 중복 처방 규칙 (성분군)
+DUPLICATE_GROUPS = {
+    "NSAID": ["IBUP001", "NAPR001", "DICL001", "MELO001", "CELE001"],
+    "PPI": ["OMEP001", "LANS001", "RABE001", "ESOP001", "PANT001"],
+    "STATIN": ["STAT001", "ATOR001", "ROSA001", "PITA001"],
+    "ACEi": ["ENAL001", "RAMI001", "LISP001", "PERI001"],
+    "ARB": ["LOSA001", "VALS001", "CAND001", "IRBE001", "TELE001"],
+}
+
+SEVERITY_ORDER = ["INFO", "WARNING", "CRITICAL", "CONTRAINDICATED"]
+
+
+@dataclass(frozen=True)
+class InteractionRule:
+    """상호작용 경고에 필요한 필드"""
+    severity: str
+    description: str
+    management: Optional[str]
+
+
+PairKey = FrozenSet[str]
+
+
+def _pair_map(records: List[Tuple[str, str, InteractionRule]]) -> Dict[PairKey, List[InteractionRule]]:
+    pairs: Dict[PairKey, List[InteractionRule]] = {}
+    for code_a, code_b, rule in records:
+        pairs.setdefault(frozenset((code_a, code_b)), []).append(rule)
+    return pairs
+
+
+def _age_trie(rules: List[dict]) -> dict:
+    """접두사 트라이 — 노드의 None 키에 그 접두사로 끝나는 규칙 인덱스 목록"""
+    root: dict = {}
+    for idx, rule in enumerate(rules):
+        node = root
+        for ch in rule["drug_pattern"]:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append(idx)
+    return root
+
+
+def _prefix_matches(trie: dict, code: str) -> List[int]:
+    matches: List[int] = []
+    node = trie
+    for ch in code:
+        node = node.get(ch)
+        if node is None:
+            break
+        matches.extend(node.get(None, ()))
+    return matches
+
+
+class DURRuleIndex:
+    """컴파일된 DUR 규칙 (읽기 전용 — 교체만 함)"""
+
+    def __init__(self, db_records: List[Tuple[str, str, InteractionRule]]):
+        self.db_pairs = _pair_map(db_records)
+        self.db_codes = {code for code_a, code_b, _ in db_records for code in (code_a, code_b)}
+        self.demo_pairs = _pair_map([
+            (d["drug_code_a"], d["drug_code_b"], InteractionRule(d["severity"], d["description"], d["management"]))
+            for d in DEMO_INTERACTIONS
+        ])
+        self.age_rules = AGE_CONTRAINDICATIONS
+        self.age_trie = _age_trie(AGE_CONTRAINDICATIONS)
+        self.group_order = {name: i for i, name in enumerate(DUPLICATE_GROUPS)}
+        self.code_groups: Dict[str, List[str]] = {}
+        for group_name, group_codes in DUPLICATE_GROUPS.items():
+            for code in group_codes:
+                self.code_groups.setdefault(code, []).append(group_name)
+
+    def uses_db(self, drug_codes: List[str]) -> bool:
+        """처방 약물 중 하나라도 DB 상호작용에 있으면 DB 데이터, 아니면 데모 데이터 사용"""
+        return any(code in self.db_codes for code in drug_codes)
+
+    def drug_interactions(self, drug_codes: List[str], use_db: bool) -> List[dict]:
+        """약물 상호작용 확인 — 약물 쌍마다 해시 조회"""
+        pairs = self.db_pairs if use_db else self.demo_pairs
+        warnings = []
+        for i in range(len(drug_codes)):
+            code_a = drug_codes[i]
+            for j in range(i + 1, len(drug_codes)):
+                code_b = drug_codes[j]
+                for rule in pairs.get(frozenset((code_a, code_b)), ()):
+                    warnings.append({
+                        "check_type": "DRUG_DRUG",
+                        "severity": rule.severity,
+                        "drug_codes": [code_a, code_b],
+                        "message": rule.description,
+                        "management": rule.management,
+                    })
+        return warnings
+
+    def age_contraindications(self, drug_codes: List[str], patient_age: Optional[int]) -> List[dict]:
+        """연령 금기 확인 — 코드별 트라이 탐색 (규칙 순서 유지)"""
+        if patient_age is None:
+            return []
+        hits = sorted(
+            (rule_idx, code_idx)
+            for code_idx, code in enumerate(drug_codes)
+            for rule_idx in _prefix_matches(self.age_trie, code)
+        )
+        warnings = []
+        for rule_idx, code_idx in hits:
+            rule = self.age_rules[rule_idx]
+            warning = {
+                "check_type": "DRUG_AGE",
+                "severity": rule["severity"],
+                "drug_codes": [drug_codes[code_idx]],
+                "message": rule["reason"],
+                "patient_age": patient_age,
+            }
+            if rule["max_age"] is not None and patient_age <= rule["max_age"]:
+                warnings.append(warning)
+            if rule["min_age"] is not None and patient_age >= rule["min_age"]:
+                warnings.append(dict(warning))
+        return warnings
+
+    def duplicates(self, drug_codes: List[str]) -> List[dict]:
+        """중복 처방 확인 — 코드 → 성분군 역방향 조회"""
+        found: Dict[str, List[str]] = {}
+        for code in drug_codes:
+            for group_name in self.code_groups.get(code, ()):
+                found.setdefault(group_name, []).append(code)
+        warnings = []
+        for group_name in sorted(found, key=self.group_order.__getitem__):
+            codes = found[group_name]
+            if len(codes) >= 2:
+                warnings.append({
+                    "check_type": "DUPLICATE",
+                    "severity": "WARNING",
+                    "drug_codes": codes,
+                    "message": f"{group_name} 계열 중복 처방 ({len(codes)}종): {', '.join(codes)}",
+                })
+        return warnings
+
+    def check(self, drug_codes: List[str], patient_age: Optional[int]) -> Tuple[List[dict], bool]:
+        """전체 DUR 체크 → (경고 목록, 데모 데이터 사용 여부)"""
+        use_db = self.uses_db(drug_codes)
+        warnings = self.drug_interactions(drug_codes, use_db)
+        warnings.extend(self.age_contraindications(drug_codes, patient_age))
+        warnings.extend(self.duplicates(drug_codes))
+        return warnings, not use_db
+
+
+def overall_severity(warnings: List[dict]) -> str:
+    """경고 목록의 최고 심각도 (경고 없으면 PASS)"""
+    if not warnings:
+        return "PASS"
+    return max((w["severity"] for w in warnings), key=SEVERITY_ORDER.index)
+
+
+class DUREngine:
+    """DUR 규칙 인덱스 로더 (프로세스당 1개, 버전 변경 시 재컴파일)"""
+
+    def __init__(self):
+        self._index: Optional[DURRuleIndex] = None
+        self._version: Optional[str] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+    async def _is_stale(self) -> bool:
+        now = time.monotonic()
+        if self._index is None:
+            return True
+        if now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+
+        redis = get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(VERSION_KEY)
+                return (raw.decode() if raw else "0") != self._version
+            except Exception as e:
+                mark_unavailable(e)
+        return now - self._loaded_at > MAX_AGE
+
+    async def _load(self, db: AsyncSession) -> DURRuleIndex:
+        version = None
+        redis = get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(VERSION_KEY)
+                version = raw.decode() if raw else "0"
+            except Exception as e:
+                mark_unavailable(e)
+
+        started = time.perf_counter()
+        result = await db.execute(
+            select(
+                DrugInteraction.drug_code_a,
+                DrugInteraction.drug_code_b,
+                DrugInteraction.severity,
+                DrugInteraction.description,
+                DrugInteraction.management,
+            )
+        )
+        records = [
+            (r.drug_code_a, r.drug_code_b, InteractionRule(r.severity.value, r.description, r.management))
+            for r in result
+        ]
+        index = DURRuleIndex(records)
+        logger.info(
+            f"DUR rule index compiled: {len(records)} interactions, version {version} "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+        self._index = index
+        self._version = version
+        self._loaded_at = self._checked_at = time.monotonic()
+        return index
+
+    async def get_index(self, db: AsyncSession) -> DURRuleIndex:
+        if await self._is_stale():
+            return await self._load(db)
+        return self._index
+
+    async def check(
+        self, db: AsyncSession, drug_codes: List[str], patient_age: Optional[int],
+    ) -> Tuple[List[dict], bool]:
+        index = await self.get_index(db)
+        return index.check(drug_codes, patient_age)
+
+    def invalidate(self):
+        self._index = None
+
+    async def bump_version(self):
+        """drug_interactions 변경 후 호출 (sync_drug_interactions) — 모든 프로세스의 인덱스 재컴파일"""
+        self.invalidate()
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.incr(VERSION_KEY)
+        except Exception as e:
+            mark_unavailable(e)
+
+
+# 전역 인스턴스
+dur_engine = DUREngine()
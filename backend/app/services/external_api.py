@@ -1,10 +1,13 @@
 import asyncio
-import httpx
 import math
 import random
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 from ..core.config import settings
+from ..core.geo import annotate_distances
+from ..core.http_client import pooled_client
+from ..core.rate_limit import cache
+from ..core.tiered_cache import tiered_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -133,6 +136,38 @@ def _estimate_demographics_from_coords(
 
 
 
+# 진료과목명 → HIRA 진료과목 코드 (dgsbjtCd)
+CLINIC_CODES: Dict[str, str] = {
+    "내과": "01",
+    "소아청소년과": "11",
+    "정신건강의학과": "03",
+    "외과": "04",
+    "정형외과": "05",
+    "신경외과": "06",
+    "흉부외과": "07",
+    "성형외과": "08",
+    "마취통증의학과": "09",
+    "산부인과": "10",
+    "안과": "12",
+    "이비인후과": "13",
+    "피부과": "14",
+    "비뇨의학과": "15",
+    "영상의학과": "16",
+    "방사선종양학과": "17",
+    "병리과": "18",
+    "진단검사의학과": "19",
+    "결핵과": "20",
+    "재활의학과": "21",
+    "핵의학과": "22",
+    "가정의학과": "23",
+    "응급의학과": "24",
+    "직업환경의학과": "25",
+    "예방의학과": "26",
+    "치과": "49",
+    "한방과": "80",
+}
+
+
 class ExternalAPIService:
     """외부 API 연동 서비스"""
 
@@ -168,21 +203,34 @@ class ExternalAPIService:
                 return inner
         return []
 
-    @staticmethod
-    def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """두 좌표 간 거리(m) 계산 — Haversine 공식"""
-        R = 6371000
-        phi1, phi2 = math.radians(lat1), math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlam = math.radians(lon2 - lon1)
-        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
-        return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
     async def _fetch_hira_hospitals(
         self,
         region_code: str,
         clinic_type: Optional[str] = None,
         num_of_rows: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """심평원 지역 병원 목록 — HIRA (sido, sggu, dgsbjtCd) 단위로 2단 캐시.
+
+        같은 구의 법정동들은 같은 HIRA 코드로 모이므로 동시 시뮬레이션이 1회 호출을 공유한다.
+        """
+        from ..data.hira_region_codes import haeng_to_hira_codes
+
+        sido_cd, sggu_cd = haeng_to_hira_codes(region_code) if region_code and len(region_code) >= 2 else ("", "")
+        if not sido_cd:
+            return await self._fetch_hira_hospitals_uncached(region_code, clinic_type, num_of_rows)
+
+        dgsbjt_cd = self._get_clinic_code(clinic_type) if clinic_type else "-"
+        return await tiered_cache.get_or_fetch(
+            "hira_hospitals",
+            f"{sido_cd}:{sggu_cd or 'all'}:{dgsbjt_cd}:{num_of_rows}",
+            lambda: self._fetch_hira_hospitals_uncached(region_code, clinic_type, num_of_rows),
+        )
+
+    async def _fetch_hira_hospitals_uncached(
+        self,
+        region_code: str,
+        clinic_type: Optional[str] = None,
+        num_of_rows: int = 1000,
         _retry_without_dgsbjt: bool = False,
     ) -> List[Dict[str, Any]]:
         """
@@ -207,7 +255,7 @@ class ExternalAPIService:
         effective_rows = num_of_rows if sggu_cd else max(num_of_rows, 10000)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params: Dict[str, Any] = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "sidoCd": sido_cd,
@@ -241,7 +289,7 @@ class ExternalAPIService:
                     logger.info(
                         f"HIRA dgsbjtCd 필터 0건 응답 → 무필터로 재시도 (이름·종별 매칭으로 폴백)"
                     )
-                    return await self._fetch_hira_hospitals(
+                    return await self._fetch_hira_hospitals_uncached(
                         region_code, clinic_type, num_of_rows,
                         _retry_without_dgsbjt=True,
                     )
@@ -257,7 +305,7 @@ class ExternalAPIService:
             # 진료과 필터에서만 실패한 경우 dgsbjtCd 빼고 재시도
             if clinic_type and not _retry_without_dgsbjt:
                 logger.info(f"HIRA dgsbjtCd 호출 실패 → 무필터로 재시도 (이름·종별 매칭으로 폴백)")
-                return await self._fetch_hira_hospitals(
+                return await self._fetch_hira_hospitals_uncached(
                     region_code, clinic_type, num_of_rows,
                     _retry_without_dgsbjt=True,
                 )
@@ -275,33 +323,30 @@ class ExternalAPIService:
 
         HIRA는 dgsbjtCd 필터로 호출 시 응답에 dgsbjtCdNm을 포함하지 않음.
         따라서 clinic_type 필터 사용 시 모든 결과를 해당 진료과로 표시.
+
+        야간 스냅샷(hira_institutions)이 준비돼 있으면 로컬 격자 인덱스로 바로 응답.
         """
+        from .hira_snapshot import hira_snapshot_service
+
+        local = await hira_snapshot_service.find_hospitals_within(latitude, longitude, radius_m, clinic_type)
+        if local is not None:
+            return local
+
         hospitals = await self._fetch_hira_hospitals(region_code, clinic_type)
 
-        # 좌표 기반 거리 계산 및 반경 필터
-        nearby = []
-        for h in hospitals:
-            h_lat = h.get("latitude", 0)
-            h_lng = h.get("longitude", 0)
-            if h_lat == 0 or h_lng == 0:
-                continue
-            dist = self._haversine(latitude, longitude, h_lat, h_lng)
-            h["distance"] = round(dist)
+        # 좌표 기반 거리 계산 및 반경 필터 (벡터화, 거리순)
+        nearby = annotate_distances(latitude, longitude, hospitals, radius_m=radius_m)
+        for h in nearby:
             # HIRA가 dgsbjtCd 필터로 정상 응답한 경우만 = 해당 진료과 의원으로 라벨링
             # 폴백 경로(_dgsbjt_filtered=False)는 전체 의원이라 이름 매칭으로 처리
             if clinic_type and not h.get("clinic_type") and h.get("_dgsbjt_filtered"):
                 h["clinic_type"] = clinic_type
-            if dist <= radius_m:
-                nearby.append(h)
-
-        # 거리순 정렬
-        nearby.sort(key=lambda x: x.get("distance", 9999))
         return nearby
 
     async def get_building_info(self, address: str) -> Optional[Dict[str, Any]]:
         """건축물대장 정보 조회 (국토교통부 API)"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 # First, get coordinates from address
                 coords = await self.geocode_address(address)
                 if not coords:
@@ -337,7 +382,7 @@ class ExternalAPIService:
     ) -> Dict[str, Any]:
         """상권 정보 조회 (소상공인진흥공단 API)"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": settings.COMMERCIAL_API_KEY,
                     "cx": str(longitude),
@@ -363,7 +408,7 @@ class ExternalAPIService:
     ) -> Dict[str, Any]:
         """유동인구 데이터 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": settings.COMMERCIAL_API_KEY,
                     "divId": "adongCd",
@@ -398,7 +443,7 @@ class ExternalAPIService:
         }
         result: Dict[str, int] = {}
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("kakao") as client:
                 headers = {"Authorization": f"KakaoAK {settings.KAKAO_MAP_API_KEY}"}
                 for key, code in categories.items():
                     params = {
@@ -436,7 +481,7 @@ class ExternalAPIService:
     ) -> List[Dict[str, Any]]:
         """카카오 키워드 검색으로 반경 내 시설 상세 (이름/거리/주소 포함)."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("kakao") as client:
                 headers = {"Authorization": f"KakaoAK {settings.KAKAO_MAP_API_KEY}"}
                 params = {
                     "query": keyword,
@@ -495,7 +540,7 @@ class ExternalAPIService:
         results: List[Dict[str, Any]] = []
         seen_ids = set()
 
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("kakao") as client:
             headers = {"Authorization": f"KakaoAK {settings.KAKAO_MAP_API_KEY}"}
             for query in queries:
                 for page in range(1, 4):  # 최대 45건 (3페이지 × 15)
@@ -580,7 +625,7 @@ class ExternalAPIService:
             "apartments":         ("아파트", 500, 5),          # 주거 환자
         }
         results: Dict[str, Any] = {}
-        async with httpx.AsyncClient() as client:
+        async with pooled_client("kakao") as client:
             headers = {"Authorization": f"KakaoAK {settings.KAKAO_MAP_API_KEY}"}
             for key, (kw, radius, size) in keywords.items():
                 try:
@@ -624,7 +669,7 @@ class ExternalAPIService:
     async def reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
         """좌표 → 주소 변환 (카카오 API)"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("kakao") as client:
                 headers = {"Authorization": f"KakaoAK {settings.KAKAO_MAP_API_KEY}"}
                 params = {"x": str(longitude), "y": str(latitude)}
 
@@ -659,7 +704,7 @@ class ExternalAPIService:
     async def geocode_address(self, address: str) -> Optional[Dict[str, Any]]:
         """주소 → 좌표 변환 (카카오 API)"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("kakao") as client:
                 headers = {"Authorization": f"KakaoAK {settings.KAKAO_MAP_API_KEY}"}
                 params = {"query": address}
 
@@ -736,7 +781,7 @@ class ExternalAPIService:
 
         for url in candidate_urls:
             try:
-                async with httpx.AsyncClient() as client:
+                async with pooled_client("data_go_kr") as client:
                     response = await client.get(url, params=params, timeout=15.0)
                     response.raise_for_status()
                     data = response.json()
@@ -804,7 +849,7 @@ class ExternalAPIService:
         ym = _get_recent_ym()
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": api_key,
                     "stdgCd": stdg_cd,
@@ -875,7 +920,7 @@ class ExternalAPIService:
         ym = _get_recent_ym()
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": api_key,
                     "stdgCd": stdg_cd,
@@ -1042,7 +1087,11 @@ class ExternalAPIService:
         # 1) 행안부 통합 API 우선 (admmPpltnHhStus — 인구+세대+연령 한 번에)
         if _get_mois_key() and stdg_cd:
             try:
-                unified = await self._get_mois_admm_unified(stdg_cd)
+                unified = await tiered_cache.get_or_fetch(
+                    "mois_demographics",
+                    f"admm:{stdg_cd}:{_get_recent_ym()}",
+                    lambda: self._get_mois_admm_unified(stdg_cd),
+                )
                 if unified and unified.get("total_population", 0) > 0:
                     hh_inline = {
                         "total_population": unified["total_population"],
@@ -1062,9 +1111,16 @@ class ExternalAPIService:
         # 2) 구 API (stdgSexdAgePpltn + stdgPpltnHhStus) — 별도 활용신청 시
         if _get_mois_key() and stdg_cd:
             try:
+                ym = _get_recent_ym()
                 age_result, hh_result = await asyncio.gather(
-                    self._get_mois_age_population(stdg_cd),
-                    self._get_mois_household(stdg_cd),
+                    tiered_cache.get_or_fetch(
+                        "mois_demographics", f"age:{stdg_cd}:{ym}",
+                        lambda: self._get_mois_age_population(stdg_cd),
+                    ),
+                    tiered_cache.get_or_fetch(
+                        "mois_demographics", f"hh:{stdg_cd}:{ym}",
+                        lambda: self._get_mois_household(stdg_cd),
+                    ),
                     return_exceptions=True,
                 )
 
@@ -1085,6 +1141,15 @@ class ExternalAPIService:
                 logger.warning(f"MOIS legacy API failed, falling back to estimation: {e}")
 
         # 2) 폴백: 좌표 기반 추정 모델
+        return self.estimate_demographics(latitude, longitude, radius_m)
+
+    def estimate_demographics(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: int = 1000,
+    ) -> Dict[str, Any]:
+        """좌표 기반 인구통계 추정 (행안부 API 실패/타임아웃 시 폴백)"""
         try:
             result = _estimate_demographics_from_coords(latitude, longitude, radius_m)
             result["female_ratio"] = round(1.0 - result["male_ratio"], 2)
@@ -1096,36 +1161,7 @@ class ExternalAPIService:
 
     def _get_clinic_code(self, clinic_type: str) -> str:
         """진료과목명을 코드로 변환"""
-        clinic_codes = {
-            "내과": "01",
-            "소아청소년과": "11",
-            "정신건강의학과": "03",
-            "외과": "04",
-            "정형외과": "05",
-            "신경외과": "06",
-            "흉부외과": "07",
-            "성형외과": "08",
-            "마취통증의학과": "09",
-            "산부인과": "10",
-            "안과": "12",
-            "이비인후과": "13",
-            "피부과": "14",
-            "비뇨의학과": "15",
-            "영상의학과": "16",
-            "방사선종양학과": "17",
-            "병리과": "18",
-            "진단검사의학과": "19",
-            "결핵과": "20",
-            "재활의학과": "21",
-            "핵의학과": "22",
-            "가정의학과": "23",
-            "응급의학과": "24",
-            "직업환경의학과": "25",
-            "예방의학과": "26",
-            "치과": "49",
-            "한방과": "80",
-        }
-        return clinic_codes.get(clinic_type, "01")
+        return CLINIC_CODES.get(clinic_type, "01")
 
     def _parse_hospital_data(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """병원 데이터 파싱.
@@ -1170,7 +1206,7 @@ class ExternalAPIService:
             - patient_count: 환자 수
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "ykiho": ykiho,
@@ -1201,6 +1237,59 @@ class ExternalAPIService:
             logger.error(f"Failed to get hospital billing stats: {e}")
             return None
 
+    async def get_hospital_billing_stats_batch(
+        self,
+        ykihos: List[str],
+        concurrency: Optional[int] = None,
+        budget_seconds: Optional[float] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 병원의 청구 통계를 동시성 제한 하에 일괄 조회
+
+        - ykiho별 성공 결과는 캐시 (HIRA_BILLING_CACHE_TTL). 실패/빈 응답은 구분이 안 돼 캐시하지 않음
+        - budget_seconds 안에 끝나지 않은 조회는 취소하고 결과에서 제외
+          → 호출자가 _estimate_revenue_from_size로 대체
+
+        Returns:
+            {ykiho: billing dict 또는 None(청구 데이터 없음)} — 예산 초과분은 키 없음
+        """
+        concurrency = concurrency or settings.HIRA_BILLING_CONCURRENCY
+        budget_seconds = budget_seconds or settings.HIRA_BILLING_BUDGET_SECONDS
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        to_fetch: List[str] = []
+        for ykiho in dict.fromkeys(ykihos):
+            cached_value = cache.get(f"hira:billing:{ykiho}")
+            if cached_value is not None:
+                results[ykiho] = cached_value
+            else:
+                to_fetch.append(ykiho)
+
+        if not to_fetch:
+            return results
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(ykiho: str):
+            async with semaphore:
+                billing = await self.get_hospital_billing_stats(ykiho)
+            results[ykiho] = billing
+            if billing:
+                cache.set(f"hira:billing:{ykiho}", billing, settings.HIRA_BILLING_CACHE_TTL)
+
+        tasks = [asyncio.create_task(fetch(ykiho)) for ykiho in to_fetch]
+        _, pending = await asyncio.wait(tasks, timeout=budget_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(
+                f"HIRA billing budget {budget_seconds}s exceeded: "
+                f"{len(pending)}/{len(to_fetch)} hospitals fall back to size estimate"
+            )
+
+        return results
+
     async def get_clinic_type_stats(
         self,
         region_code: str,
@@ -1218,7 +1307,7 @@ class ExternalAPIService:
         from ..data.hira_region_codes import haeng_to_hira_codes
         sido_cd_h, sggu_cd_h = haeng_to_hira_codes(region_code)
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "sidoCd": sido_cd_h,
@@ -1298,17 +1387,26 @@ class ExternalAPIService:
         radius_m: int = 1000,
         clinic_type: Optional[str] = None,
         region_code: str = "",
+        known_billing: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        """주변 병원 정보 + 매출 데이터 조회"""
+        """주변 병원 정보 + 매출 데이터 조회
+
+        known_billing: 미리 계산된 {ykiho: 청구통계} (시뮬레이션 기준값 번들). 여기 없는 병원만 조회
+        """
         hospitals = await self.get_nearby_hospitals(
             latitude, longitude, radius_m, clinic_type, region_code=region_code
         )
 
-        # 각 병원의 청구 데이터 조회
+        # 각 병원의 청구 데이터 조회 (동시성 제한 + 시간 예산, 초과분은 추정)
+        known_billing = known_billing or {}
+        billing_by_ykiho: Dict[str, Optional[Dict[str, Any]]] = dict(known_billing)
+        missing = [h["ykiho"] for h in hospitals if h.get("ykiho") and h["ykiho"] not in known_billing]
+        if missing:
+            billing_by_ykiho.update(await self.get_hospital_billing_stats_batch(missing))
         for hospital in hospitals:
             ykiho = hospital.get("ykiho")
             if ykiho:
-                billing = await self.get_hospital_billing_stats(ykiho)
+                billing = billing_by_ykiho.get(ykiho)
                 if billing:
                     hospital["billing_data"] = billing
                     hospital["est_monthly_revenue"] = billing.get("total_amount", 0)
@@ -1344,7 +1442,7 @@ class ExternalAPIService:
     ) -> List[Dict[str, Any]]:
         """지역별 병원 목록 조회 (심평원 API)"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params: Dict[str, Any] = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "sidoCd": sido_code,
@@ -1377,9 +1475,15 @@ class ExternalAPIService:
         longitude: float,
         radius_m: int = 500
     ) -> List[Dict[str, Any]]:
-        """주변 약국 정보 조회 (심평원 API)"""
+        """주변 약국 정보 조회 (로컬 스냅샷 우선, 없으면 심평원 API)"""
+        from .hira_snapshot import hira_snapshot_service
+
+        local = await hira_snapshot_service.find_pharmacies_within(latitude, longitude, radius_m)
+        if local is not None:
+            return local
+
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "xPos": str(longitude),
@@ -1425,7 +1529,7 @@ class ExternalAPIService:
     ) -> Optional[Dict[str, Any]]:
         """약국별 처방 통계 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "ykiho": ykiho,
@@ -1464,7 +1568,7 @@ class ExternalAPIService:
     ) -> List[Dict[str, Any]]:
         """지역별 약국 목록 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params: Dict[str, Any] = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "sidoCd": sido_code,
@@ -1508,7 +1612,7 @@ class ExternalAPIService:
         Returns: [{itemNm, midAmt(중앙값), maxAmt, minAmt}, ...]
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("data_go_kr") as client:
                 params: Dict[str, Any] = {
                     "serviceKey": settings.HIRA_API_KEY,
                     "_type": "json",
@@ -10,9 +10,9 @@
 """
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import math
 import logging
 
+from ..core.geo import annotate_distances
 from ..data.growth_reference import (
     CAC_BY_CLINIC, MARKETING_CHANNELS, PRICE_ELASTICITY,
     DOCTOR_DAILY_CAPACITY, RECOMMENDED_STAFF,
@@ -126,15 +126,11 @@ class GrowthToolsService:
             page_size=500,
         )
 
-        # 좌표 기반 필터링 (haversine)
-        nearby = []
-        for r in records:
-            if not r.get("lat") or not r.get("lng"):
-                continue
-            d = self._haversine(latitude, longitude, r["lat"], r["lng"])
-            if d <= radius_m:
-                r["distance_m"] = round(d)
-                nearby.append(r)
+        # 좌표 기반 필터링 (haversine, 벡터화)
+        nearby = annotate_distances(
+            latitude, longitude, records, radius_m=radius_m,
+            field="distance_m", lat_key="lat", lng_key="lng",
+        )
 
         # 진료과 필터 (biz_type에 진료과 포함되면 매칭)
         if clinic_type_filter:
@@ -689,14 +685,5 @@ class GrowthToolsService:
             {"tone": "편의", "copy": "예약 → 진료 → 처방까지 빠르고 정확하게."},
         ])
 
-    @staticmethod
-    def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        R = 6371000
-        phi1, phi2 = math.radians(lat1), math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlam = math.radians(lon2 - lon1)
-        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
-        return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
 
 growth_tools_service = GrowthToolsService()
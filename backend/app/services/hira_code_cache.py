@@ -0,0 +1,128 @@
+"""
+HIRA 수가코드 레지스트리 인프로세스 캐시 (버전 기반 read-through)
+
+레지스트리는 sync_hira_codes 때만 바뀌므로 코드별 조회 결과를 프로세스 메모리에 두고 재사용한다.
+- 캐시에 없는 코드만 IN 쿼리 1회로 조회 (없는 코드도 음성 캐시)
+- 동기화 태스크가 Redis 버전 키를 올리면 각 프로세스가 VERSION_CHECK_INTERVAL 안에 감지해 비움
+- Redis 장애 시에는 MAX_AGE 경과 후 비움 (버전 변경을 놓쳐도 최대 1시간)
+
+Usage:
+    fee_codes = await hira_fee_code_cache.get_many(db, ["AA154", "HA010"])
+    fee_codes["AA154"]  # FeeCodeInfo 또는 None (레지스트리에 없음)
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.redis import get_redis, mark_unavailable
+from ..models.hira_code import HIRAFeeCode
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "hira:fee_codes:version"
+# Redis 버전 확인 주기 (초) — 호출마다 Redis 왕복하지 않도록
+VERSION_CHECK_INTERVAL = 30.0
+# 버전 확인이 안 될 때 캐시 최대 수명 (초)
+MAX_AGE = 3600.0
+# 캐시 최대 코드 수 (수가코드 전체 규모 기준 여유)
+MAX_ENTRIES = 50000
+
+
+@dataclass(frozen=True)
+class FeeCodeInfo:
+    """파이프라인이 쓰는 수가코드 필드 (세션과 무관한 값 객체)"""
+    code: str
+    unit_price: int
+    insurance_type: str
+    max_frequency: Optional[int]
+    max_quantity: Optional[int]
+    is_active: bool
+
+
+class HiraFeeCodeCache:
+    """수가코드 레지스트리 캐시"""
+
+    def __init__(self):
+        self._entries: Dict[str, Optional[FeeCodeInfo]] = {}
+        self._version: Optional[str] = None
+        self._loaded_at = time.monotonic()
+        self._checked_at = 0.0
+        self.stats = {"hits": 0, "misses": 0, "queries": 0, "invalidations": 0}
+
+    def clear(self):
+        self._entries.clear()
+        self._loaded_at = time.monotonic()
+        self.stats["invalidations"] += 1
+
+    async def _check_version(self):
+        now = time.monotonic()
+        if now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+
+        version: Optional[str] = None
+        redis = get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(VERSION_KEY)
+                version = raw.decode() if raw else "0"
+            except Exception as e:
+                mark_unavailable(e)
+
+        if version is None:
+            if now - self._loaded_at > MAX_AGE:
+                self.clear()
+            return
+        if version != self._version:
+            if self._version is not None:
+                logger.info(f"HIRA fee code registry version {self._version} -> {version}, clearing cache")
+            self._version = version
+            self.clear()
+
+    async def get_many(self, db: AsyncSession, codes: Iterable[str]) -> Dict[str, Optional[FeeCodeInfo]]:
+        """코드 → FeeCodeInfo (없으면 None). 캐시 미스는 IN 쿼리 1회로 채움"""
+        await self._check_version()
+        wanted = set(codes)
+        found = {code: self._entries[code] for code in wanted if code in self._entries}
+        missing = wanted - found.keys()
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(missing)
+        if not missing:
+            return found
+
+        result = await db.execute(select(HIRAFeeCode).where(HIRAFeeCode.code.in_(missing)))
+        self.stats["queries"] += 1
+        fetched: Dict[str, Optional[FeeCodeInfo]] = dict.fromkeys(missing)
+        for fc in result.scalars():
+            fetched[fc.code] = FeeCodeInfo(
+                code=fc.code,
+                unit_price=fc.unit_price,
+                insurance_type=fc.insurance_type,
+                max_frequency=fc.max_frequency,
+                max_quantity=fc.max_quantity,
+                is_active=fc.is_active,
+            )
+        if len(self._entries) + len(fetched) > MAX_ENTRIES:
+            self.clear()
+        self._entries.update(fetched)
+        found.update(fetched)
+        return found
+
+    async def bump_version(self):
+        """레지스트리 변경 후 호출 (sync_hira_codes) — 모든 프로세스의 캐시 무효화"""
+        self.clear()
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            self._version = str(await redis.incr(VERSION_KEY))
+        except Exception as e:
+            mark_unavailable(e)
+
+
+# 전역 인스턴스
+hira_fee_code_cache = HiraFeeCodeCache()
@@ -0,0 +1,275 @@
+"""
+HIRA 코드 자동완성 검색
+
+- DB: 코드·명칭 컬럼의 GIN trigram 인덱스(pg_trgm)로 부분일치 검색 + 순위 정렬
+  · 코드 부분일치는 3자 이상만 (trigram이 없는 짧은 검색어는 사실상 전체 스캔)
+  · 명칭 부분일치는 2자부터 (한국어 2음절 검색어는 보통 한 단어 — "당뇨" → "제2형 당뇨병")
+  · 1자 검색어는 접두사 일치만
+  · 순위: 코드 완전일치 → 코드 접두사 → 명칭 접두사 → similarity() 내림차순 → 코드
+  · 2자 명칭 부분일치는 trigram이 없어 전체 스캔 — 메모리 인덱스가 꺼져 있을 때만 DB로 처리
+- 메모리: 코드 종류별 접두사/바이그램 인덱스 (2자 검색어도 바이그램 역색인으로 처리)
+  · 수가코드: HIRA_FEE_SEARCH_IN_MEMORY / 상병·약품코드: HIRA_CODE_SEARCH_IN_MEMORY
+  · 레지스트리 버전 키(hira:fee_codes:version)가 바뀌면 백그라운드에서 다시 빌드,
+    빌드 중에는 기존 인덱스 또는 DB 검색으로 응답
+
+Usage:
+    query = ranked_search(HIRAFeeCode, HIRAFeeCode.code, [HIRAFeeCode.name], q, limit)
+    rows = await fee_code_search_index.search(q, limit)  # 인덱스 준비 전이면 None
+    rows = await disease_code_search_index.search(q, limit)
+"""
+import asyncio
+import bisect
+import heapq
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.sql import Select
+
+from ..core.redis import get_redis, mark_unavailable
+from ..models.hira_code import HIRADiseaseCode, HIRADrugCode, HIRAFeeCode
+from .hira_code_cache import VERSION_CHECK_INTERVAL, VERSION_KEY
+
+logger = logging.getLogger(__name__)
+
+# 코드 부분일치 최소 길이 (미만은 코드 접두사만)
+MIN_SUBSTRING_LENGTH = 3
+# 명칭 부분일치 최소 길이 (미만은 명칭 접두사만)
+MIN_NAME_SUBSTRING_LENGTH = 2
+
+
+def like_escape(q: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프 (검색어의 %, _ 를 문자 그대로)"""
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def ranked_search(model, code_col, name_cols: Sequence[Any], q: str, limit: int) -> Select:
+    """활성 코드 중 코드/명칭 일치 검색 — trigram 인덱스 사용 + 순위 정렬"""
+    q = q.strip()
+    escaped = like_escape(q)
+    prefix = f"{escaped}%"
+    substring = f"%{escaped}%"
+    code_pattern = prefix if len(q) < MIN_SUBSTRING_LENGTH else substring
+    name_pattern = prefix if len(q) < MIN_NAME_SUBSTRING_LENGTH else substring
+    cols = [code_col, *name_cols]
+
+    rank = case(
+        (func.upper(code_col) == q.upper(), 0),
+        (code_col.ilike(prefix, escape="\\"), 1),
+        (or_(*(c.ilike(prefix, escape="\\") for c in name_cols)), 2),
+        else_=3,
+    )
+    similarity = func.greatest(*(func.similarity(c, q) for c in cols))
+    return (
+        select(model)
+        .where(
+            and_(
+                model.is_active == True,
+                or_(
+                    code_col.ilike(code_pattern, escape="\\"),
+                    *(c.ilike(name_pattern, escape="\\") for c in name_cols),
+                ),
+            )
+        )
+        .order_by(rank, similarity.desc(), code_col)
+        .limit(limit)
+    )
+
+
+def fee_code_dict(c) -> Dict[str, Any]:
+    """수가코드 검색 응답 항목"""
+    return {
+        "code": c.code,
+        "name": c.name,
+        "name_en": c.name_en,
+        "category": c.category,
+        "unit_price": c.unit_price,
+        "insurance_type": c.insurance_type,
+        "max_frequency": c.max_frequency,
+        "frequency_period_days": c.frequency_period_days,
+    }
+
+
+def disease_code_dict(c) -> Dict[str, Any]:
+    """상병코드 검색 응답 항목"""
+    return {
+        "code": c.code,
+        "name_kr": c.name_kr,
+        "name_en": c.name_en,
+        "chapter": c.chapter,
+        "is_chronic": c.is_chronic,
+        "is_rare": c.is_rare,
+        "common_procedures": c.common_procedures,
+    }
+
+
+def drug_code_dict(c) -> Dict[str, Any]:
+    """약품코드 검색 응답 항목"""
+    return {
+        "code": c.code,
+        "product_name": c.product_name,
+        "ingredient_name": c.ingredient_name,
+        "manufacturer": c.manufacturer,
+        "insurance_price": c.insurance_price,
+        "insurance_type": c.insurance_type,
+        "is_narcotic": c.is_narcotic,
+        "is_antibiotic": c.is_antibiotic,
+        "requires_monitoring": c.requires_monitoring,
+        "dosage_form": c.dosage_form,
+    }
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class CodeSearchIndex:
+    """
+    활성 HIRA 코드 메모리 검색 인덱스 (코드 종류별 인스턴스)
+
+    - 접두사: 정렬된 코드/명칭 목록 이분 탐색 (명칭 컬럼이 여러 개면 모두 한 목록에)
+    - 부분일치: 코드·명칭 바이그램 → 행 번호 역색인, 가장 짧은 목록부터 교집합 후 문자열 확인
+    - 순위는 DB 검색과 같은 구간(코드 완전일치/코드 접두사/명칭 접두사/부분일치) 후
+      similarity 대신 첫 명칭 길이 (부분일치 후보끼리는 짧을수록 유사도가 높음) — 빌드 때 미리 계산
+    """
+
+    def __init__(self, model, name_fields: Sequence[str], row_dict: Callable[[Any], Dict[str, Any]]):
+        self.model = model
+        self.name_fields = tuple(name_fields)
+        self.row_dict = row_dict
+        self._rows: List[Dict[str, Any]] = []
+        self._codes: List[tuple] = []   # (대문자 코드, 행 번호) 정렬
+        self._names: List[tuple] = []   # (소문자 명칭, 행 번호) 정렬
+        self._grams: Dict[str, List[int]] = {}
+        self._tiebreak: List[int] = []
+        self._ready = False
+        self._version: Optional[str] = None
+        self._checked_at = float("-inf")
+        self._building: Optional[asyncio.Task] = None
+
+    def _row_names(self, row: Dict[str, Any]) -> List[str]:
+        return [(row[field] or "").lower() for field in self.name_fields]
+
+    def _build(self, rows: List[Dict[str, Any]]) -> tuple:
+        rows = sorted(rows, key=lambda r: r["code"])
+        grams: Dict[str, List[int]] = {}
+        names = []
+        for idx, row in enumerate(rows):
+            row_names = self._row_names(row)
+            row_grams = _bigrams(row["code"].lower())
+            for name in row_names:
+                if name:
+                    row_grams |= _bigrams(name)
+                    names.append((name, idx))
+            for gram in row_grams:
+                grams.setdefault(gram, []).append(idx)
+        codes = sorted((r["code"].upper(), i) for i, r in enumerate(rows))
+        names.sort()
+        # 구간 내 순위: 첫 명칭 짧은 순 → 코드 (행 번호 → 순위 값)
+        first = self.name_fields[0]
+        tiebreak = [0] * len(rows)
+        for rank, i in enumerate(sorted(range(len(rows)), key=lambda i: (len(rows[i][first] or ""), rows[i]["code"]))):
+            tiebreak[i] = rank
+        return rows, codes, names, grams, tiebreak
+
+    async def _load(self, version: Optional[str]):
+        from ..core.database import async_session
+
+        started = time.perf_counter()
+        try:
+            async with async_session() as db:
+                result = await db.execute(select(self.model).where(self.model.is_active == True))
+                rows = [self.row_dict(r) for r in result.scalars()]
+            # 빌드는 스레드에서, 교체는 이벤트 루프에서 한 번에 (검색 중 반쯤 바뀐 인덱스 방지)
+            (
+                self._rows, self._codes, self._names, self._grams, self._tiebreak,
+            ) = await asyncio.to_thread(self._build, rows)
+            self._ready = True
+            self._version = version
+            logger.info(
+                f"{self.model.__tablename__} search index built: {len(rows)} codes, version {version} "
+                f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+            )
+        except Exception as e:
+            logger.error(f"{self.model.__tablename__} search index build failed: {e}")
+
+    async def _refresh_if_stale(self):
+        now = time.monotonic()
+        if self._building is not None and not self._building.done():
+            return
+        if now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+
+        version = "0"
+        redis = get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(VERSION_KEY)
+                version = raw.decode() if raw else "0"
+            except Exception as e:
+                mark_unavailable(e)
+                if self._ready:
+                    return
+        if self._ready and version == self._version:
+            return
+        self._building = asyncio.create_task(self._load(version))
+
+    def _substring_candidates(self, q: str, include_code: bool = True) -> List[int]:
+        postings = sorted((self._grams.get(g, []) for g in _bigrams(q)), key=len)
+        if not postings or not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return [
+            i for i in sorted(candidates)
+            if (include_code and q in self._rows[i]["code"].lower())
+            or any(q in name for name in self._row_names(self._rows[i]))
+        ]
+
+    @staticmethod
+    def _prefix_range(entries: List[tuple], prefix: str) -> List[int]:
+        start = bisect.bisect_left(entries, (prefix,))
+        end = bisect.bisect_left(entries, (prefix + "\uffff",), lo=start)
+        # 명칭 컬럼이 여러 개면 같은 행이 두 번 나올 수 있음
+        return list(dict.fromkeys(idx for _, idx in entries[start:end]))
+
+    def _search(self, q: str, limit: int) -> List[Dict[str, Any]]:
+        q_upper, q_lower = q.upper(), q.lower()
+        code_hits = self._prefix_range(self._codes, q_upper)
+        groups = [code_hits, self._prefix_range(self._names, q_lower)]
+        if len(q) >= MIN_NAME_SUBSTRING_LENGTH:
+            groups.append(self._substring_candidates(q_lower, include_code=len(q) >= MIN_SUBSTRING_LENGTH))
+
+        # 코드 완전일치 → 코드 접두사 → 명칭 접두사 → 부분일치, 각 구간은 미리 계산한 순위로 상위만
+        ranked: List[int] = []
+        if code_hits and self._rows[code_hits[0]]["code"].upper() == q_upper:
+            ranked.append(code_hits[0])
+        seen = set(ranked)
+        for group in groups:
+            if len(ranked) >= limit:
+                break
+            if seen:
+                group = [i for i in group if i not in seen]
+            top = heapq.nsmallest(limit - len(ranked), group, key=self._tiebreak.__getitem__)
+            ranked.extend(top)
+            seen.update(top)
+        return [self._rows[i] for i in ranked]
+
+    async def search(self, q: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """메모리 검색 결과. 인덱스가 아직 없으면 None (호출자가 DB 검색)"""
+        await self._refresh_if_stale()
+        q = q.strip()
+        if not self._ready or not q:
+            return None
+        return self._search(q, limit)
+
+
+# 전역 인스턴스
+fee_code_search_index = CodeSearchIndex(HIRAFeeCode, ["name"], fee_code_dict)
+disease_code_search_index = CodeSearchIndex(HIRADiseaseCode, ["name_kr"], disease_code_dict)
+drug_code_search_index = CodeSearchIndex(HIRADrugCode, ["product_name", "ingredient_name"], drug_code_dict)
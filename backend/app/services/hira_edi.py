@@ -4,13 +4,16 @@ HIRA EDI 연동 서비스
 심평원 VPN/EDI 채널을 통한 XML 메시지 송수신.
 Phase 1: 시뮬레이션 모드 (실제 HIRA VPN 연동 placeholder)
 """
+import gzip
 import logging
+import tempfile
 import uuid
 import hashlib
 from datetime import datetime, timedelta
 from typing import Optional
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom.minidom import parseString
+from xml.sax.saxutils import escape
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, update
@@ -39,6 +42,55 @@ RESULT_CODES = {
 }
 
 
+# 배치 XML 스풀 — 압축본이 이 크기를 넘으면 임시 파일로 넘김
+EDI_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+EDI_COMPRESS_LEVEL = 6
+
+
+class EDIBatchWriter:
+    """
+    배치 XML 점진 작성기 — 청구 조각을 받는 즉시 gzip으로 압축해 스풀 버퍼에 기록
+
+    청구별 XML 문자열 목록 → 결합 문자열 → 로그 저장용 사본으로 배치 전체가 메모리에
+    여러 벌 생기던 방식 대신, 메모리에는 청구 1건 분량과 압축 버퍼만 남음.
+    출력은 기존 ElementTree 배치 래퍼와 바이트 단위로 같음 (ClaimData에 청구 XML을 이스케이프해 담음).
+    """
+
+    def __init__(self, message_id: str, batch_id: int, claim_count: int, timestamp: Optional[str] = None):
+        self._spool = tempfile.SpooledTemporaryFile(max_size=EDI_SPOOL_MAX_BYTES)
+        self._gz = gzip.GzipFile(fileobj=self._spool, mode="wb", compresslevel=EDI_COMPRESS_LEVEL, mtime=0)
+        self.size_bytes = 0
+        self.claim_count = 0
+        self._write(
+            f"<EDIBatchMessage><MessageID>{escape(message_id)}</MessageID>"
+            f"<BatchID>{batch_id}</BatchID>"
+            f"<Timestamp>{timestamp or datetime.utcnow().isoformat()}</Timestamp>"
+            f"<ClaimCount>{claim_count}</ClaimCount><Claims>"
+        )
+
+    def _write(self, text: str):
+        data = text.encode("utf-8")
+        self.size_bytes += len(data)
+        self._gz.write(data)
+
+    def write_claim(self, claim_xml: str):
+        self._write(f"<ClaimData>{escape(claim_xml)}</ClaimData>")
+        self.claim_count += 1
+
+    def finish(self) -> bytes:
+        """닫는 태그 기록 후 압축본 반환"""
+        self._write("</Claims></EDIBatchMessage>")
+        self._gz.close()
+        self._spool.seek(0)
+        compressed = self._spool.read()
+        self._spool.close()
+        return compressed
+
+    def discard(self):
+        self._gz.close()
+        self._spool.close()
+
+
 class HIRAEDIService:
     """심평원 EDI 연동 서비스"""
 
@@ -68,25 +120,29 @@ class HIRAEDIService:
         from app.models.edi_log import EDIMessageLog, EDIDirection, EDIMessageType
         from app.models.insurance_claim import InsuranceClaim, ClaimStatus
 
-        # 1) EDI XML 포맷 검증
-        validation = await self.validate_edi_format(claims)
-        if not validation["valid"]:
+        # 1) 검증과 XML 생성을 한 번에 — 오류가 나오면 이후 청구는 검증만 하고 작성은 중단
+        message_id = self._generate_message_id()
+        writer = EDIBatchWriter(message_id, batch_id, len(claims))
+        errors = []
+        for idx, claim in enumerate(claims):
+            claim_errors = self._claim_errors(idx, claim)
+            if claim_errors:
+                errors.extend(claim_errors)
+            elif not errors:
+                writer.write_claim(self._build_claim_xml(claim))
+
+        if errors:
+            writer.discard()
             return {
                 "success": False,
                 "error": "EDI_VALIDATION_FAILED",
-                "detail": validation["errors"],
+                "detail": errors,
             }
 
-        # 2) XML 메시지 생성
-        message_id = self._generate_message_id()
-        xml_messages = []
-        for claim in claims:
-            xml_msg = self._build_claim_xml(claim)
-            xml_messages.append(xml_msg)
-
-        combined_xml = self._wrap_batch_xml(message_id, batch_id, xml_messages)
+        # 2) 압축 XML 확정
+        payload = writer.finish()
 
-        # 3) 전송 로그 기록
+        # 3) 전송 로그 기록 (압축본 저장)
         log = await self._create_message_log(
             db=db,
             user_id=user_id,
@@ -94,7 +150,9 @@ class HIRAEDIService:
             direction=EDIDirection.OUTBOUND,
             message_type=EDIMessageType.CLAIM_SUBMIT,
             message_id=message_id,
-            xml_message=combined_xml,
+            xml_message=None,
+            xml_message_gz=payload,
+            message_size_bytes=writer.size_bytes,
             claim_ids=",".join(str(c.id) for c in claims),
         )
 
@@ -104,7 +162,7 @@ class HIRAEDIService:
                 result = self._simulate_submit_response(message_id, len(claims))
             else:
                 # TODO: 실제 HIRA VPN 연동 구현
-                # result = await self._send_via_vpn(combined_xml)
+                # result = await self._send_via_vpn(gzip.decompress(payload))
                 result = self._simulate_submit_response(message_id, len(claims))
 
             # 5) 로그 업데이트
@@ -211,37 +269,7 @@ class HIRAEDIService:
         """
         errors = []
         for idx, claim in enumerate(claims):
-            # 필수 필드 검증
-            if not claim.claim_number:
-                errors.append({"claim_index": idx, "field": "claim_number", "error": "청구번호 누락"})
-            if not claim.service_date:
-                errors.append({"claim_index": idx, "field": "service_date", "error": "진료일 누락"})
-            if not claim.ykiho:
-                errors.append({"claim_index": idx, "field": "ykiho", "error": "요양기관번호 누락"})
-            if not claim.primary_dx_code:
-                errors.append({"claim_index": idx, "field": "primary_dx_code", "error": "주상병코드 누락"})
-
-            # 금액 검증
-            if claim.total_amount <= 0:
-                errors.append({"claim_index": idx, "field": "total_amount", "error": "청구금액이 0 이하"})
-
-            # 항목 검증
-            if hasattr(claim, 'items') and claim.items:
-                for item_idx, item in enumerate(claim.items):
-                    if not item.code:
-                        errors.append({
-                            "claim_index": idx,
-                            "item_index": item_idx,
-                            "field": "code",
-                            "error": "항목 코드 누락",
-                        })
-                    if item.quantity <= 0:
-                        errors.append({
-                            "claim_index": idx,
-                            "item_index": item_idx,
-                            "field": "quantity",
-                            "error": "수량이 0 이하",
-                        })
+            errors.extend(self._claim_errors(idx, claim))
 
         return {"valid": len(errors) == 0, "errors": errors, "checked_count": len(claims)}
 
@@ -249,6 +277,42 @@ class HIRAEDIService:
     # Private Methods
     # ─────────────────────────────────────────
 
+    def _claim_errors(self, idx: int, claim) -> list:
+        """청구 1건 EDI 필수 요건 검증 (validate_edi_format / submit_claims 공용)"""
+        errors = []
+        # 필수 필드 검증
+        if not claim.claim_number:
+            errors.append({"claim_index": idx, "field": "claim_number", "error": "청구번호 누락"})
+        if not claim.service_date:
+            errors.append({"claim_index": idx, "field": "service_date", "error": "진료일 누락"})
+        if not claim.ykiho:
+            errors.append({"claim_index": idx, "field": "ykiho", "error": "요양기관번호 누락"})
+        if not claim.primary_dx_code:
+            errors.append({"claim_index": idx, "field": "primary_dx_code", "error": "주상병코드 누락"})
+
+        # 금액 검증
+        if claim.total_amount <= 0:
+            errors.append({"claim_index": idx, "field": "total_amount", "error": "청구금액이 0 이하"})
+
+        # 항목 검증
+        if hasattr(claim, 'items') and claim.items:
+            for item_idx, item in enumerate(claim.items):
+                if not item.code:
+                    errors.append({
+                        "claim_index": idx,
+                        "item_index": item_idx,
+                        "field": "code",
+                        "error": "항목 코드 누락",
+                    })
+                if item.quantity <= 0:
+                    errors.append({
+                        "claim_index": idx,
+                        "item_index": item_idx,
+                        "field": "quantity",
+                        "error": "수량이 0 이하",
+                    })
+        return errors
+
     def _build_claim_xml(self, claim) -> str:
         """단일 청구 건 EDI XML 생성"""
         root = Element("ClaimRequest")
@@ -299,22 +363,6 @@ class HIRAEDIService:
         except Exception:
             return xml_str
 
-    def _wrap_batch_xml(self, message_id: str, batch_id: int, claim_xmls: list) -> str:
-        """배치 래퍼 XML 생성"""
-        root = Element("EDIBatchMessage")
-        SubElement(root, "MessageID").text = message_id
-        SubElement(root, "BatchID").text = str(batch_id)
-        SubElement(root, "Timestamp").text = datetime.utcnow().isoformat()
-        SubElement(root, "ClaimCount").text = str(len(claim_xmls))
-
-        claims_elem = SubElement(root, "Claims")
-        for xml in claim_xmls:
-            claim_elem = SubElement(claims_elem, "ClaimData")
-            claim_elem.text = xml
-
-        xml_str = tostring(root, encoding="unicode")
-        return xml_str
-
     def _generate_message_id(self) -> str:
         """EDI 메시지 ID 생성"""
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
@@ -329,11 +377,13 @@ class HIRAEDIService:
         direction,
         message_type,
         message_id: str,
-        xml_message: str,
+        xml_message: Optional[str],
         claim_ids: Optional[str] = None,
         ykiho: Optional[str] = None,
+        xml_message_gz: Optional[bytes] = None,
+        message_size_bytes: Optional[int] = None,
     ):
-        """EDI 메시지 로그 기록"""
+        """EDI 메시지 로그 기록 (xml_message_gz가 있으면 압축본만 저장)"""
         from app.models.edi_log import EDIMessageLog
 
         log = EDIMessageLog(
@@ -343,7 +393,11 @@ class HIRAEDIService:
             message_type=message_type,
             message_id=message_id,
             xml_message=xml_message,
-            message_size_bytes=len(xml_message.encode("utf-8")) if xml_message else 0,
+            xml_message_gz=xml_message_gz,
+            message_size_bytes=(
+                message_size_bytes if message_size_bytes is not None
+                else len(xml_message.encode("utf-8")) if xml_message else 0
+            ),
             ykiho=ykiho,
             claim_ids=claim_ids,
         )
@@ -0,0 +1,404 @@
+"""
+심평원 요양기관 로컬 스냅샷 서비스
+
+- 매일 밤 전국 병원/약국 기본목록을 받아 hira_institutions 테이블을 통째로 교체
+- 진료과목(dgsbjtCd)은 기본목록에 없으므로 시도 × 진료과 필터 조회로 수집해 ",01,05," 형태로 저장
+  · 조회 실패 + 직전 스냅샷 값도 없는 진료과는 dgsbjt_unknown에 기록 → 해당 진료과 반경 조회는 원격 API로 폴백
+- 반경/영역 조회는 격자 셀(geo_cell) 인덱스로 후보를 좁힌 뒤 거리 계산
+- 스냅샷이 비었거나 오래됐으면 None 반환 → 호출자는 원격 API로 폴백
+"""
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+
+from ..core.config import settings
+from ..core.database import async_session
+from ..core.geo import METERS_PER_DEGREE_LAT, annotate_distances
+from ..core.http_client import pooled_client
+from ..data.hira_region_codes import SIDO_HAENG_TO_HIRA
+from ..models.hira_institution import (
+    HiraInstitution, HiraInstitutionKind, geo_cell, geo_cells_in_bbox,
+)
+from .external_api import CLINIC_CODES, external_api_service
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 유효 기간 (야간 빌드 1회 실패까지 허용)
+SNAPSHOT_MAX_AGE = timedelta(hours=48)
+# 스냅샷 준비 여부 확인 결과 캐시 (초)
+READY_CHECK_TTL = 300
+
+PAGE_ROWS = 1000
+FETCH_CONCURRENCY = 4
+PAGE_RETRIES = 3
+INSERT_CHUNK = 2000
+# 직전 스냅샷 대비 이 비율 미만이면 업스트림 장애로 보고 교체하지 않음
+MIN_SNAPSHOT_RATIO = 0.8
+
+
+def _clip(value: Any, length: int) -> str:
+    return str(value or "")[:length]
+
+
+class SnapshotFetchError(Exception):
+    """스냅샷 수집 중 업스트림 페이지를 끝내 받지 못함"""
+
+
+class HiraSnapshotService:
+    """심평원 요양기관 스냅샷 (빌드 + 로컬 반경 조회)"""
+
+    def __init__(self):
+        self.hospital_url = f"{external_api_service.hira_base_url}/getHospBasisList"
+        self.pharmacy_url = f"{external_api_service.hira_pharmacy_url}/getParmacyBasisList"
+        # kind -> (ready, checked_until)
+        self._ready: Dict[str, Tuple[bool, float]] = {}
+
+    # ── 조회 ─────────────────────────────────────────────
+    @staticmethod
+    def _bbox_around(latitude: float, longitude: float, radius_m: float) -> Tuple[float, float, float, float]:
+        dlat = radius_m / METERS_PER_DEGREE_LAT
+        dlng = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(latitude)), 0.01))
+        return latitude - dlat, longitude - dlng, latitude + dlat, longitude + dlng
+
+    async def _is_ready(self, db, kind: str) -> bool:
+        cached = self._ready.get(kind)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        latest = await db.scalar(
+            select(func.max(HiraInstitution.snapshot_at)).where(HiraInstitution.kind == kind)
+        )
+        ready = latest is not None and datetime.utcnow() - latest <= SNAPSHOT_MAX_AGE
+        self._ready[kind] = (ready, time.monotonic() + READY_CHECK_TTL)
+        return ready
+
+    async def find_in_bbox(
+        self,
+        kind: str,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+    ) -> Optional[List[HiraInstitution]]:
+        """영역 내 요양기관 (스냅샷 미준비/DB 오류 시 None)"""
+        cells = geo_cells_in_bbox(min_lat, min_lng, max_lat, max_lng)
+        try:
+            async with async_session() as db:
+                if not await self._is_ready(db, kind):
+                    return None
+                result = await db.execute(
+                    select(HiraInstitution).where(
+                        HiraInstitution.kind == kind,
+                        HiraInstitution.geo_cell.in_(cells),
+                        HiraInstitution.latitude.between(min_lat, max_lat),
+                        HiraInstitution.longitude.between(min_lng, max_lng),
+                    )
+                )
+                return list(result.scalars().all())
+        except Exception as e:
+            logger.warning(f"HIRA snapshot lookup failed, using remote API: {e}")
+            return None
+
+    async def find_hospitals_within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: int,
+        clinic_type: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """반경 내 병원 — ExternalAPIService.get_nearby_hospitals와 같은 형식 (거리순)"""
+        rows = await self.find_in_bbox(
+            HiraInstitutionKind.HOSPITAL, *self._bbox_around(latitude, longitude, radius_m)
+        )
+        if rows is None:
+            return None
+
+        code = f",{CLINIC_CODES.get(clinic_type, '01')}," if clinic_type else None
+        # 이번 스냅샷에서 진료과 조회가 실패해 미확정인 병원이 있으면 결과에서 빠지므로 원격 API 사용
+        if code and any(code in (row.dgsbjt_unknown or "") for row in rows):
+            logger.info(f"HIRA snapshot dgsbjtCd {code.strip(',')} incomplete here, using remote API")
+            return None
+        hospitals = [
+            self._hospital_dict(row) for row in rows
+            if not code or code in (row.dgsbjt_codes or "")
+        ]
+        nearby = annotate_distances(latitude, longitude, hospitals, radius_m=radius_m)
+        for hospital in nearby:
+            hospital["_dgsbjt_filtered"] = bool(clinic_type)
+            if clinic_type and not hospital["clinic_type"]:
+                hospital["clinic_type"] = clinic_type
+        return nearby
+
+    async def find_pharmacies_within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """반경 내 약국 — ExternalAPIService.get_nearby_pharmacies와 같은 형식 (거리순)"""
+        rows = await self.find_in_bbox(
+            HiraInstitutionKind.PHARMACY, *self._bbox_around(latitude, longitude, radius_m)
+        )
+        if rows is None:
+            return None
+
+        pharmacies = [self._pharmacy_dict(row) for row in rows]
+        return annotate_distances(latitude, longitude, pharmacies, radius_m=radius_m)
+
+    @staticmethod
+    def _hospital_dict(row: HiraInstitution) -> Dict[str, Any]:
+        return {
+            "name": row.name,
+            "address": row.address or "",
+            "phone": row.phone or "",
+            "clinic_type": row.clinic_type or "",
+            "cl_cd_nm": row.cl_cd_nm or "",
+            "latitude": row.latitude,
+            "longitude": row.longitude,
+            "beds": row.beds or 0,
+            "doctors": row.doctors or 0,
+            "established": row.established or "",
+            "ykiho": row.ykiho,
+        }
+
+    @staticmethod
+    def _pharmacy_dict(row: HiraInstitution) -> Dict[str, Any]:
+        return {
+            "ykiho": row.ykiho,
+            "name": row.name,
+            "address": row.address or "",
+            "phone": row.phone or "",
+            "latitude": row.latitude,
+            "longitude": row.longitude,
+            "established": row.established or "",
+            "pharmacists": row.pharmacists or 0,
+            "est_monthly_revenue": 0,
+            "nearby_hospitals": [],
+            "nearby_hospital_count": 0,
+        }
+
+    # ── 빌드 ─────────────────────────────────────────────
+    async def _fetch_page(self, url: str, params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        last_error: Optional[Exception] = None
+        for attempt in range(PAGE_RETRIES):
+            try:
+                async with pooled_client("data_go_kr") as client:
+                    response = await client.get(url, params=params, timeout=30.0)
+                    response.raise_for_status()
+                    data = response.json()
+                body = data.get("response", {}).get("body", {}) or {}
+                total = int(body.get("totalCount") or 0)
+                return external_api_service._extract_items_safe(data), total
+            except Exception as e:
+                last_error = e
+                await asyncio.sleep(2 ** attempt)
+        raise SnapshotFetchError(f"{url} {params.get('sidoCd')}/{params.get('dgsbjtCd', '-')}: {last_error}")
+
+    async def _fetch_all(self, url: str, sido_cd: str, dgsbjt_cd: Optional[str] = None) -> List[Dict[str, Any]]:
+        """시도(+진료과) 단위 전체 페이지 수집"""
+        items: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            params: Dict[str, Any] = {
+                "serviceKey": settings.HIRA_API_KEY,
+                "sidoCd": sido_cd,
+                "pageNo": page,
+                "numOfRows": PAGE_ROWS,
+                "_type": "json",
+            }
+            if dgsbjt_cd:
+                params["dgsbjtCd"] = dgsbjt_cd
+            page_items, total = await self._fetch_page(url, params)
+            items.extend(page_items)
+            if not page_items or len(items) >= total:
+                return items
+            page += 1
+
+    async def rebuild(self) -> Dict[str, Any]:
+        """
+        전국 스냅샷 재구축 (Celery 야간 태스크)
+
+        - 기본목록 수집이 한 페이지라도 실패하면 중단하고 기존 스냅샷 유지
+        - 진료과 필터 조회 실패 시 해당 (시도, 진료과)는 직전 스냅샷 값을 이어받고,
+          직전 값이 없는 병원(신규/직전에도 미확정)은 dgsbjt_unknown에 기록
+        - 교체는 한 트랜잭션 (DELETE + INSERT) — 조회 측은 커밋 전까지 이전 스냅샷을 봄
+        """
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        sido_codes = sorted(set(SIDO_HAENG_TO_HIRA.values()))
+        dgsbjt_codes = sorted(set(CLINIC_CODES.values()))
+
+        async def guarded(url: str, sido_cd: str, dgsbjt_cd: Optional[str] = None):
+            async with semaphore:
+                return await self._fetch_all(url, sido_cd, dgsbjt_cd)
+
+        # 1) 기본목록 (병원/약국) — 실패 시 전체 중단
+        hospital_lists = await asyncio.gather(*(guarded(self.hospital_url, s) for s in sido_codes))
+        pharmacy_lists = await asyncio.gather(*(guarded(self.pharmacy_url, s) for s in sido_codes))
+
+        # 2) 진료과 필터 조회 — 실패는 기록만
+        pairs = [(s, c) for s in sido_codes for c in dgsbjt_codes]
+        filtered = await asyncio.gather(
+            *(guarded(self.hospital_url, s, c) for s, c in pairs), return_exceptions=True
+        )
+        codes_by_ykiho: Dict[str, set] = {}
+        failed_pairs: List[Tuple[str, str]] = []
+        for (sido_cd, code), result in zip(pairs, filtered):
+            if isinstance(result, Exception):
+                logger.warning(f"HIRA snapshot dgsbjtCd pass failed: {result}")
+                failed_pairs.append((sido_cd, code))
+                continue
+            for item in result:
+                if item.get("ykiho"):
+                    codes_by_ykiho.setdefault(item["ykiho"], set()).add(code)
+
+        snapshot_at = datetime.utcnow()
+        rows: Dict[str, Dict[str, Any]] = {}
+        for items in hospital_lists:
+            for item in items:
+                row = self._hospital_row(item, snapshot_at)
+                if row:
+                    rows[row["ykiho"]] = row
+        for items in pharmacy_lists:
+            for item in items:
+                row = self._pharmacy_row(item, snapshot_at)
+                if row:
+                    rows[row["ykiho"]] = row
+
+        async with async_session() as db:
+            previous = dict(
+                (await db.execute(
+                    select(HiraInstitution.kind, func.count()).group_by(HiraInstitution.kind)
+                )).all()
+            )
+            new_counts = {
+                kind: sum(1 for r in rows.values() if r["kind"] == kind)
+                for kind in (HiraInstitutionKind.HOSPITAL, HiraInstitutionKind.PHARMACY)
+            }
+            for kind, count in new_counts.items():
+                if count < previous.get(kind, 0) * MIN_SNAPSHOT_RATIO:
+                    raise SnapshotFetchError(
+                        f"{kind} snapshot shrank {previous[kind]} → {count}, keeping previous snapshot"
+                    )
+
+            # 실패한 (시도, 진료과)는 직전 스냅샷의 진료과 코드를 이어받음
+            inherited: Dict[str, Tuple[str, str]] = {}
+            if failed_pairs:
+                failed_sidos = {s for s, _ in failed_pairs}
+                result = await db.execute(
+                    select(
+                        HiraInstitution.ykiho, HiraInstitution.dgsbjt_codes, HiraInstitution.dgsbjt_unknown,
+                    ).where(
+                        HiraInstitution.kind == HiraInstitutionKind.HOSPITAL,
+                        HiraInstitution.sido_cd.in_(failed_sidos),
+                    )
+                )
+                inherited = {ykiho: (codes or "", unknown or "") for ykiho, codes, unknown in result.all()}
+            failed_by_sido: Dict[str, set] = {}
+            dgsbjt_unknown = 0
+            for sido_cd, code in failed_pairs:
+                failed_by_sido.setdefault(sido_cd, set()).add(code)
+
+            for row in rows.values():
+                if row["kind"] != HiraInstitutionKind.HOSPITAL:
+                    continue
+                codes = set(codes_by_ykiho.get(row["ykiho"], ()))
+                unknown = set()
+                for code in failed_by_sido.get(row["sido_cd"], ()):
+                    previous_row = inherited.get(row["ykiho"])
+                    if previous_row is None or f",{code}," in previous_row[1]:
+                        unknown.add(code)
+                    elif f",{code}," in previous_row[0]:
+                        codes.add(code)
+                row["dgsbjt_codes"] = f",{','.join(sorted(codes))}," if codes else ""
+                row["dgsbjt_unknown"] = f",{','.join(sorted(unknown))}," if unknown else ""
+                dgsbjt_unknown += bool(unknown)
+
+            await db.execute(delete(HiraInstitution))
+            values = list(rows.values())
+            for i in range(0, len(values), INSERT_CHUNK):
+                await db.execute(insert(HiraInstitution), values[i:i + INSERT_CHUNK])
+            await db.commit()
+
+        self._ready.clear()
+        summary = {
+            "status": "completed",
+            **{kind.lower(): count for kind, count in new_counts.items()},
+            "dgsbjt_failed": len(failed_pairs),
+            "dgsbjt_unknown": dgsbjt_unknown,
+            "duration_s": round(time.perf_counter() - started, 1),
+        }
+        logger.info(f"HIRA snapshot rebuilt: {summary}")
+        return summary
+
+    @staticmethod
+    def _coords(item: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+        try:
+            lat, lng = float(item.get("YPos") or 0), float(item.get("XPos") or 0)
+        except (TypeError, ValueError):
+            return None
+        if lat == 0 or lng == 0:
+            return None
+        return lat, lng
+
+    def _hospital_row(self, item: Dict[str, Any], snapshot_at: datetime) -> Optional[Dict[str, Any]]:
+        coords = self._coords(item)
+        if not coords or not item.get("ykiho"):
+            return None
+        parsed = external_api_service._parse_hospital_data(item)
+        return {
+            "ykiho": parsed["ykiho"],
+            "kind": HiraInstitutionKind.HOSPITAL,
+            "name": _clip(parsed["name"], 200),
+            "address": _clip(parsed["address"], 500),
+            "phone": _clip(parsed["phone"], 50),
+            "clinic_type": _clip(parsed["clinic_type"], 100),
+            "cl_cd_nm": _clip(parsed["cl_cd_nm"], 50),
+            "dgsbjt_codes": "",
+            "dgsbjt_unknown": "",
+            "latitude": coords[0],
+            "longitude": coords[1],
+            "geo_cell": geo_cell(*coords),
+            "beds": parsed["beds"],
+            "doctors": parsed["doctors"],
+            "pharmacists": 0,
+            "established": _clip(parsed["established"], 20),
+            "sido_cd": item.get("sidoCd", ""),
+            "sggu_cd": item.get("sgguCd", ""),
+            "snapshot_at": snapshot_at,
+        }
+
+    def _pharmacy_row(self, item: Dict[str, Any], snapshot_at: datetime) -> Optional[Dict[str, Any]]:
+        coords = self._coords(item)
+        if not coords or not item.get("ykiho"):
+            return None
+        parsed = external_api_service._parse_pharmacy_data(item)
+        return {
+            "ykiho": parsed["ykiho"],
+            "kind": HiraInstitutionKind.PHARMACY,
+            "name": _clip(parsed["name"], 200),
+            "address": _clip(parsed["address"], 500),
+            "phone": _clip(parsed["phone"], 50),
+            "clinic_type": "",
+            "cl_cd_nm": _clip(item.get("clCdNm") or "약국", 50),
+            "dgsbjt_codes": "",
+            "dgsbjt_unknown": "",
+            "latitude": coords[0],
+            "longitude": coords[1],
+            "geo_cell": geo_cell(*coords),
+            "beds": 0,
+            "doctors": 0,
+            "pharmacists": parsed["pharmacists"],
+            "established": _clip(parsed["established"], 20),
+            "sido_cd": item.get("sidoCd", ""),
+            "sggu_cd": item.get("sgguCd", ""),
+            "snapshot_at": snapshot_at,
+        }
+
+
+# 전역 인스턴스
+hira_snapshot_service = HiraSnapshotService()
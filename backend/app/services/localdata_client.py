@@ -9,10 +9,11 @@ LOCALDATA (localdata.go.kr) 클라이언트.
 """
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import httpx
 import logging
 
 from ..core.config import settings
+from ..core.http_client import pooled_client
+from ..core.tiered_cache import tiered_cache
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +74,7 @@ class LocalDataClient:
         page = 1
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("localdata") as client:
                 while True:
                     params = {
                         "authKey": self.api_key,
@@ -155,8 +156,21 @@ class LocalDataClient:
         years: int = 3,
     ) -> Dict[str, Any]:
         """
-        시군구 의원 N년 폐업률 + 평균 영업기간.
+        시군구 의원 N년 폐업률 + 평균 영업기간 (시군구 단위 2단 캐시).
         """
+        return await tiered_cache.get_or_fetch(
+            "localdata_closure",
+            f"{sido_cd}:{sggu_cd}:{years}",
+            lambda: self._calculate_closure_rate(sido_cd, sggu_cd, years),
+            cache_if=lambda r: bool(r) and not r.get("is_estimated", True),
+        )
+
+    async def _calculate_closure_rate(
+        self,
+        sido_cd: str,
+        sggu_cd: str,
+        years: int = 3,
+    ) -> Dict[str, Any]:
         from_date = (datetime.now() - timedelta(days=365 * years)).strftime("%Y%m%d")
         records = await self.get_clinic_history(
             sido_cd=sido_cd,
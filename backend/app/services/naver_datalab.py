@@ -11,10 +11,11 @@ import os
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import httpx
 import logging
 
 from ..core.config import settings
+from ..core.http_client import pooled_client
+from ..core.tiered_cache import tiered_cache
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,18 @@ class NaverDatalabClient:
             logger.debug("Naver Datalab: credentials not configured")
             return None
 
+        return await tiered_cache.get_or_fetch(
+            "naver_trend",
+            f"{clinic_type}:{region_name}:{months}",
+            lambda: self._fetch_search_trend(clinic_type, region_name, months),
+        )
+
+    async def _fetch_search_trend(
+        self,
+        clinic_type: str,
+        region_name: str,
+        months: int,
+    ) -> Optional[Dict[str, Any]]:
         end_date = datetime.now().strftime("%Y-%m-%d")
         start_date = (datetime.now() - timedelta(days=30 * months)).strftime("%Y-%m-%d")
 
@@ -69,7 +82,7 @@ class NaverDatalabClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("naver") as client:
                 response = await client.post(
                     self.BASE_URL,
                     headers={
@@ -4,7 +4,6 @@
 약국 타겟에게 문자/이메일을 발송하고 캠페인을 관리합니다.
 """
 
-import httpx
 import hashlib
 import hmac
 import time
@@ -20,6 +19,7 @@ from email.mime.multipart import MIMEMultipart
 import aiosmtplib
 
 from ..core.config import settings
+from ..core.http_client import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +95,7 @@ class SolapiService:
             return {"success": False, "error": "API keys not configured"}
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("solapi") as client:
                 payload = {
                     "message": {
                         "to": to.replace("-", ""),
@@ -151,7 +151,7 @@ class SolapiService:
             return {"success": False, "error": "API keys not configured"}
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("solapi") as client:
                 payload = {
                     "messages": [
                         {
@@ -198,7 +198,7 @@ class SolapiService:
     async def get_balance(self) -> Dict[str, Any]:
         """잔액 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("solapi") as client:
                 response = await client.get(
                     f"{self.base_url}/cash/v1/balance",
                     headers=self._get_headers(),
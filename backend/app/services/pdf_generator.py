@@ -13,12 +13,15 @@ PDF 생성 서비스 - WeasyPrint를 사용한 상권분석 + 개원 실행 계
 9. 세금 (개인 vs 법인)
 10. 마케팅 플랜
 """
+import asyncio
+import hashlib
+import logging
 import os
 import uuid
 from io import BytesIO
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Dict, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
@@ -38,8 +41,21 @@ except ImportError:
     boto3 = None
 
 from ..core.config import settings
+from ..core.pdf_render import render_pdf, render_pdf_async
 from ..models.simulation import Simulation
 
+logger = logging.getLogger(__name__)
+
+# 리포트 HTML/CSS 또는 렌더링 방식이 바뀌면 올림 → 기존 캐시 PDF 무효화
+PDF_TEMPLATE_VERSION = "v1"
+PDF_CACHE_S3_PREFIX = "reports/cache"
+# 생성일은 캐시 키(HTML 해시)에서 제외하고 렌더링 직전에 채움
+_GENERATED_AT_MARK = "__MEDIPLATON_GENERATED_AT__"
+
+
+def _stamp_generated_at(html_content: str) -> str:
+    return html_content.replace(_GENERATED_AT_MARK, datetime.now().strftime("%Y년 %m월 %d일 %H:%M"), 1)
+
 
 def _won(v: int) -> str:
     """원 단위를 한글로 (억/만)"""
@@ -71,6 +87,11 @@ class PDFGeneratorService:
             autoescape=True
         )
 
+        self.cache_dir = Path(settings.PDF_CACHE_DIR) if settings.PDF_CACHE_DIR else (
+            Path(__file__).parent.parent.parent / "tmp" / "reports" / "cache"
+        )
+        self._inflight: Dict[str, "asyncio.Future[bytes]"] = {}
+
         self.s3_client = None
         if boto3 and settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
             self.s3_client = boto3.client(
@@ -80,21 +101,12 @@ class PDFGeneratorService:
                 region_name=settings.AWS_REGION
             )
 
-    def generate_simulation_report_pdf(
-        self,
-        simulation: Simulation,
-        ai_analysis_or_response: Any = None,
-    ) -> bytes:
+    def _prepare_html(self, simulation: Simulation, ai_analysis_or_response: Any = None) -> str:
         """
-        시뮬레이션 리포트 PDF 생성.
+        리포트 HTML 생성 (생성일은 _GENERATED_AT_MARK 자리표시자).
         ai_analysis_or_response가 SimulationResponse면 8개 모듈 모두 렌더링,
         아니면 기본 정보만 렌더링.
         """
-        if not WEASYPRINT_AVAILABLE:
-            raise RuntimeError(
-                "WeasyPrint is not available. Please install GTK+ dependencies."
-            )
-
         # SimulationResponse가 들어왔는지 확인 (capital_plan 같은 필드 존재)
         response = ai_analysis_or_response
         has_modules = hasattr(response, 'capital_plan') and response.capital_plan is not None
@@ -113,42 +125,117 @@ class PDFGeneratorService:
                 response = None
                 has_modules = False
 
-        html_content = self._build_html(simulation, response, has_modules)
-
-        # WeasyPrint 60.x 호환성 — write_pdf의 stylesheets 인자가 PDF 내부 호출
-        # 시 TypeError 발생하는 경우가 있음. 안전을 위해 CSS를 HTML <style> 태그에
-        # 인라인 임베드하고 write_pdf를 인자 없이 호출.
-        css_text = self._get_pdf_styles()
-        if "<style>" not in html_content:
-            html_with_style = html_content.replace(
-                "</head>",
-                f"<style>{css_text}</style></head>",
-                1,
+        return self._build_html(simulation, response, has_modules)
+
+    def generate_simulation_report_pdf(
+        self,
+        simulation: Simulation,
+        ai_analysis_or_response: Any = None,
+    ) -> bytes:
+        """시뮬레이션 리포트 PDF 생성 (동기 — 이벤트 루프 밖에서만 사용, API는 render_simulation_report_pdf)"""
+        if not WEASYPRINT_AVAILABLE:
+            raise RuntimeError(
+                "WeasyPrint is not available. Please install GTK+ dependencies."
             )
-            if html_with_style == html_content:
-                # </head> 없으면 <html> 다음에 삽입
-                html_with_style = (
-                    f"<style>{css_text}</style>\n{html_content}"
-                )
-        else:
-            html_with_style = html_content
+        html_content = self._prepare_html(simulation, ai_analysis_or_response)
+        return render_pdf(_stamp_generated_at(html_content), self._get_pdf_styles())
 
-        try:
-            pdf_bytes = HTML(string=html_with_style, base_url=".").write_pdf()
-        except TypeError as e:
-            # 폴백: stylesheets 인자 시도 (구 API)
-            import logging
-            logging.getLogger(__name__).warning(
-                f"WeasyPrint write_pdf() failed: {e}, retrying with stylesheets arg"
+    async def render_simulation_report_pdf(
+        self,
+        simulation: Simulation,
+        ai_analysis_or_response: Any = None,
+        variant: str = "report",
+    ) -> bytes:
+        """
+        시뮬레이션 리포트 PDF — 캐시 우선, 없으면 워커 풀에서 렌더링
+
+        캐시 키 = 시뮬레이션 id + variant + 리포트 HTML 해시 + PDF_TEMPLATE_VERSION.
+        내용이 같으면 다시 렌더링하지 않고, 같은 키의 동시 요청은 렌더링 1회를 공유한다.
+        variant는 입력 종류별 구분 ("report": 리포트 AI 분석, "demographics": 인구 데이터) —
+        시뮬레이션당 variant별 최신 PDF 1개씩 유지.
+        """
+        if not WEASYPRINT_AVAILABLE:
+            raise RuntimeError(
+                "WeasyPrint is not available. Please install GTK+ dependencies."
             )
-            pdf_bytes = HTML(string=html_content, base_url=".").write_pdf(
-                stylesheets=[CSS(string=css_text)]
+        html_content = self._prepare_html(simulation, ai_analysis_or_response)
+        key = self._cache_key(simulation, variant, html_content)
+
+        cached_pdf = await self._load_cached(key)
+        if cached_pdf is not None:
+            return cached_pdf
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._render_and_store(key, html_content))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    def _cache_key(self, simulation: Simulation, variant: str, html_content: str) -> str:
+        content_hash = hashlib.sha256(html_content.encode("utf-8")).hexdigest()[:32]
+        return f"{simulation.id}/{variant}-{content_hash}-{PDF_TEMPLATE_VERSION}"
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pdf"
+
+    async def _load_cached(self, key: str) -> Optional[bytes]:
+        """로컬 디스크 → S3 순으로 캐시 조회 (S3 적중 시 로컬에도 저장)"""
+        path = self._cache_path(key)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"PDF cache read failed ({key}): {e}")
+
+        if not self.s3_client:
+            return None
+        try:
+            obj = await asyncio.to_thread(
+                self.s3_client.get_object,
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=f"{PDF_CACHE_S3_PREFIX}/{key}.pdf",
             )
+            pdf_bytes = await asyncio.to_thread(obj["Body"].read)
+        except Exception:
+            return None
+        await asyncio.to_thread(self._write_local, key, pdf_bytes)
         return pdf_bytes
 
+    async def _render_and_store(self, key: str, html_content: str) -> bytes:
+        pdf_bytes = await render_pdf_async(_stamp_generated_at(html_content), self._get_pdf_styles())
+        await asyncio.to_thread(self._write_local, key, pdf_bytes)
+        if self.s3_client:
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.upload_fileobj,
+                    BytesIO(pdf_bytes),
+                    settings.S3_BUCKET_NAME,
+                    f"{PDF_CACHE_S3_PREFIX}/{key}.pdf",
+                    ExtraArgs={"ContentType": "application/pdf"},
+                )
+            except Exception as e:
+                logger.warning(f"PDF cache S3 upload failed ({key}): {e}")
+        return pdf_bytes
+
+    def _write_local(self, key: str, pdf_bytes: bytes):
+        """캐시 파일 저장. 같은 시뮬레이션·같은 variant의 이전 버전 PDF는 삭제 (variant별 최신 1개 유지)"""
+        path = self._cache_path(key)
+        variant = path.name.split("-", 1)[0]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            for old in path.parent.glob(f"{variant}-*.pdf"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+            tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(pdf_bytes)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"PDF cache write failed ({key}): {e}")
+
     def _build_html(self, sim: Simulation, response: Any, has_modules: bool) -> str:
         report_id = str(sim.id)[:8].upper()
-        now = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
         rec_map = {
             "VERY_POSITIVE": "매우 긍정적",
             "POSITIVE": "긍정적",
@@ -194,7 +281,7 @@ class PDFGeneratorService:
       </div>
       <div class="meta">
         <p>리포트 ID: {report_id}</p>
-        <p>생성일: {now}</p>
+        <p>생성일: {_GENERATED_AT_MARK}</p>
       </div>
     </header>
     {body}
@@ -490,7 +577,8 @@ ul li, ol li { margin: 2px 0; }
             return None
         try:
             key = f"reports/{filename}"
-            self.s3_client.upload_fileobj(
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
                 BytesIO(pdf_bytes),
                 settings.S3_BUCKET_NAME,
                 key,
@@ -0,0 +1,228 @@
+"""
+인증 주체(principal) 캐시 — 사용자 상태/권한 + 활성 서비스 구독
+
+인증이 필요한 요청마다 User 조회, EMR/청구 요청은 ServiceSubscription 조회까지 더해지던 것을
+짧은 TTL 캐시로 대체한다.
+- 프로세스 메모리 LOCAL_TTL → Redis REDIS_TTL → DB 순으로 조회
+- 캐시한 컬럼 값으로 User를 만들어 세션에 merge(load=False) — SELECT 없이 영속 객체가 되므로
+  엔드포인트에서 current_user를 수정하면 기존처럼 UPDATE 됨
+- 비밀번호 해시/재설정 토큰은 캐시하지 않음 (만료 속성으로 남음 — current_user로 읽는 곳 없음)
+- 무효화: User 수정/삭제, ServiceSubscription 생성/수정/삭제가 커밋되면 ORM 이벤트로
+  해당 사용자의 로컬 항목 제거 + Redis 키 삭제. 다른 프로세스의 로컬 항목은 LOCAL_TTL 안에 만료
+
+Usage:
+    principal = await principal_cache.get(db, user_id)      # 없는 사용자면 None
+    user = await principal_cache.attach_user(db, principal)
+    principal.services.get(ServiceType.EMR.value)            # (구독 id, 등급) 또는 None
+"""
+import asyncio
+import enum
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import and_, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from ..core.redis import get_redis, mark_unavailable
+from ..models.service_subscription import ServiceSubscription, ServiceSubStatus
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 메모리 캐시 수명 (초) — 다른 프로세스에서 바뀐 상태가 반영되기까지 최대 지연
+LOCAL_TTL = 10.0
+# Redis 캐시 수명 (초)
+REDIS_TTL = 60
+LOCAL_MAX_ENTRIES = 10000
+KEY_PREFIX = "principal:"
+
+# 캐시하지 않는 컬럼
+SENSITIVE_COLUMNS = {"hashed_password", "reset_token", "reset_token_expires"}
+USER_COLUMNS = [column for column in User.__table__.columns if column.key not in SENSITIVE_COLUMNS]
+
+_SESSION_KEY = "principal_invalidate"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """사용자 컬럼 값 + 활성 서비스 구독 (서비스 유형 값 → (구독 id, 등급 값))"""
+    user: Dict[str, Any]
+    services: Dict[str, Tuple[int, str]]
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.user.get("is_active"))
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _decode(column, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if issubclass(python_type, enum.Enum):
+        return python_type(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return value
+
+
+class PrincipalCache:
+    """사용자 상태 + 서비스 구독 캐시"""
+
+    def __init__(self):
+        self._local: Dict[str, Tuple[float, Principal]] = {}
+        self._pending_deletes: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0}
+
+    async def _load(self, db: AsyncSession, user_id: str) -> Optional[Principal]:
+        row = (await db.execute(
+            select(*USER_COLUMNS).where(User.id == uuid.UUID(user_id))
+        )).first()
+        if row is None:
+            return None
+        subs = await db.execute(
+            select(ServiceSubscription.service_type, ServiceSubscription.id, ServiceSubscription.tier)
+            .where(
+                and_(
+                    ServiceSubscription.user_id == uuid.UUID(user_id),
+                    ServiceSubscription.status == ServiceSubStatus.ACTIVE,
+                )
+            )
+        )
+        return Principal(
+            user={column.key: value for column, value in zip(USER_COLUMNS, row)},
+            services={s.service_type.value: (s.id, s.tier.value) for s in subs},
+        )
+
+    async def get(self, db: AsyncSession, user_id: str) -> Optional[Principal]:
+        """사용자 principal (없는 사용자면 None)"""
+        user_id = str(user_id)
+        cached = self._local.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < LOCAL_TTL:
+            self.stats["local_hits"] += 1
+            return cached[1]
+
+        key = KEY_PREFIX + user_id
+        redis = get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(key)
+            except Exception as e:
+                mark_unavailable(e)
+                raw = None
+            if raw:
+                data = json.loads(raw)
+                principal = Principal(
+                    user={c.key: _decode(c, data["user"].get(c.key)) for c in USER_COLUMNS},
+                    services={k: tuple(v) for k, v in data["services"].items()},
+                )
+                self.stats["redis_hits"] += 1
+                self._store_local(user_id, principal)
+                return principal
+
+        self.stats["misses"] += 1
+        principal = await self._load(db, user_id)
+        if principal is None:
+            return None
+        self._store_local(user_id, principal)
+        if redis is not None:
+            payload = json.dumps({
+                "user": {k: _encode(v) for k, v in principal.user.items()},
+                "services": principal.services,
+            })
+            try:
+                await redis.set(key, payload, ex=REDIS_TTL)
+            except Exception as e:
+                mark_unavailable(e)
+        return principal
+
+    def _store_local(self, user_id: str, principal: Principal):
+        if len(self._local) >= LOCAL_MAX_ENTRIES:
+            self._local.clear()
+        self._local[user_id] = (time.monotonic(), principal)
+
+    async def attach_user(self, db: AsyncSession, principal: Principal) -> User:
+        """캐시 값으로 세션에 연결된 User (SELECT 없음, 민감 컬럼은 만료 상태)"""
+        user = User(**principal.user)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    # ---- 무효화 ----
+
+    def invalidate(self, user_id):
+        """로컬 항목 제거 + Redis 키 삭제 예약"""
+        user_id = str(user_id)
+        self._local.pop(user_id, None)
+        self._pending_deletes.add(user_id)
+        self.stats["invalidations"] += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flush_task is None or self._flush_task.done() or self._flush_task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self.flush_invalidations())
+
+    async def flush_invalidations(self):
+        """예약된 Redis 키 삭제 (Celery 태스크는 루프 종료 전에 호출)"""
+        while self._pending_deletes:
+            user_ids, self._pending_deletes = self._pending_deletes, set()
+            redis = get_redis()
+            if redis is None:
+                return
+            try:
+                await redis.delete(*(KEY_PREFIX + uid for uid in user_ids))
+            except Exception as e:
+                mark_unavailable(e)
+                return
+
+
+# 전역 인스턴스
+principal_cache = PrincipalCache()
+
+
+def _mark(target, user_id):
+    session = object_session(target)
+    if session is not None and user_id is not None:
+        session.info.setdefault(_SESSION_KEY, set()).add(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target):
+    _mark(target, target.id)
+
+
+@event.listens_for(ServiceSubscription, "after_insert")
+@event.listens_for(ServiceSubscription, "after_update")
+@event.listens_for(ServiceSubscription, "after_delete")
+def _subscription_changed(mapper, connection, target):
+    _mark(target, target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for user_id in session.info.pop(_SESSION_KEY, ()):
+        principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session):
+    session.info.pop(_SESSION_KEY, None)
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func, and_, or_
@@ -12,10 +12,17 @@ from ..schemas.prospect import (
 )
 from .external_api import external_api_service
 from ..core.config import settings
+from ..core.database import async_session
+from ..core.export_stream import csv_stream, xlsx_stream
 
 import logging
 logger = logging.getLogger(__name__)
 
+# 내보내기 컬럼 (CSV/Excel 공통)
+EXPORT_COLUMNS = ["주소", "유형", "적합도 점수", "추천 진료과목", "상태", "탐지일"]
+# 서버사이드 커서 배치 크기
+EXPORT_FETCH_SIZE = 2000
+
 
 class ProspectService:
     """잠재 개원지 탐색 서비스 (SalesScanner)"""
@@ -261,48 +268,61 @@ class ProspectService:
         await db.commit()
         return True
 
-    async def export_prospects(
-        self,
-        db: AsyncSession,
-        format: str,  # 'excel' or 'csv'
-        filters: Dict[str, Any]
-    ) -> bytes:
-        """Excel/CSV 내보내기"""
-        import pandas as pd
-        from io import BytesIO
-
-        # Get prospects based on filters
-        prospects_data = await self.get_prospects(
-            db,
-            prospect_type=filters.get("prospect_type"),
-            status=filters.get("status"),
-            min_score=filters.get("min_score"),
-            page=1,
-            page_size=10000  # Max export
+    def _export_query(self, filters: Dict[str, Any]):
+        """내보내기 쿼리 — 필요한 컬럼만 조회 (ORM 객체 생성 생략)"""
+        query = select(
+            ProspectLocation.address,
+            ProspectLocation.type,
+            ProspectLocation.clinic_fit_score,
+            ProspectLocation.recommended_dept,
+            ProspectLocation.status,
+            ProspectLocation.detected_at,
         )
+        conditions = []
+        if filters.get("prospect_type"):
+            conditions.append(ProspectLocation.type == filters["prospect_type"])
+        if filters.get("status"):
+            conditions.append(ProspectLocation.status == filters["status"])
+        if filters.get("min_score"):
+            conditions.append(ProspectLocation.clinic_fit_score >= filters["min_score"])
+        if conditions:
+            query = query.where(and_(*conditions))
+        return query.order_by(desc(ProspectLocation.detected_at))
+
+    @staticmethod
+    def _export_row(row) -> List[Any]:
+        return [
+            row.address,
+            row.type.value if row.type else "",
+            row.clinic_fit_score,
+            ", ".join(row.recommended_dept or []),
+            row.status.value if row.status else "",
+            str(row.detected_at) if row.detected_at else "",
+        ]
 
-        # Convert to DataFrame
-        df = pd.DataFrame([
-            {
-                "주소": p.address,
-                "유형": p.type.value if hasattr(p, 'type') else p.get('type'),
-                "적합도 점수": p.clinic_fit_score if hasattr(p, 'clinic_fit_score') else p.get('clinic_fit_score'),
-                "추천 진료과목": ", ".join(p.recommended_dept or []) if hasattr(p, 'recommended_dept') else ", ".join(p.get('recommended_dept') or []),
-                "상태": p.status.value if hasattr(p, 'status') else p.get('status'),
-                "탐지일": str(p.detected_at) if hasattr(p, 'detected_at') else str(p.get('detected_at')),
-            }
-            for p in prospects_data["items"]
-        ])
-
-        output = BytesIO()
-
+    async def iter_export_batches(
+        self,
+        filters: Dict[str, Any],
+        batch_size: int = EXPORT_FETCH_SIZE,
+    ) -> AsyncIterator[List[List[Any]]]:
+        """
+        내보내기 행 배치 — 서버사이드 커서로 batch_size씩 가져옴 (결과 전체를 메모리에 올리지 않음)
+
+        StreamingResponse 전송 중에도 커서를 유지해야 하므로 요청 세션(get_db)이 아닌
+        자체 세션을 연다 (get_db는 응답 전송 전에 닫힘).
+        """
+        query = self._export_query(filters).execution_options(yield_per=batch_size)
+        async with async_session() as db:
+            result = await db.stream(query)
+            async for rows in result.partitions(batch_size):
+                yield [self._export_row(row) for row in rows]
+
+    def stream_export(self, format: str, filters: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """Excel/CSV 스트리밍 내보내기 (format: 'excel' or 'csv')"""
+        batches = self.iter_export_batches(filters)
         if format == "excel":
-            df.to_excel(output, index=False, engine="openpyxl")
-        else:  # csv
-            df.to_csv(output, index=False, encoding="utf-8-sig")
-
-        output.seek(0)
-        return output.getvalue()
+            return xlsx_stream(EXPORT_COLUMNS, batches, sheet_title="잠재 개원지")
+        return csv_stream(EXPORT_COLUMNS, batches)
 
     def _to_response(self, prospect: ProspectLocation) -> Dict[str, Any]:
         """모델을 응답 형식으로 변환"""
@@ -1,15 +1,16 @@
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func, tuple_
 from sqlalchemy.orm import selectinload
+import base64
 import json
 import random
 from datetime import datetime
 
 from ..models.simulation import Simulation, SimulationReport, RecommendationType
 from ..schemas.simulation import (
-    SimulationRequest, SimulationResponse, CompetitorInfo,
+    SimulationRequest, SimulationResponse, SimulationSummary, CompetitorInfo,
     CompetitorRevenueStats, MarketingImpact,
     EstimatedRevenue, EstimatedCost, Profitability, Competition, Demographics,
     RevenueDetail, CostDetail, ProfitabilityDetail, CompetitionDetail,
@@ -26,7 +27,9 @@ from ..schemas.simulation import (
 )
 from .external_api import external_api_service
 from .prediction import PredictionService
+from .simulation_baseline import REGIONAL_SOURCES, simulation_baseline_service
 from ..core.config import settings
+from ..core.fanout import GatherResult, Source, gather_sources
 from ..data import clinic_profiles
 from ..data import marketing_plans
 from ..data import regional_rent
@@ -36,6 +39,19 @@ from ..data import clinic_lifecycle
 import logging
 logger = logging.getLogger(__name__)
 
+# 외부 소스별 데드라인 (초) — 초과 시 해당 소스만 폴백값으로 대체
+SOURCE_DEADLINES = {
+    "nearby_hospitals": 25.0,   # HIRA 목록 + 의원별 청구통계
+    "all_nearby": 20.0,
+    "commercial": 10.0,
+    "demographics": 15.0,
+    "nearby_facilities": 8.0,
+    "clinic_environment": 10.0,
+    "building_meta": 8.0,
+    # region_stats / closure_rate / non_covered_fees / search_trend 는
+    # simulation_baseline.REGIONAL_SOURCES (지역 기준값 번들과 공유)
+}
+
 
 class SimulationService:
     """개원 시뮬레이션 서비스 (OpenSim) - Enhanced Version"""
@@ -68,113 +84,59 @@ class SimulationService:
         else:
             raise ValueError("주소 또는 좌표(latitude/longitude) 중 하나는 필수입니다.")
 
-        # 2. 주변 병원 데이터 수집 (동일 진료과 — 매출 데이터 포함)
-        nearby_hospitals = await external_api_service.get_nearby_hospitals_with_revenue(
-            latitude, longitude, radius_m, request.clinic_type,
-            region_code=region_code,
-        )
-
-        # 2-1. 전체 의료기관 수 조회 (진료과 무관)
-        all_nearby = await external_api_service.get_nearby_hospitals(
-            latitude, longitude, radius_m, clinic_type=None,
-            region_code=region_code,
-        )
-
-        # 3. 지역/진료과별 평균 통계 조회
-        region_stats = await external_api_service.get_clinic_type_stats(
-            region_code, request.clinic_type
-        )
-
-        # 4. 상권 데이터 수집
-        commercial_data = await external_api_service.get_commercial_data(
-            latitude, longitude
+        # 2~5. 좌표/지역코드만 있으면 되는 외부 소스를 동시에 수집 (소스별 데드라인, 부분 결과 허용)
+        # 시군구×진료과 기준값 번들이 있으면 지역 소스·경쟁 의원 청구통계는 번들 값 사용
+        baseline = await simulation_baseline_service.get(db, region_code, request.clinic_type)
+        gathered = await self._gather_location_data(
+            latitude, longitude, radius_m, region_code, geo_data, request.clinic_type,
+            baseline=baseline.bundle if baseline else None,
         )
+        nearby_hospitals = gathered["nearby_hospitals"]  # 동일 진료과 — 매출 데이터 포함
+        all_nearby = gathered["all_nearby"]  # 전체 의료기관 (진료과 무관)
+        commercial_data = gathered["commercial"]
+        demographics_data = gathered["demographics"]
 
-        # 5. 인구통계 데이터 수집 (행안부 API → 추정 모델 폴백)
-        demographics_data = await external_api_service.get_demographics(
-            latitude, longitude, stdg_cd=region_code
-        )
-
-        # 5-1. 카카오 Local API로 주변 시설 실데이터 수집 (카운트)
-        try:
-            nearby_facilities_real = await external_api_service.get_nearby_facility_counts(
-                latitude, longitude, radius_m=500
-            )
-            demographics_data["nearby_facilities_real"] = nearby_facilities_real
-        except Exception as e:
-            logger.warning(f"카카오 nearby 호출 실패: {e}")
-
-        # 5-2. 카카오 키워드 검색으로 개원 환경 종합 데이터 수집
-        try:
-            clinic_env = await external_api_service.get_clinic_environment_data(
-                latitude, longitude
-            )
-            demographics_data["clinic_environment"] = clinic_env
-        except Exception as e:
-            logger.warning(f"카카오 키워드 검색 실패: {e}")
+        # 5-1/5-2. 카카오 Local API — 주변 시설 카운트 + 개원 환경 키워드 검색
+        if gathered["nearby_facilities"] is not None:
+            demographics_data["nearby_facilities_real"] = gathered["nearby_facilities"]
+        if gathered["clinic_environment"] is not None:
+            demographics_data["clinic_environment"] = gathered["clinic_environment"]
 
         # 5-4. region_code를 demographics에 보존 (나중에 build_response에서 사용)
         demographics_data["region_code"] = region_code
 
         # 5-5. LOCALDATA — 시군구 의원 5년 폐업률 + 평균 영업기간 (실시간)
-        real_closure_data = None
-        try:
-            from .localdata_client import localdata_client
-            if region_code and len(region_code) >= 5:
-                real_closure_data = await localdata_client.calculate_closure_rate(
-                    sido_cd=region_code[:2],
-                    sggu_cd=region_code[2:5],
-                    years=3,
-                )
-                demographics_data["real_closure_data"] = real_closure_data
-                logger.info(f"LOCALDATA closure: {real_closure_data}")
-        except Exception as e:
-            logger.warning(f"LOCALDATA 폐업이력 호출 실패: {e}")
+        real_closure_data = gathered["closure_rate"]
+        if real_closure_data is not None:
+            demographics_data["real_closure_data"] = real_closure_data
+            logger.info(f"LOCALDATA closure: {real_closure_data}")
 
         # 5-6. VWORLD — 건물 메타 (층수/용도/메디컬빌딩 여부) 실시간
-        building_meta = None
-        try:
-            from .vworld_client import vworld_client
-            building_meta = await vworld_client.get_building_info(latitude, longitude)
+        building_meta = gathered["building_meta"]
+        if gathered.timings["building_meta"]["status"] == "ok":
             demographics_data["building_meta"] = building_meta
             logger.info(f"VWORLD building: {building_meta}")
-        except Exception as e:
-            logger.warning(f"VWORLD 건물 호출 실패: {e}")
 
         # 5-7. HIRA 비급여 진료비 — 시군구×진료과 평균 단가 (실시간)
-        non_covered_fees = None
-        try:
-            from ..data.hira_region_codes import haeng_to_hira_codes
-            hira_sido, hira_sggu = haeng_to_hira_codes(region_code)
-            if hira_sido:
-                non_covered_fees = await external_api_service.get_non_covered_fees(
-                    sido_cd=hira_sido,
-                    sggu_cd=hira_sggu,
-                    clinic_type=request.clinic_type,
-                )
-                demographics_data["non_covered_fees"] = non_covered_fees
-                if non_covered_fees:
-                    logger.info(f"비급여 항목 {len(non_covered_fees)}건 조회")
-        except Exception as e:
-            logger.warning(f"HIRA 비급여 호출 실패: {e}")
+        non_covered_fees = gathered["non_covered_fees"]
+        if non_covered_fees is not None:
+            demographics_data["non_covered_fees"] = non_covered_fees
+            if non_covered_fees:
+                logger.info(f"비급여 항목 {len(non_covered_fees)}건 조회")
 
         # 5-8. 네이버 데이터랩 — 진료과+지역 검색 트렌드 (실시간)
-        search_trend = None
-        try:
-            from .naver_datalab import naver_datalab_client
-            sido_name_raw = (geo_data.get("sido_name") or geo_data.get("region_1depth_name") or "") if geo_data else ""
-            sido_parts = sido_name_raw.split() if sido_name_raw else []
-            sido_name = sido_parts[0] if sido_parts else ""
-            search_trend = await naver_datalab_client.get_search_trend(
-                clinic_type=request.clinic_type,
-                region_name=sido_name,
-                months=6,
-            )
-            if search_trend:
-                demographics_data["search_trend"] = search_trend
-                logger.info(f"네이버 트렌드 모멘텀: {search_trend['momentum']}")
-        except Exception as e:
-            logger.warning(f"네이버 데이터랩 호출 실패: {e}")
+        search_trend = gathered["search_trend"]
+        if search_trend:
+            demographics_data["search_trend"] = search_trend
+            logger.info(f"네이버 트렌드 모멘텀: {search_trend['momentum']}")
+
+        # 5-9. 소스별 소요 시간 (응답 realtime_data에 노출)
+        demographics_data["source_timings"] = gathered.summary()
+        if baseline is not None:
+            demographics_data["baseline"] = {
+                "source": baseline.source,
+                "built_at": baseline.built_at.isoformat(),
+            }
 
         # 5-3. 사용자 고급 입력 저장 (재조회 시에도 유지되도록)
         demographics_data["user_inputs"] = {
@@ -340,6 +302,17 @@ class SimulationService:
         )
 
         db.add(simulation)
+        # 번들이 없던 조합은 이번 실시간 수집 결과로 채움 (시뮬레이션과 같은 트랜잭션)
+        if baseline is None:
+            bundle = simulation_baseline_service.bundle_from_gathered(gathered, nearby_hospitals)
+            if bundle is not None:
+                try:
+                    async with db.begin_nested():
+                        await simulation_baseline_service.save(
+                            db, region_code, request.clinic_type, bundle, source="live", commit=False
+                        )
+                except Exception as e:
+                    logger.warning(f"Simulation baseline live save failed: {e}")
         await db.commit()
         await db.refresh(simulation)
 
@@ -350,6 +323,88 @@ class SimulationService:
             nearby_hospitals=all_nearby
         )
 
+    async def _gather_location_data(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: int,
+        region_code: str,
+        geo_data: Optional[Dict[str, Any]],
+        clinic_type: str,
+        baseline: Optional[Dict[str, Any]] = None,
+    ) -> GatherResult:
+        """좌표/지역코드만 필요로 하는 외부 소스 동시 수집.
+
+        각 소스는 SOURCE_DEADLINES 안에 끝나지 않거나 예외가 나면 폴백값으로
+        대체되고, 나머지 소스 결과는 그대로 사용한다 (부분 결과).
+        baseline(지역 기준값 번들)이 있으면 지역 소스는 호출하지 않고 번들 값을 쓴다.
+        """
+        from .vworld_client import vworld_client
+
+        api = external_api_service
+        known_billing = baseline.get("billing") if baseline else None
+        sources = [
+            Source(
+                "nearby_hospitals",
+                lambda: api.get_nearby_hospitals_with_revenue(
+                    latitude, longitude, radius_m, clinic_type,
+                    region_code=region_code, known_billing=known_billing,
+                ),
+                timeout=SOURCE_DEADLINES["nearby_hospitals"],
+                default=list,
+            ),
+            Source(
+                "all_nearby",
+                lambda: api.get_nearby_hospitals(
+                    latitude, longitude, radius_m, clinic_type=None, region_code=region_code,
+                ),
+                timeout=SOURCE_DEADLINES["all_nearby"],
+                default=list,
+            ),
+            Source(
+                "commercial",
+                lambda: api.get_commercial_data(latitude, longitude),
+                timeout=SOURCE_DEADLINES["commercial"],
+                default=dict,
+            ),
+            Source(
+                "demographics",
+                lambda: api.get_demographics(latitude, longitude, stdg_cd=region_code),
+                timeout=SOURCE_DEADLINES["demographics"],
+                default=lambda: api.estimate_demographics(latitude, longitude),
+            ),
+            Source(
+                "nearby_facilities",
+                lambda: api.get_nearby_facility_counts(latitude, longitude, radius_m=500),
+                timeout=SOURCE_DEADLINES["nearby_facilities"],
+            ),
+            Source(
+                "clinic_environment",
+                lambda: api.get_clinic_environment_data(latitude, longitude),
+                timeout=SOURCE_DEADLINES["clinic_environment"],
+            ),
+            Source(
+                "building_meta",
+                lambda: vworld_client.get_building_info(latitude, longitude),
+                timeout=SOURCE_DEADLINES["building_meta"],
+            ),
+        ]
+        if baseline is None:
+            sources += simulation_baseline_service.regional_sources(region_code, clinic_type)
+        else:
+            # 번들에 없는 지역 소스 (추정값이라 굳히지 않은 closure_rate 등)는 실시간 수집
+            missing = [name for name in REGIONAL_SOURCES if name not in baseline]
+            if missing:
+                sources += simulation_baseline_service.regional_sources(region_code, clinic_type, only=missing)
+
+        gathered = await gather_sources(sources, label="simulation.gather")
+        if baseline is not None:
+            for name in REGIONAL_SOURCES:
+                if name in baseline:
+                    gathered.results[name] = baseline[name]
+                    gathered.timings[name] = {"ms": 0, "status": "baseline"}
+        return gathered
+
     async def get_simulation(
         self,
         db: AsyncSession,
@@ -367,40 +422,87 @@ class SimulationService:
         competitors = simulation.competitors_data or []
         return self._build_response(simulation, competitors, simulation.clinic_type)
 
+    # 목록 조회에 필요한 컬럼만 (competitors_data/demographics_data 등 JSON·상세 분석 제외)
+    SUMMARY_COLUMNS = (
+        Simulation.id, Simulation.address, Simulation.clinic_type,
+        Simulation.size_pyeong, Simulation.budget_million,
+        Simulation.est_revenue_avg, Simulation.est_cost_total, Simulation.monthly_profit_avg,
+        Simulation.breakeven_months, Simulation.confidence_score, Simulation.recommendation,
+        Simulation.is_paid, Simulation.created_at,
+    )
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, simulation_id: UUID) -> str:
+        raw = f"{created_at.isoformat()}|{simulation_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple:
+        """커서 → (created_at, id). 형식이 잘못되면 ValueError"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            created_at, simulation_id = raw.split("|", 1)
+            return datetime.fromisoformat(created_at), UUID(simulation_id)
+        except Exception as e:
+            raise ValueError(f"invalid cursor: {cursor}") from e
+
     async def get_user_simulations(
         self,
         db: AsyncSession,
         user_id: UUID,
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """사용자 시뮬레이션 목록 조회"""
-        offset = (page - 1) * page_size
+        """
+        사용자 시뮬레이션 목록 조회 (요약 컬럼만)
 
+        cursor가 있으면 (created_at, id) keyset으로 이어서 조회 (page는 응답 표시용),
+        없으면 page 기준 offset. 둘 다 (user_id, created_at, id) 인덱스 사용.
+        """
         # Get total count
-        count_result = await db.execute(
-            select(Simulation).where(Simulation.user_id == user_id)
-        )
-        total = len(count_result.scalars().all())
+        total = (await db.execute(
+            select(func.count()).select_from(Simulation).where(Simulation.user_id == user_id)
+        )).scalar() or 0
 
-        # Get paginated items
-        result = await db.execute(
-            select(Simulation)
+        query = (
+            select(*self.SUMMARY_COLUMNS)
             .where(Simulation.user_id == user_id)
-            .order_by(desc(Simulation.created_at))
-            .offset(offset)
-            .limit(page_size)
+            .order_by(desc(Simulation.created_at), desc(Simulation.id))
+            .limit(page_size + 1)
         )
-        simulations = result.scalars().all()
+        if cursor:
+            created_at, simulation_id = self.decode_cursor(cursor)
+            query = query.where(tuple_(Simulation.created_at, Simulation.id) < tuple_(created_at, simulation_id))
+        else:
+            query = query.offset((page - 1) * page_size)
+        rows = (await db.execute(query)).all()
 
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
         return {
             "items": [
-                self._build_response(sim, sim.competitors_data or [], sim.clinic_type)
-                for sim in simulations
+                SimulationSummary(
+                    simulation_id=row.id,
+                    address=row.address,
+                    clinic_type=row.clinic_type,
+                    size_pyeong=row.size_pyeong,
+                    budget_million=row.budget_million,
+                    est_revenue_avg=row.est_revenue_avg,
+                    est_cost_total=row.est_cost_total,
+                    monthly_profit_avg=row.monthly_profit_avg,
+                    breakeven_months=row.breakeven_months,
+                    confidence_score=row.confidence_score,
+                    recommendation=row.recommendation.value if row.recommendation else None,
+                    is_paid=bool(row.is_paid),
+                    created_at=row.created_at,
+                )
+                for row in rows
             ],
             "total": total,
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": self.encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
         }
 
     async def get_competitors_detail(
@@ -2020,6 +2122,7 @@ class SimulationService:
             "building_meta": demographics_data.get("building_meta"),
             "non_covered_fees_count": len(demographics_data.get("non_covered_fees") or []),
             "search_trend": demographics_data.get("search_trend"),
+            "source_timings": demographics_data.get("source_timings"),
         }
 
 
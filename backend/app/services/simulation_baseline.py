@@ -0,0 +1,221 @@
+"""
+시뮬레이션 지역 기준값 번들 (시군구 × 진료과)
+
+시뮬레이션 입력 중 좌표·사용자와 무관하게 (region_code, clinic_type)로만 결정되는 값을
+미리 계산해 simulation_baselines 테이블에 저장하고 create_simulation이 재사용한다.
+
+번들 구성:
+    - region_stats / closure_rate / non_covered_fees / search_trend: 지역 소스 결과
+      (search_trend 키워드의 시도명은 geo_data가 아닌 지역코드에서 구함 → nightly와 실시간이 같은 키워드.
+       추정값인 closure_rate는 번들에 넣지 않고 요청마다 다시 조회)
+    - billing: 시군구 동일과 의원 {ykiho: 청구통계} (반경 내 경쟁 의원 매출 조회 생략용)
+
+경쟁 의원 목록·인구·상권은 좌표(반경)에 따라 달라지므로 번들에 넣지 않는다.
+반경 목록은 로컬 HIRA 스냅샷(hira_snapshot), 인구·상권은 tiered_cache가 담당한다.
+평수·임대료·인건비·마케팅·예측은 항상 요청마다 다시 계산한다.
+
+갱신:
+    - nightly: Celery beat가 최근 시뮬레이션의 (시군구, 진료과) 조합을 일괄 재계산
+    - live: 번들이 없거나 오래된 조합은 실시간 수집 결과로 바로 채움 (다음 요청부터 재사용)
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.fanout import GatherResult, Source, gather_sources
+from ..data.hira_region_codes import haeng_to_sido_name
+from ..models.simulation import SimulationBaseline
+from .external_api import external_api_service
+
+logger = logging.getLogger(__name__)
+
+# 번들 유효 기간 — nightly 갱신이 하루 이틀 실패해도 재사용
+BASELINE_MAX_AGE = timedelta(hours=72)
+# 번들에 담는 지역 소스 (이름, 데드라인 초)
+REGIONAL_SOURCES = {
+    "region_stats": 10.0,
+    "closure_rate": 15.0,
+    "non_covered_fees": 10.0,
+    "search_trend": 8.0,
+}
+# nightly 빌드의 청구통계 조회 예산 (요청 경로의 HIRA_BILLING_BUDGET_SECONDS보다 넉넉하게)
+BUILD_BILLING_BUDGET = 120.0
+
+
+def sggu_key(region_code: str) -> str:
+    """행안부 지역코드 → 번들 키 (시도+시군구 5자리). 코드가 짧으면 빈 문자열"""
+    return region_code[:5] if region_code and len(region_code) >= 5 else ""
+
+
+def _bundle_values(results: Dict[str, Any]) -> Dict[str, Any]:
+    """지역 소스 결과 중 번들에 굳힐 값 (추정값 closure_rate는 제외 → 요청마다 재조회)"""
+    bundle = {name: results[name] for name in REGIONAL_SOURCES}
+    closure = bundle.get("closure_rate")
+    if not closure or closure.get("is_estimated", True):
+        bundle.pop("closure_rate", None)
+    return bundle
+
+
+class SimulationBaselineService:
+    """시뮬레이션 지역 기준값 번들 조회·저장·빌드"""
+
+    def regional_sources(
+        self,
+        region_code: str,
+        clinic_type: str,
+        only: Optional[List[str]] = None,
+    ) -> List[Source]:
+        """(지역, 진료과)로만 결정되는 소스 목록 — 실시간 수집과 nightly 빌드가 공유 (only: 일부 소스만)"""
+        from .localdata_client import localdata_client
+        from .naver_datalab import naver_datalab_client
+        from ..data.hira_region_codes import haeng_to_hira_codes
+
+        api = external_api_service
+
+        async def closure_rate():
+            if not region_code or len(region_code) < 5:
+                return None
+            return await localdata_client.calculate_closure_rate(
+                sido_cd=region_code[:2],
+                sggu_cd=region_code[2:5],
+                years=3,
+            )
+
+        async def non_covered_fees():
+            hira_sido, hira_sggu = haeng_to_hira_codes(region_code)
+            if not hira_sido:
+                return None
+            return await api.get_non_covered_fees(
+                sido_cd=hira_sido,
+                sggu_cd=hira_sggu,
+                clinic_type=clinic_type,
+            )
+
+        async def search_trend():
+            return await naver_datalab_client.get_search_trend(
+                clinic_type=clinic_type,
+                region_name=haeng_to_sido_name(region_code),
+                months=6,
+            )
+
+        sources = [
+            Source(
+                "region_stats",
+                lambda: api.get_clinic_type_stats(region_code, clinic_type),
+                timeout=REGIONAL_SOURCES["region_stats"],
+                default=lambda: api._get_default_clinic_stats(clinic_type),
+            ),
+            Source("closure_rate", closure_rate, timeout=REGIONAL_SOURCES["closure_rate"]),
+            Source("non_covered_fees", non_covered_fees, timeout=REGIONAL_SOURCES["non_covered_fees"]),
+            Source("search_trend", search_trend, timeout=REGIONAL_SOURCES["search_trend"]),
+        ]
+        if only is not None:
+            sources = [source for source in sources if source.name in only]
+        return sources
+
+    async def get(
+        self,
+        db: AsyncSession,
+        region_code: str,
+        clinic_type: str,
+    ) -> Optional[SimulationBaseline]:
+        """
+        유효 기간 내 번들 조회. 없거나 오래됐거나 DB 오류면 None (실시간 수집으로 진행)
+
+        조회는 savepoint 안에서 실행 — 실패해도 요청 트랜잭션이 중단되지 않아 시뮬레이션 저장은 계속됨
+        """
+        key = sggu_key(region_code)
+        if not key:
+            return None
+        try:
+            async with db.begin_nested():
+                baseline = await db.get(SimulationBaseline, (key, clinic_type))
+        except Exception as e:
+            logger.warning(f"Simulation baseline lookup failed ({key}/{clinic_type}): {e}")
+            return None
+        if baseline is None or baseline.built_at < datetime.utcnow() - BASELINE_MAX_AGE:
+            return None
+        return baseline
+
+    def bundle_from_gathered(
+        self,
+        gathered: GatherResult,
+        hospitals: List[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """실시간 수집 결과 → 번들. 지역 소스가 하나라도 실패했으면 None (폴백값을 굳히지 않음)"""
+        if any(gathered.timings.get(name, {}).get("status") != "ok" for name in REGIONAL_SOURCES):
+            return None
+        bundle = _bundle_values(gathered.results)
+        bundle["billing"] = {
+            h["ykiho"]: h["billing_data"]
+            for h in hospitals
+            if h.get("ykiho") and h.get("billing_data")
+        }
+        return bundle
+
+    async def save(
+        self,
+        db: AsyncSession,
+        region_code: str,
+        clinic_type: str,
+        bundle: Dict[str, Any],
+        source: str = "nightly",
+        commit: bool = True,
+    ) -> None:
+        """
+        번들 upsert — 동시 저장과 충돌해도 마지막 값으로 덮어씀
+
+        commit=False면 호출자 트랜잭션에 포함 (시뮬레이션 저장과 함께 반영)
+        """
+        key = sggu_key(region_code)
+        if not key:
+            return
+        values = {
+            "sggu_cd": key,
+            "clinic_type": clinic_type,
+            "bundle": bundle,
+            "source": source,
+            "built_at": datetime.utcnow(),
+        }
+        stmt = pg_insert(SimulationBaseline).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["sggu_cd", "clinic_type"],
+            set_={k: stmt.excluded[k] for k in ("bundle", "source", "built_at")},
+        )
+        await db.execute(stmt)
+        if commit:
+            await db.commit()
+
+    async def build(self, region_code: str, clinic_type: str) -> Optional[Dict[str, Any]]:
+        """
+        (시군구, 진료과) 번들 계산 (nightly)
+
+        지역 소스 + 시군구 동일과 의원 청구통계. 지역 소스가 실패하면 None —
+        기존 번들을 폴백값으로 덮어쓰지 않는다.
+        """
+        gathered = await gather_sources(
+            self.regional_sources(region_code, clinic_type),
+            label="simulation.baseline",
+        )
+        if gathered.failed:
+            logger.warning(
+                f"Simulation baseline {sggu_key(region_code)}/{clinic_type} skipped: "
+                f"failed sources {gathered.failed}"
+            )
+            return None
+
+        hospitals = await external_api_service._fetch_hira_hospitals(region_code, clinic_type)
+        billing_by_ykiho = await external_api_service.get_hospital_billing_stats_batch(
+            [h["ykiho"] for h in hospitals if h.get("ykiho")],
+            budget_seconds=BUILD_BILLING_BUDGET,
+        )
+        bundle = _bundle_values(gathered.results)
+        bundle["billing"] = {ykiho: billing for ykiho, billing in billing_by_ykiho.items() if billing}
+        return bundle
+
+
+# 전역 인스턴스
+simulation_baseline_service = SimulationBaselineService()
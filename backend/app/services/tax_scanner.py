@@ -35,6 +35,9 @@ class BaseCategoryScanner(ABC):
         """
         스캔 실행 — 해당 카테고리에서 누락/최적화 가능한 공제 항목 탐색
 
+        filing_data는 같은 연도의 다른 스캐너와 공유되므로 읽기만 할 것.
+        동종 벤치마크는 filing_data["peer_benchmark"]에 미리 채워져 있음.
+
         Returns:
             발견 항목 리스트 [{title, description, severity, estimated_amount, ...}]
         """
@@ -430,18 +433,94 @@ SCANNER_REGISTRY: list[BaseCategoryScanner] = [
 ]
 
 
+def filing_data_from_history(filing) -> dict:
+    """TaxFilingHistory → 스캐너 입력 (원본 데이터 위에 정규화된 컬럼을 덮어씀)"""
+    return {
+        **(filing.raw_data or {}),
+        "gross_income": filing.gross_income,
+        "business_income": filing.business_income,
+        "salary_income": filing.salary_income,
+        "necessary_expenses": filing.necessary_expenses,
+        "expense_breakdown": filing.expense_breakdown or {},
+        "deductions_total": filing.deductions_total,
+        "deductions_breakdown": filing.deductions_breakdown or {},
+        "credits_total": filing.credits_total,
+        "credits_breakdown": filing.credits_breakdown or {},
+    }
+
+
 class TaxScannerService:
-    """AI 세금 스캐너 — 모든 카테고리 스캐너를 실행하고 결과 통합"""
+    """
+    AI 세금 스캐너 — 모든 카테고리 스캐너를 실행하고 결과 통합
+
+    실행 순서:
+    1. 입력 일괄 로드 — 연도별 신고 데이터(IN 조회 1회), 동종 벤치마크(IN 조회 1회)
+    2. 연도 → 스캐너 등록 순서로 순차 실행 (스캐너별 소요 시간 기록).
+       스캐너는 미리 로드한 입력만 계산하는 CPU 작업이라 동시 실행해도 빨라지지 않음
+    """
 
     def __init__(self, scanners: Optional[list] = None):
         self.scanners = scanners or SCANNER_REGISTRY
 
+    async def load_filing_data(
+        self, db: AsyncSession, user_id, tax_years: list, specialty: str = "",
+    ) -> dict:
+        """연도별 종합소득세 신고 데이터 일괄 로드 → {year: filing_data}"""
+        from app.models.tax_filing import FilingType, TaxFilingHistory
+
+        result = await db.execute(
+            select(TaxFilingHistory)
+            .where(
+                and_(
+                    TaxFilingHistory.user_id == user_id,
+                    TaxFilingHistory.tax_year.in_(tax_years),
+                    TaxFilingHistory.filing_type == FilingType.INCOME_TAX,
+                )
+            )
+            .order_by(TaxFilingHistory.tax_year, TaxFilingHistory.updated_at)
+        )
+        filing_data_by_year = {}
+        for filing in result.scalars():
+            # 같은 연도 신고가 여러 건이면 가장 최근 갱신분 사용
+            filing_data_by_year[filing.tax_year] = {
+                **filing_data_from_history(filing),
+                "specialty": specialty,
+            }
+        return filing_data_by_year
+
+    async def _run_scanner(
+        self,
+        scanner: BaseCategoryScanner,
+        db: AsyncSession,
+        user_id: str,
+        year: int,
+        filing_data: dict,
+    ) -> tuple:
+        """스캐너 1개 실행 → (발견 항목, 소요 시간 기록). 실패해도 다른 스캐너는 계속"""
+        started = time.perf_counter()
+        findings, error = [], None
+        try:
+            findings = await scanner.scan(db, user_id, year, filing_data)
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Scanner {scanner.category} failed for year {year}: {e}")
+        timing = {
+            "tax_year": year,
+            "category": scanner.category,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "findings": len(findings),
+            "error": error,
+        }
+        return findings, timing
+
     async def run_full_scan(
         self,
         db: AsyncSession,
         user_id: str,
         tax_years: list,
-        filing_data_by_year: dict,
+        filing_data_by_year: Optional[dict] = None,
+        specialty: str = "",
+        scan_type: str = "FULL",
     ) -> dict:
         """
         전체 스캔 실행
@@ -450,7 +529,9 @@ class TaxScannerService:
             db: DB 세션
             user_id: 사용자 UUID
             tax_years: 스캔 대상 연도 리스트
-            filing_data_by_year: {year: filing_data_dict}
+            filing_data_by_year: {year: filing_data_dict} (없으면 신고 이력에서 일괄 로드)
+            specialty: 진료과목 (filing_data_by_year를 로드할 때 벤치마크 조회용)
+            scan_type: 스캔 기록 유형 (월간 자동 스캔은 SCHEDULED_SCAN_TYPE)
 
         Returns:
             통합 스캔 결과
@@ -462,7 +543,7 @@ class TaxScannerService:
         # 스캔 기록 생성
         scan_result = TaxScanResult(
             user_id=user_id,
-            scan_type="FULL",
+            scan_type=scan_type,
             tax_years=tax_years,
             status=TaxScanStatus.SCANNING,
             started_at=datetime.utcnow(),
@@ -471,31 +552,33 @@ class TaxScannerService:
         await db.flush()
 
         try:
-            all_findings = []
-            total_potential_refund = 0
-            total_tax_savings = 0
-
-            for year in tax_years:
-                filing_data = filing_data_by_year.get(year, {})
-                if not filing_data:
-                    continue
-
-                # 동종 벤치마크 데이터 로드
-                peer_data = await self._load_peer_benchmark(db, year, filing_data)
-                filing_data["peer_benchmark"] = peer_data
+            # 1. 입력 일괄 로드
+            prefetch_started = time.perf_counter()
+            if filing_data_by_year is None:
+                filing_data_by_year = await self.load_filing_data(db, user_id, tax_years, specialty)
+            years = [y for y in tax_years if filing_data_by_year.get(y)]
+            benchmarks = await self._load_peer_benchmarks(
+                db, [(y, filing_data_by_year[y].get("specialty", "")) for y in years],
+            )
+            contexts = {
+                y: {
+                    **filing_data_by_year[y],
+                    "peer_benchmark": benchmarks.get((str(y), filing_data_by_year[y].get("specialty", "")), {}),
+                }
+                for y in years
+            }
+            prefetch_ms = round((time.perf_counter() - prefetch_started) * 1000, 2)
 
+            # 2. 연도 × 스캐너 순차 실행
+            all_findings = []
+            timings = []
+            for y in years:
                 for scanner in self.scanners:
-                    try:
-                        findings = await scanner.scan(db, user_id, year, filing_data)
-                        all_findings.extend(findings)
-
-                        for f in findings:
-                            total_potential_refund += f.get("estimated_amount", 0)
-                            total_tax_savings += f.get("tax_savings", 0)
-                    except Exception as e:
-                        logger.error(
-                            f"Scanner {scanner.category} failed for year {year}: {e}"
-                        )
+                    findings, timing = await self._run_scanner(scanner, db, user_id, y, contexts[y])
+                    all_findings.extend(findings)
+                    timings.append(timing)
+            total_potential_refund = sum(f.get("estimated_amount", 0) for f in all_findings)
+            total_tax_savings = sum(f.get("tax_savings", 0) for f in all_findings)
 
             # 신뢰도 계산 (발견 항목의 가중 평균)
             if all_findings:
@@ -508,12 +591,15 @@ class TaxScannerService:
             else:
                 avg_confidence = 0.0
 
-            # 동종 벤치마크 요약
-            peer_summary = await self._build_peer_summary(
-                db, tax_years, filing_data_by_year,
-            )
+            # 동종 벤치마크 요약 (이미 로드한 벤치마크 사용)
+            peer_summary = self._build_peer_summary(tax_years, contexts)
 
             duration_ms = int((time.time() - start_time) * 1000)
+            scanner_timings = {
+                "prefetch_ms": prefetch_ms,
+                "slowest_ms": max((t["duration_ms"] for t in timings), default=0),
+                "scanners": timings,
+            }
 
             # 스캔 결과 업데이트
             scan_result.status = TaxScanStatus.COMPLETED
@@ -523,6 +609,7 @@ class TaxScannerService:
             scan_result.total_tax_savings = total_tax_savings
             scan_result.confidence = round(avg_confidence, 3)
             scan_result.peer_benchmark = peer_summary
+            scan_result.scanner_timings = scanner_timings
             scan_result.completed_at = datetime.utcnow()
             scan_result.duration_ms = duration_ms
             scan_result.model_version = "scanner-v1.0"
@@ -538,6 +625,7 @@ class TaxScannerService:
                 "total_tax_savings": total_tax_savings,
                 "confidence": round(avg_confidence, 3),
                 "peer_benchmark": peer_summary,
+                "scanner_timings": scanner_timings,
                 "duration_ms": duration_ms,
             }
 
@@ -572,27 +660,29 @@ class TaxScannerService:
             "required_documents": scanner.get_required_documents(),
         }
 
-    async def _load_peer_benchmark(
-        self, db: AsyncSession, tax_year: int, filing_data: dict,
-    ) -> dict:
-        """동종 업계 벤치마크 데이터 로드"""
+    async def _load_peer_benchmarks(self, db: AsyncSession, year_specialties: list) -> dict:
+        """동종 업계 벤치마크 일괄 로드 → {(period, specialty): benchmark_dict}"""
         from app.models.tax_regulation import TaxPeerBenchmark
 
-        specialty = filing_data.get("specialty", "")
-        if not specialty:
+        periods = {str(y) for y, specialty in year_specialties if specialty}
+        specialties = {specialty for _, specialty in year_specialties if specialty}
+        if not periods:
             return {}
 
         result = await db.execute(
-            select(TaxPeerBenchmark).where(
+            select(TaxPeerBenchmark)
+            .where(
                 and_(
-                    TaxPeerBenchmark.period == str(tax_year),
-                    TaxPeerBenchmark.specialty == specialty,
+                    TaxPeerBenchmark.period.in_(periods),
+                    TaxPeerBenchmark.specialty.in_(specialties),
                 )
             )
+            # 지역 구분 없는 전국 벤치마크 우선
+            .order_by(TaxPeerBenchmark.region.is_(None).desc())
         )
-        benchmark = result.scalar_one_or_none()
-        if benchmark:
-            return {
+        benchmarks = {}
+        for benchmark in result.scalars():
+            benchmarks.setdefault((benchmark.period, benchmark.specialty), {
                 "avg_gross_income": benchmark.avg_gross_income,
                 "avg_necessary_expenses": benchmark.avg_necessary_expenses,
                 "avg_expense_rate": benchmark.avg_expense_rate,
@@ -600,19 +690,17 @@ class TaxScannerService:
                 "avg_deduction_by_category": benchmark.avg_deduction_by_category,
                 "percentiles": benchmark.percentiles,
                 "sample_size": benchmark.sample_size,
-            }
-        return {}
+            })
+        return benchmarks
 
-    async def _build_peer_summary(
-        self, db: AsyncSession, tax_years: list, filing_data_by_year: dict,
-    ) -> dict:
+    def _build_peer_summary(self, tax_years: list, contexts: dict) -> dict:
         """동종 비교 요약 생성"""
         # 가장 최근 연도 기준으로 요약
         latest_year = max(tax_years) if tax_years else None
         if not latest_year:
             return {}
 
-        filing = filing_data_by_year.get(latest_year, {})
+        filing = contexts.get(latest_year, {})
         specialty = filing.get("specialty", "")
 
         user_deduction_rate = 0.0
@@ -12,6 +12,7 @@ from decimal import Decimal
 from dataclasses import dataclass
 
 from ..core.config import settings
+from ..core.http_client import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -115,7 +116,7 @@ class TossPaymentsService:
         이때 받은 paymentKey, orderId, amount로 승인을 요청
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("toss") as client:
                 response = await client.post(
                     f"{self.BASE_URL}/payments/confirm",
                     headers=self._get_auth_header(),
@@ -167,7 +168,7 @@ class TossPaymentsService:
     async def get_payment(self, payment_key: str) -> Optional[Dict[str, Any]]:
         """결제 정보 조회"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("toss") as client:
                 response = await client.get(
                     f"{self.BASE_URL}/payments/{payment_key}",
                     headers=self._get_auth_header(),
@@ -200,7 +201,7 @@ class TossPaymentsService:
             if cancel_amount:
                 payload["cancelAmount"] = cancel_amount
 
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("toss") as client:
                 response = await client.post(
                     f"{self.BASE_URL}/payments/{payment_key}/cancel",
                     headers=self._get_auth_header(),
@@ -294,7 +295,7 @@ class TossPaymentsService:
         POST /v1/billing/authorizations/issue
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("toss") as client:
                 response = await client.post(
                     f"{self.BASE_URL}/billing/authorizations/issue",
                     headers=self._get_billing_auth_header(),
@@ -346,7 +347,7 @@ class TossPaymentsService:
         POST /v1/billing/{billingKey}
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("toss") as client:
                 response = await client.post(
                     f"{self.BASE_URL}/billing/{billing_key}",
                     headers=self._get_billing_auth_header(),
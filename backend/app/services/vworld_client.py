@@ -6,10 +6,11 @@ VWORLD (vworld.kr) 공간정보 클라이언트.
 메디컬빌딩 여부 ±15%.
 """
 from typing import Dict, Optional, Any
-import httpx
 import logging
 
 from ..core.config import settings
+from ..core.http_client import pooled_client
+from ..core.tiered_cache import tiered_cache
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +53,21 @@ class VWorldClient:
             logger.debug("VWORLD: no API key configured — using fallback")
             return self._fallback_building_info(latitude, longitude)
 
+        # 좌표 소수 5자리(약 1m) 단위 캐시 — 폴백값은 저장하지 않음
+        return await tiered_cache.get_or_fetch(
+            "vworld_building",
+            f"{latitude:.5f}:{longitude:.5f}",
+            lambda: self._fetch_building_info(latitude, longitude),
+            cache_if=lambda r: bool(r) and r.get("data_source") == "VWORLD 건축물정보",
+        )
+
+    async def _fetch_building_info(
+        self,
+        latitude: float,
+        longitude: float,
+    ) -> Optional[Dict[str, Any]]:
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client("vworld") as client:
                 params = {
                     "service": "data",
                     "request": "GetFeature",
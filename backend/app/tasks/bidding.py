@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 import asyncio
 
+from .celery_app import close_task_loop
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +26,7 @@ def expire_old_bids():
         result = loop.run_until_complete(_expire_bids_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _expire_bids_async():
@@ -129,7 +131,7 @@ def auto_match_slots():
         result = loop.run_until_complete(_auto_match_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _auto_match_async():
@@ -227,7 +229,7 @@ def process_bid_placed(self, bid_id: int):
         logger.error(f"Failed to process bid: {e}")
         self.retry(exc=e, countdown=60)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _process_bid_placed_async(bid_id: int):
@@ -306,7 +308,7 @@ def calculate_slot_statistics():
         result = loop.run_until_complete(_calculate_stats_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _calculate_stats_async():
@@ -376,7 +378,7 @@ def cleanup_old_bids():
         result = loop.run_until_complete(_cleanup_bids_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _cleanup_bids_async():
@@ -7,9 +7,10 @@
 """
 from datetime import datetime, timedelta
 from celery import shared_task
-import asyncio
 from sqlalchemy import select, func, and_
 
+from .celery_app import run_task
+
 
 async def _detect_circumvention():
     """우회거래 패턴 자동 탐지"""
@@ -212,10 +213,10 @@ async def _refresh_broker_stats():
 @shared_task(name="app.tasks.broker_tasks.detect_circumvention")
 def detect_circumvention():
     """우회거래 자동 탐지"""
-    asyncio.run(_detect_circumvention())
+    run_task(_detect_circumvention())
 
 
 @shared_task(name="app.tasks.broker_tasks.refresh_broker_stats")
 def refresh_broker_stats():
     """브로커 성과 캐시 갱신"""
-    asyncio.run(_refresh_broker_stats())
+    run_task(_refresh_broker_stats())
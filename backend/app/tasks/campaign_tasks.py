@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 import asyncio
 
+from .celery_app import close_task_loop
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +39,7 @@ def run_sms_campaign(campaign_id: str, target_grade: str = "HOT", limit: int = 1
         logger.error(f"SMS campaign failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _run_sms_campaign_async(campaign_id: str, target_grade: str, limit: int):
@@ -122,7 +124,7 @@ def run_email_campaign(campaign_id: str, target_grade: str = "HOT", limit: int =
         logger.error(f"Email campaign failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _run_email_campaign_async(campaign_id: str, target_grade: str, limit: int):
@@ -247,7 +249,7 @@ def send_single_sms(phone: str, message: str):
         logger.error(f"Single SMS failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _send_single_sms_async(phone: str, message: str):
@@ -273,7 +275,7 @@ def get_campaign_stats():
         logger.error(f"Get stats failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _get_campaign_stats_async():
@@ -3,8 +3,13 @@ Celery 애플리케이션 설정
 """
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
+import asyncio
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 # Redis URL
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -26,6 +31,7 @@ celery_app = Celery(
         "app.tasks.broker_tasks",
         "app.tasks.claims_tasks",
         "app.tasks.maintenance_tasks",
+        "app.tasks.simulation_tasks",
     ]
 )
 
@@ -43,6 +49,47 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,
 )
 
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """prefork 자식 프로세스 시작 시 부모에게서 물려받은 HTTP 풀 초기화 + DB는 NullPool 사용"""
+    from app.core.database import use_null_pool
+    from app.core.http_client import reset_http_clients
+    reset_http_clients()
+    # 태스크마다 새 이벤트 루프를 만들기 때문에 루프에 묶인 asyncpg 커넥션을 풀에 둘 수 없음
+    use_null_pool()
+
+
+def close_task_loop(loop):
+    """
+    태스크 전용 이벤트 루프 종료 (loop.close() 대체)
+
+    루프가 닫히기 전에 그 루프에 묶인 공유 HTTP 풀을 aclose()하고, 태스크 중 커밋된
+    사용자/구독 변경의 principal 캐시 무효화와 채팅방 권한 캐시 무효화를 Redis에 반영한다.
+    """
+    from app.core.http_client import close_http_clients
+    from app.services.chat_writer import chat_writer
+    from app.services.principal_cache import principal_cache
+
+    if not loop.is_closed() and not loop.is_running():
+        for cleanup in (principal_cache.flush_invalidations, chat_writer.flush_invalidations, close_http_clients):
+            try:
+                loop.run_until_complete(cleanup())
+            except Exception as e:
+                logger.warning(f"Task loop cleanup {cleanup.__name__} failed: {e}")
+    loop.close()
+
+
+def run_task(coro):
+    """asyncio.run 대체 — 새 루프에서 실행 후 close_task_loop로 정리"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        close_task_loop(loop)
+
+
 # 주기적 태스크 스케줄
 celery_app.conf.beat_schedule = {
     # 매일 새벽 2시: 전체 크롤링
@@ -50,6 +97,16 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.crawl.run_daily_crawl",
         "schedule": crontab(hour=2, minute=0),
     },
+    # 매일 새벽 1시 30분: 심평원 요양기관 스냅샷 재구축 (반경 조회 로컬 인덱스)
+    "rebuild-hira-snapshot": {
+        "task": "app.tasks.crawl.rebuild_hira_snapshot",
+        "schedule": crontab(hour=1, minute=30),
+    },
+    # 매일 새벽 2시 30분: 시뮬레이션 지역 기준값 번들 재계산 (스냅샷 재구축 이후)
+    "rebuild-simulation-baselines": {
+        "task": "app.tasks.simulation_tasks.rebuild_simulation_baselines",
+        "schedule": crontab(hour=2, minute=30),
+    },
     # 매 6시간: 폐업 체크
     "check-closed-hospitals": {
         "task": "app.tasks.crawl.check_closed_hospitals",
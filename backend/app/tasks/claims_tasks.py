@@ -21,7 +21,7 @@
 import logging
 from datetime import datetime
 
-from .celery_app import celery_app
+from .celery_app import celery_app, run_task
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +32,7 @@ def reanalyze_pending_claims():
     DRAFT/READY 상태 청구 건에 대해 AI 리스크 재분석.
     새로운 심사기준 업데이트 반영.
     """
-    import asyncio
-    asyncio.run(_reanalyze_pending_claims_async())
+    run_task(_reanalyze_pending_claims_async())
 
 
 async def _reanalyze_pending_claims_async():
@@ -90,71 +89,151 @@ def monthly_tax_scan():
     매월 1일 — 전체 DOCTOR 유저에 대한 세무 스캔.
     놓친 공제 항목 자동 탐지.
     """
-    import asyncio
-    asyncio.run(_monthly_tax_scan_async())
+    run_task(_monthly_tax_scan_async())
+
+
+# 월간 세무 스캔 — 집계 결과를 나눠 처리하는 단위 / 동시 스캐너 실행 수
+TAX_SCAN_CHUNK_SIZE = 500
+TAX_SCAN_PARALLELISM = 8
+# 의료비 세액공제 검토 기준 본인부담금 합계
+TAX_SCAN_COPAY_THRESHOLD = 3_000_000
+
+
+async def _scan_doctor(user_id, tax_year: int, filing_data: dict, semaphore) -> int:
+    """
+    의사 1명 세금 스캔 (세션 분리 — 병렬 실행). 발견 항목 수 반환
+
+    자동 스캔은 SCHEDULED 유형으로 (사용자, 연도)당 1건만 유지 — 이전 자동 스캔을 지우고 새로 기록
+    """
+    from sqlalchemy import delete
+    from app.core.database import async_session
+    from app.models.tax_scan import SCHEDULED_SCAN_TYPE, TaxScanResult
+    from app.services.tax_scanner import tax_scanner_service
+
+    async with semaphore:
+        try:
+            async with async_session() as db:
+                await db.execute(
+                    delete(TaxScanResult).where(
+                        TaxScanResult.user_id == user_id,
+                        TaxScanResult.scan_type == SCHEDULED_SCAN_TYPE,
+                        TaxScanResult.tax_years == [tax_year],
+                    )
+                )
+                result = await tax_scanner_service.run_full_scan(
+                    db, user_id, [tax_year], {tax_year: filing_data},
+                    scan_type=SCHEDULED_SCAN_TYPE,
+                )
+                await db.commit()
+                return result["total_findings"]
+        except Exception as e:
+            logger.error(f"Tax scan failed for user={user_id}, year={tax_year}: {e}")
+            return 0
 
 
 async def _monthly_tax_scan_async():
+    """
+    전년도 본인부담금 합계를 전체 DOCTOR에 대해 GROUP BY 1회로 집계
+    (claim_date 범위 조건 — ix_claim_date 사용), 기준 초과 의사만 청크 단위로
+    신고 데이터를 일괄 로드해 TaxScannerService로 병렬 스캔
+    """
+    import asyncio
+    from datetime import date
     from app.core.database import async_session
     from sqlalchemy import select, func, and_
-    from app.models.user import User
+    from app.models.user import User, UserRole
     from app.models.insurance_claim import InsuranceClaim, ClaimStatus
-
-    current_year = datetime.utcnow().year - 1  # 전년도 기준
-
-    async with async_session() as db:
-        # DOCTOR 역할 유저 조회
-        result = await db.execute(
-            select(User).where(User.role == "DOCTOR")
+    from app.models.tax_filing import FilingType, TaxFilingHistory
+    from app.services.tax_scanner import filing_data_from_history
+
+    tax_year = datetime.utcnow().year - 1  # 전년도 기준
+    total_copay = func.sum(InsuranceClaim.copay_amount)
+    query = (
+        select(InsuranceClaim.user_id, User.specialty, total_copay.label("total_copay"))
+        .join(User, User.id == InsuranceClaim.user_id)
+        .where(
+            and_(
+                User.role == UserRole.DOCTOR,
+                InsuranceClaim.claim_date >= date(tax_year, 1, 1),
+                InsuranceClaim.claim_date < date(tax_year + 1, 1, 1),
+                InsuranceClaim.status.in_([ClaimStatus.ACCEPTED, ClaimStatus.PARTIAL]),
+            )
         )
-        doctors = result.scalars().all()
-        scanned = 0
+        .group_by(InsuranceClaim.user_id, User.specialty)
+        .having(total_copay > TAX_SCAN_COPAY_THRESHOLD)
+        .order_by(InsuranceClaim.user_id)
+        .execution_options(yield_per=TAX_SCAN_CHUNK_SIZE)
+    )
 
-        for doctor in doctors:
-            copay_result = await db.execute(
-                select(func.sum(InsuranceClaim.copay_amount)).where(
+    semaphore = asyncio.Semaphore(TAX_SCAN_PARALLELISM)
+    candidates = scanned = findings = 0
+    async with async_session() as stream_db, async_session() as db:
+        result = await stream_db.stream(query)
+        async for chunk in result.partitions():
+            candidates += len(chunk)
+
+            # 청크 내 의사들의 신고 데이터 일괄 로드
+            filings_result = await db.execute(
+                select(TaxFilingHistory)
+                .where(
                     and_(
-                        InsuranceClaim.user_id == doctor.id,
-                        func.extract("year", InsuranceClaim.claim_date) == current_year,
-                        InsuranceClaim.status.in_([
-                            ClaimStatus.ACCEPTED, ClaimStatus.PARTIAL,
-                        ]),
+                        TaxFilingHistory.user_id.in_([row.user_id for row in chunk]),
+                        TaxFilingHistory.tax_year == tax_year,
+                        TaxFilingHistory.filing_type == FilingType.INCOME_TAX,
                     )
                 )
+                .order_by(TaxFilingHistory.updated_at)
             )
-            total_copay = copay_result.scalar() or 0
+            filings = {f.user_id: f for f in filings_result.scalars()}
 
-            if total_copay > 3_000_000:
-                # 의료비 세액공제 대상 가능 → 로그만 기록 (알림은 추후)
-                medical_credit = min(int((total_copay - 3_000_000) * 0.15), 7_000_000)
+            scans = []
+            for row in chunk:
+                # 의료비 세액공제 대상 가능
+                medical_credit = min(int((row.total_copay - TAX_SCAN_COPAY_THRESHOLD) * 0.15), 7_000_000)
                 logger.info(
-                    f"Tax scan: user={doctor.id}, year={current_year}, "
-                    f"copay={total_copay}, potential_credit={medical_credit}"
+                    f"Tax scan: user={row.user_id}, year={tax_year}, "
+                    f"copay={row.total_copay}, potential_credit={medical_credit}"
                 )
-                scanned += 1
-
-        logger.info(f"Monthly tax scan complete: {scanned} doctors with potential refunds")
+                filing = filings.get(row.user_id)
+                if filing is None:
+                    continue
+                filing_data = {
+                    **filing_data_from_history(filing),
+                    "specialty": row.specialty or "",
+                    "estimated_medical_expense": int(row.total_copay),
+                }
+                scans.append(_scan_doctor(row.user_id, tax_year, filing_data, semaphore))
+
+            findings += sum(await asyncio.gather(*scans))
+            scanned += len(scans)
+            db.expunge_all()
+
+    logger.info(
+        f"Monthly tax scan complete: {candidates} doctors with potential refunds, "
+        f"{scanned} scanned, {findings} findings"
+    )
 
 
 @celery_app.task(name="app.tasks.claims_tasks.sync_hira_codes")
 def sync_hira_codes():
     """매일 03:00 — HIRA 코드 동기화 (수가/상병/약품)"""
-    import asyncio
-    asyncio.run(_sync_hira_codes_async())
+    run_task(_sync_hira_codes_async())
 
 async def _sync_hira_codes_async():
     """HIRA API에서 코드 변경사항 동기화 (시뮬레이션)"""
     from app.core.database import async_session
     # Log sync attempt - actual HIRA API integration placeholder
+    from app.services.hira_code_cache import hira_fee_code_cache
     logger.info("HIRA code sync started (simulated)")
+    # 레지스트리 변경 → 모든 프로세스의 수가코드 캐시 무효화
+    await hira_fee_code_cache.bump_version()
     logger.info("HIRA code sync completed")
 
 
 @celery_app.task(name="app.tasks.claims_tasks.poll_hira_results")
 def poll_hira_results():
     """2시간마다 08-20시 — 심사결과 수신"""
-    import asyncio
-    asyncio.run(_poll_hira_results_async())
+    run_task(_poll_hira_results_async())
 
 async def _poll_hira_results_async():
     """심평원에서 심사결과 폴링 (시뮬레이션)"""
@@ -177,8 +256,7 @@ async def _poll_hira_results_async():
 @celery_app.task(name="app.tasks.claims_tasks.aggregate_peer_benchmarks")
 def aggregate_peer_benchmarks():
     """매월 2일 04:00 — 동료 벤치마크 집계"""
-    import asyncio
-    asyncio.run(_aggregate_peer_benchmarks_async())
+    run_task(_aggregate_peer_benchmarks_async())
 
 async def _aggregate_peer_benchmarks_async():
     from app.core.database import async_session
@@ -199,8 +277,7 @@ async def _aggregate_peer_benchmarks_async():
 @celery_app.task(name="app.tasks.claims_tasks.update_rejection_patterns")
 def update_rejection_patterns():
     """매주 일요일 05:00 — 삭감 패턴 업데이트"""
-    import asyncio
-    asyncio.run(_update_rejection_patterns_async())
+    run_task(_update_rejection_patterns_async())
 
 async def _update_rejection_patterns_async():
     from app.core.database import async_session
@@ -212,8 +289,7 @@ async def _update_rejection_patterns_async():
 @celery_app.task(name="app.tasks.claims_tasks.generate_monthly_report")
 def generate_monthly_report():
     """매월 1일 07:00 — 월간 보험청구 리포트"""
-    import asyncio
-    asyncio.run(_generate_monthly_report_async())
+    run_task(_generate_monthly_report_async())
 
 async def _generate_monthly_report_async():
     from app.core.database import async_session
@@ -232,12 +308,14 @@ async def _generate_monthly_report_async():
 @celery_app.task(name="app.tasks.claims_tasks.sync_drug_interactions")
 def sync_drug_interactions():
     """매주 월요일 04:00 — 약물 상호작용 DB 동기화"""
-    import asyncio
-    asyncio.run(_sync_drug_interactions_async())
+    run_task(_sync_drug_interactions_async())
 
 async def _sync_drug_interactions_async():
     from app.core.database import async_session
+    from app.services.dur_engine import dur_engine
     logger.info("Syncing drug interaction database (simulated)")
+    # 상호작용 변경 → 모든 프로세스의 DUR 규칙 인덱스 재컴파일
+    await dur_engine.bump_version()
     logger.info("Drug interaction sync completed")
 
 
@@ -246,8 +324,7 @@ async def _sync_drug_interactions_async():
 @celery_app.task(name="app.tasks.claims_tasks.monthly_full_tax_scan")
 def monthly_full_tax_scan():
     """매월 1일 03:00 — 전체 유저 AI 세금 스캔"""
-    import asyncio
-    asyncio.run(_monthly_full_tax_scan_async())
+    run_task(_monthly_full_tax_scan_async())
 
 async def _monthly_full_tax_scan_async():
     from app.core.database import async_session
@@ -265,8 +342,7 @@ async def _monthly_full_tax_scan_async():
 @celery_app.task(name="app.tasks.claims_tasks.poll_nts_status")
 def poll_nts_status():
     """6시간마다 — 경정청구 결과 조회"""
-    import asyncio
-    asyncio.run(_poll_nts_status_async())
+    run_task(_poll_nts_status_async())
 
 async def _poll_nts_status_async():
     from app.core.database import async_session
@@ -288,8 +364,7 @@ async def _poll_nts_status_async():
 @celery_app.task(name="app.tasks.claims_tasks.update_tax_regulations")
 def update_tax_regulations():
     """매주 일요일 — 세법 변경 모니터링"""
-    import asyncio
-    asyncio.run(_update_tax_regulations_async())
+    run_task(_update_tax_regulations_async())
 
 async def _update_tax_regulations_async():
     from app.core.database import async_session
@@ -300,8 +375,7 @@ async def _update_tax_regulations_async():
 @celery_app.task(name="app.tasks.claims_tasks.generate_tax_peer_benchmarks")
 def generate_tax_peer_benchmarks():
     """매월 2일 04:00 — 세무 동종 벤치마크"""
-    import asyncio
-    asyncio.run(_generate_tax_peer_benchmarks_async())
+    run_task(_generate_tax_peer_benchmarks_async())
 
 async def _generate_tax_peer_benchmarks_async():
     from app.core.database import async_session
@@ -312,8 +386,7 @@ async def _generate_tax_peer_benchmarks_async():
 @celery_app.task(name="app.tasks.claims_tasks.process_fee_settlement")
 def process_fee_settlement():
     """매일 10:00 — 수수료 정산 처리"""
-    import asyncio
-    asyncio.run(_process_fee_settlement_async())
+    run_task(_process_fee_settlement_async())
 
 async def _process_fee_settlement_async():
     from app.core.database import async_session
@@ -331,8 +404,7 @@ async def _process_fee_settlement_async():
 @celery_app.task(name="app.tasks.claims_tasks.process_document_ocr")
 def process_document_ocr(document_id: str):
     """즉시 트리거 — 문서 OCR 처리"""
-    import asyncio
-    asyncio.run(_process_document_ocr_async(document_id))
+    run_task(_process_document_ocr_async(document_id))
 
 async def _process_document_ocr_async(document_id: str):
     from app.core.database import async_session
@@ -344,8 +416,7 @@ async def _process_document_ocr_async(document_id: str):
 @celery_app.task(name="app.tasks.claims_tasks.classify_document")
 def classify_document(document_id: str):
     """즉시 트리거 — OCR 완료 후 AI 분류"""
-    import asyncio
-    asyncio.run(_classify_document_async(document_id))
+    run_task(_classify_document_async(document_id))
 
 async def _classify_document_async(document_id: str):
     from app.core.database import async_session
@@ -357,8 +428,7 @@ async def _classify_document_async(document_id: str):
 @celery_app.task(name="app.tasks.claims_tasks.sync_hometax_data")
 def sync_hometax_data(user_id: str):
     """즉시 트리거 — 홈택스 데이터 동기화"""
-    import asyncio
-    asyncio.run(_sync_hometax_data_async(user_id))
+    run_task(_sync_hometax_data_async(user_id))
 
 async def _sync_hometax_data_async(user_id: str):
     from app.core.database import async_session
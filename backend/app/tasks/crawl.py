@@ -9,6 +9,8 @@ import httpx
 import asyncio
 import xml.etree.ElementTree as ET
 
+from .celery_app import close_task_loop
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,7 +68,7 @@ def crawl_hira_hospitals(self):
         logger.error(f"HIRA crawl failed: {e}")
         self.retry(exc=e, countdown=300)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _crawl_hira_async():
@@ -167,7 +169,7 @@ def check_closed_hospitals(self):
         logger.error(f"Closed hospital check failed: {e}")
         self.retry(exc=e, countdown=300)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _check_closed_async():
@@ -363,7 +365,7 @@ def crawl_building_registry(self):
         logger.error(f"Building crawl failed: {e}")
         self.retry(exc=e, countdown=300)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _crawl_building_async():
@@ -508,7 +510,7 @@ def crawl_commercial_data():
         result = loop.run_until_complete(_crawl_commercial_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _crawl_commercial_async():
@@ -669,7 +671,7 @@ def geocode_addresses():
         result = loop.run_until_complete(_geocode_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _geocode_async():
@@ -732,3 +734,28 @@ async def _geocode_async():
 
     logger.info(f"Geocoded {geocoded_count} addresses")
     return {"status": "completed", "geocoded": geocoded_count}
+
+
+@shared_task(bind=True, max_retries=2)
+def rebuild_hira_snapshot(self):
+    """
+    심평원 요양기관 전국 스냅샷 재구축 (반경/영역 조회용 로컬 인덱스)
+    """
+    logger.info("Rebuilding HIRA institution snapshot...")
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(_rebuild_hira_snapshot_async())
+    except Exception as e:
+        logger.error(f"HIRA snapshot rebuild failed: {e}")
+        self.retry(exc=e, countdown=1800)
+    finally:
+        close_task_loop(loop)
+
+
+async def _rebuild_hira_snapshot_async():
+    from app.services.hira_snapshot import hira_snapshot_service
+
+    return await hira_snapshot_service.rebuild()
@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .celery_app import celery_app
+from .celery_app import celery_app, close_task_loop
 from app.core.database import async_session
 from app.models.listing_subscription import ListingSubscription, ListingSubStatus
 from app.models.landlord import LandlordListing, LandlordListingStatus
@@ -253,7 +253,7 @@ def process_listing_renewals():
         loop.run_until_complete(_process_renewals())
         loop.run_until_complete(_retry_past_due())
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 @celery_app.task(name="app.tasks.listing_subscription_tasks.expire_canceled_subscriptions")
@@ -263,4 +263,4 @@ def expire_canceled_subscriptions():
     try:
         loop.run_until_complete(_expire_canceled())
     finally:
-        loop.close()
+        close_task_loop(loop)
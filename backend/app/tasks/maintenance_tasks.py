@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .celery_app import celery_app
+from .celery_app import celery_app, close_task_loop
 from app.core.database import async_session
 from app.models.maintenance import (
     MaintenanceContract, MaintenanceStatus, MaintenanceServiceType,
@@ -324,7 +324,7 @@ def process_maintenance_renewals():
         loop.run_until_complete(_process_maintenance_renewals())
         loop.run_until_complete(_retry_past_due_maintenance())
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 @celery_app.task(name="app.tasks.maintenance_tasks.expire_canceled_maintenance")
@@ -334,7 +334,7 @@ def expire_canceled_maintenance():
     try:
         loop.run_until_complete(_expire_canceled_maintenance())
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 @celery_app.task(name="app.tasks.maintenance_tasks.send_maintenance_setup_reminders")
@@ -344,4 +344,4 @@ def send_maintenance_setup_reminders():
     try:
         loop.run_until_complete(_send_setup_reminders())
     finally:
-        loop.close()
+        close_task_loop(loop)
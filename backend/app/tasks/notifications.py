@@ -12,6 +12,8 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from .celery_app import close_task_loop
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -96,7 +98,7 @@ def send_push_notification(self, user_id: int, title: str, body: str, data: Dict
             )
             return result
         finally:
-            loop.close()
+            close_task_loop(loop)
 
     except Exception as e:
         logger.error(f"Push notification failed: {e}")
@@ -245,7 +247,7 @@ def send_sms_notification(self, phone: str, message: str):
             result = loop.run_until_complete(_send_twilio_sms(phone, message))
             return result
         finally:
-            loop.close()
+            close_task_loop(loop)
 
     except Exception as e:
         logger.error(f"SMS notification failed: {e}")
@@ -326,7 +328,7 @@ def send_kakao_notification(self, phone: str, template_code: str, variables: Dic
             )
             return result
         finally:
-            loop.close()
+            close_task_loop(loop)
 
     except Exception as e:
         logger.error(f"Kakao notification failed: {e}")
@@ -435,7 +437,7 @@ def process_pending_alerts():
         result = loop.run_until_complete(_process_alerts_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _process_alerts_async():
@@ -547,7 +549,7 @@ def send_new_prospect_alerts(prospect_id: int):
         result = loop.run_until_complete(_send_prospect_alerts_async(prospect_id))
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _send_prospect_alerts_async(prospect_id: int):
@@ -620,7 +622,7 @@ def send_bid_notification(bid_id: int, notification_type: str):
         result = loop.run_until_complete(_send_bid_notification_async(bid_id, notification_type))
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _send_bid_notification_async(bid_id: int, notification_type: str):
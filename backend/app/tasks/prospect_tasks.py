@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 import asyncio
 
+from .celery_app import close_task_loop
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +32,7 @@ def run_pharmacy_prospect_scan():
         logger.error(f"Prospect scan failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _run_prospect_scan_async():
@@ -173,7 +175,7 @@ def scan_region_prospects(sido_name: str, min_score: int = 50):
         logger.error(f"Region scan failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _scan_region_async(sido_name: str, min_score: int):
@@ -212,7 +214,7 @@ def get_hot_prospects_for_campaign(limit: int = 100):
         logger.error(f"Get HOT prospects failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _get_hot_prospects_async(limit: int):
@@ -292,7 +294,7 @@ def update_prospect_contact_status(ykiho: str, status: str, notes: str = ""):
         logger.error(f"Update contact status failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _update_contact_status_async(ykiho: str, status: str, notes: str):
@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 import asyncio
 
+from .celery_app import close_task_loop
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +32,7 @@ def run_realestate_crawl():
         logger.error(f"Real estate crawl failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _run_realestate_crawl_async():
@@ -87,7 +89,7 @@ def crawl_realestate_by_region(sido_name: str, sigungu_codes: List[str]):
         logger.error(f"Region crawl failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _crawl_region_async(sido_name: str, sigungu_codes: List[str]):
@@ -127,7 +129,7 @@ def analyze_listing_suitability(listing_id: str):
         logger.error(f"Analysis failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _analyze_listing_async(listing_id: str):
@@ -191,7 +193,7 @@ def update_expired_listings():
         logger.error(f"Update failed: {e}")
         return {"status": "failed", "error": str(e)}
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _update_expired_async():
@@ -9,6 +9,8 @@ import json
 import asyncio
 import httpx
 
+from .celery_app import close_task_loop
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -31,7 +33,7 @@ def generate_simulation_report(self, simulation_id: int):
         logger.error(f"Failed to generate simulation report: {e}")
         self.retry(exc=e, countdown=60)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _generate_simulation_report_async(simulation_id: int):
@@ -272,7 +274,7 @@ def generate_prospect_report(self, prospect_id: int, user_id: int):
         logger.error(f"Failed to generate prospect report: {e}")
         self.retry(exc=e, countdown=60)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _generate_prospect_report_async(prospect_id: int, user_id: int) -> Dict[str, Any]:
@@ -343,7 +345,7 @@ def send_daily_digest():
         result = loop.run_until_complete(_send_daily_digest_async())
         return result
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _send_daily_digest_async():
@@ -438,7 +440,7 @@ def export_prospects_to_excel(self, user_id: int, filters: Dict = None):
         logger.error(f"Failed to export prospects: {e}")
         self.retry(exc=e, countdown=60)
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 async def _export_prospects_async(user_id: int, filters: Dict = None):
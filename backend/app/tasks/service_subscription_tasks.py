@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .celery_app import celery_app
+from .celery_app import celery_app, close_task_loop
 from app.core.database import async_session
 from app.models.service_subscription import ServiceSubscription, ServiceSubStatus, ServiceType
 from app.models.payment import Payment, PaymentStatus, PaymentMethod
@@ -254,7 +254,7 @@ def process_service_renewals():
         loop.run_until_complete(_process_renewals())
         loop.run_until_complete(_retry_past_due())
     finally:
-        loop.close()
+        close_task_loop(loop)
 
 
 @celery_app.task(name="app.tasks.service_subscription_tasks.expire_canceled_service_subscriptions")
@@ -264,4 +264,4 @@ def expire_canceled_service_subscriptions():
     try:
         loop.run_until_complete(_expire_canceled())
     finally:
-        loop.close()
+        close_task_loop(loop)
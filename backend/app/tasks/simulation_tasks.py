@@ -0,0 +1,77 @@
+"""
+시뮬레이션 관련 Celery 태스크
+
+- rebuild_simulation_baselines: 매일 02:30 — 최근 시뮬레이션의 (시군구, 진료과) 기준값 번들 재계산
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from celery import shared_task
+
+from .celery_app import close_task_loop
+
+logger = logging.getLogger(__name__)
+
+# 최근 N일 안에 시뮬레이션이 있었던 조합만 재계산
+BASELINE_LOOKBACK_DAYS = 30
+# 1회 실행당 최대 조합 수 (요청이 많은 조합부터)
+BASELINE_MAX_PAIRS = 300
+
+
+@shared_task(bind=True, max_retries=1)
+def rebuild_simulation_baselines(self):
+    """
+    시뮬레이션 지역 기준값 번들 재계산 (시군구 × 진료과)
+    """
+    logger.info("Rebuilding simulation baselines...")
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(_rebuild_simulation_baselines_async())
+    except Exception as e:
+        logger.error(f"Simulation baseline rebuild failed: {e}")
+        self.retry(exc=e, countdown=1800)
+    finally:
+        close_task_loop(loop)
+
+
+async def _rebuild_simulation_baselines_async():
+    from sqlalchemy import func, select
+
+    from app.core.database import async_session
+    from app.models.simulation import Simulation
+    from app.services.simulation_baseline import simulation_baseline_service
+
+    cutoff = datetime.utcnow() - timedelta(days=BASELINE_LOOKBACK_DAYS)
+    sggu = func.substr(Simulation.demographics_data["region_code"].as_string(), 1, 5)
+
+    async with async_session() as db:
+        result = await db.execute(
+            select(sggu, Simulation.clinic_type, func.count())
+            .where(Simulation.created_at >= cutoff, func.length(sggu) == 5)
+            .group_by(sggu, Simulation.clinic_type)
+            .order_by(func.count().desc())
+            .limit(BASELINE_MAX_PAIRS)
+        )
+        pairs = [(row[0], row[1]) for row in result.all()]
+
+        built = skipped = 0
+        for sggu_cd, clinic_type in pairs:
+            # 시군구 단위 소스는 5자리만 보므로 나머지 자리는 0으로 채움
+            region_code = f"{sggu_cd}00000"
+            try:
+                bundle = await simulation_baseline_service.build(region_code, clinic_type)
+            except Exception as e:
+                logger.warning(f"Simulation baseline {sggu_cd}/{clinic_type} failed: {e}")
+                bundle = None
+            if bundle is None:
+                skipped += 1
+                continue
+            await simulation_baseline_service.save(db, region_code, clinic_type, bundle)
+            built += 1
+
+    logger.info(f"Simulation baselines rebuilt: {built} built, {skipped} skipped of {len(pairs)}")
+    return {"pairs": len(pairs), "built": built, "skipped": skipped}
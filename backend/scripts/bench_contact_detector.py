@@ -0,0 +1,130 @@
+"""
+연락처 탐지 벤치마크 — 기존 방식(패턴 18개 순차 실행 + 매칭마다 str.replace) vs 트리거 사전 필터 + 구간 1회 조립
+
+사용법:
+    python -m scripts.bench_contact_detector
+    python -m scripts.bench_contact_detector --messages 200000 --contact-ratio 0.05
+
+합성 한국어 채팅 코퍼스 (일반 상담 문장 + 일부 연락처 포함 메시지)로
+초당 처리 메시지 수와 기존 방식과의 결과 일치율(탐지 여부/유형/마스킹 결과/탐지 목록 유형)을 측정.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from app.services.contact_detector import ContactDetector, DetectionResult
+
+PLAIN_MESSAGES = [
+    "안녕하세요, 개원 입지 상담 문의드립니다.",
+    "강남역 근처 내과 자리 알아보고 있어요. 보증금은 어느 정도인가요?",
+    "네 확인했습니다. 내일 오후에 다시 말씀드릴게요.",
+    "인테리어 견적서 받아볼 수 있을까요? 평수는 35평 정도입니다.",
+    "의료기기 리스 조건이 궁금합니다. 초음파 장비 기준으로요.",
+    "감사합니다! 계약 진행 관련해서는 다음 주에 정리해서 보내드릴게요.",
+    "주차 공간은 몇 대까지 가능한가요?",
+    "월 임대료 1200만원이면 조금 부담스럽네요 ㅠㅠ",
+    "소아과 수요가 많은 동네인지 데이터 있으면 공유 부탁드려요.",
+    "오늘 미팅 시간 괜찮으세요? 3시쯤 생각하고 있습니다.",
+    "간판 시안 두 개 중에 두 번째가 더 마음에 들어요.",
+    "Thank you, I will check the floor plan and get back to you.",
+    "대출 한도는 병원 매출 추정치 기준으로 나오나요?",
+    "엘리베이터에서 바로 보이는 위치면 좋겠습니다 ㅎㅎ",
+    "접수 데스크랑 대기실 배치도 같이 봐주실 수 있나요?",
+]
+
+CONTACT_MESSAGES = [
+    "제 번호는 010-1234-5678 입니다. 편하실 때 연락주세요.",
+    "01098765432 로 문자 주세요",
+    "사무실 02-555-1234 으로 전화 주시면 됩니다",
+    "공일공 일이삼사 오육칠팔 로 연락 주세요",
+    "메일 주소 doctor.kim@gmail.com 으로 자료 보내주세요",
+    "doctor kim at naver dot com 으로 보내주세요",
+    "카톡 아이디 medi_kim2024 로 추가해주세요",
+    "카카오 id: clinic_open 입니다",
+    "인스타 @gangnam_clinic 에 사진 있어요",
+    "저희 홈페이지 https://example-clinic.co.kr/about 참고하세요",
+    "www.interior-pro.com 에 포트폴리오 있습니다",
+    "라인 medi_line_01 으로 연락 주세요",
+    "플친 강남인테리어 검색하시면 나옵니다",
+]
+
+
+def _legacy_detect(detector: ContactDetector, content: str) -> DetectionResult:
+    """기존 detect_and_filter (패턴 전체 순차 실행 + 매칭마다 replace로 문자열 재생성)"""
+    filtered_content = content
+    patterns_found = []
+    first_contact_type = None
+    first_original_value = None
+    for contact_type, pattern_list in detector.patterns.items():
+        for pattern in pattern_list:
+            for match in pattern.finditer(filtered_content):
+                original_value = match.group()
+                if first_contact_type is None:
+                    first_contact_type = contact_type
+                    first_original_value = original_value
+                patterns_found.append({
+                    "type": contact_type.value,
+                    "value": detector._partial_mask(original_value),
+                    "position": match.span(),
+                })
+                masked_value = detector._mask_value(original_value, contact_type)
+                filtered_content = filtered_content.replace(original_value, masked_value, 1)
+    detected = len(patterns_found) > 0
+    return DetectionResult(
+        detected=detected,
+        contact_type=first_contact_type,
+        original_value=first_original_value,
+        filtered_content=filtered_content if detected else content,
+        patterns_found=patterns_found,
+    )
+
+
+def _make_corpus(n: int, contact_ratio: float) -> List[str]:
+    rng = random.Random(42)
+    corpus = []
+    for _ in range(n):
+        if rng.random() < contact_ratio:
+            corpus.append(rng.choice(CONTACT_MESSAGES))
+        else:
+            # 1~3문장 이어붙인 일반 메시지
+            corpus.append(" ".join(rng.choice(PLAIN_MESSAGES) for _ in range(rng.randint(1, 3))))
+    return corpus
+
+
+def _key(result: DetectionResult) -> tuple:
+    return (
+        result.detected,
+        result.contact_type,
+        result.filtered_content,
+        [found["type"] for found in result.patterns_found],
+    )
+
+
+def _throughput(fn, corpus: List[str]) -> float:
+    started = time.perf_counter()
+    for message in corpus:
+        fn(message)
+    return len(corpus) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연락처 탐지 벤치마크")
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--contact-ratio", type=float, nargs="+", default=[0.02, 0.1, 0.5])
+    args = parser.parse_args()
+
+    detector = ContactDetector()
+    print(f"{'contact%':>8} {'legacy msg/s':>13} {'new msg/s':>11} {'speedup':>8} {'same result':>12}")
+    for ratio in args.contact_ratio:
+        corpus = _make_corpus(args.messages, ratio)
+        legacy = _throughput(lambda m: _legacy_detect(detector, m), corpus)
+        new = _throughput(detector.detect_and_filter, corpus)
+
+        unique = set(corpus)
+        same = sum(1 for m in unique if _key(_legacy_detect(detector, m)) == _key(detector.detect_and_filter(m)))
+        print(f"{ratio * 100:>7.0f}% {legacy:>13,.0f} {new:>11,.0f} {new / legacy:>7.1f}x {same:>5}/{len(unique):<6}")
+
+
+if __name__ == "__main__":
+    main()
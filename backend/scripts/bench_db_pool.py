@@ -0,0 +1,83 @@
+"""
+DB 커넥션 풀 벤치마크 — NullPool vs 앱 내 풀 (동시 요청 지연시간)
+
+사용법:
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.bench_db_pool
+    python -m scripts.bench_db_pool --modes null pooled --concurrency 1 10 50 --requests 500
+    python -m scripts.bench_db_pool --query "SELECT id FROM users ORDER BY created_at DESC LIMIT 20"
+
+요청 1건 = 세션 열기 → 쿼리 1회 → 커밋 → 세션 닫기 (get_db 의존성과 같은 수명).
+pgbouncer 모드는 DATABASE_URL이 PgBouncer(transaction 모드)를 가리킬 때만 의미가 있다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import database
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def _run(mode: str, concurrency: int, total: int, query: str) -> dict:
+    engine = database._build_engine(mode)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        async with semaphore:
+            started = time.perf_counter()
+            async with session_factory() as session:
+                await session.execute(text(query))
+                await session.commit()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    # 워밍업 (풀 채우기) — 측정에서 제외
+    await asyncio.gather(*(one_request() for _ in range(concurrency)))
+    latencies.clear()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "p50": statistics.median(latencies),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "rps": total / elapsed,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="DB 풀 벤치마크")
+    parser.add_argument("--modes", nargs="+", default=["null", "pooled"], choices=database.POOL_MODES)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--query", default="SELECT 1")
+    args = parser.parse_args()
+
+    print(f"{'mode':>10} {'conc':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    for concurrency in args.concurrency:
+        for mode in args.modes:
+            r = await _run(mode, concurrency, args.requests, args.query)
+            print(
+                f"{r['mode']:>10} {r['concurrency']:>5} {r['p50']:>8.2f} {r['p95']:>8.2f} "
+                f"{r['p99']:>8.2f} {r['rps']:>8.0f}"
+            )
+    print(f"pool counters: {database.get_db_pool_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
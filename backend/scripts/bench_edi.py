@@ -0,0 +1,108 @@
+"""
+EDI 배치 작성 벤치마크 — 기존 방식(청구 XML 목록 → 결합 문자열) vs EDIBatchWriter (점진 압축)
+
+사용법:
+    python -m scripts.bench_edi
+    python -m scripts.bench_edi --sizes 1000 10000 --items 8
+
+DB 없이 합성 청구로 XML 생성·보관 비용만 측정.
+측정 항목:
+    - total: 배치 생성 + 로그 저장용 페이로드 확정까지 시간
+    - peak: tracemalloc 기준 파이썬 힙 최대 사용량 (청구 객체 생성분 제외)
+    - stored: EDIMessageLog에 저장되는 크기 (기존: XML 문자열, 신규: gzip 압축본)
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import List
+from xml.etree.ElementTree import Element, SubElement, tostring
+
+from app.services.hira_edi import EDIBatchWriter, HIRAEDIService
+
+DX_CODES = ["J06.9", "J20.9", "M54.5", "K29.5", "I10", "E11.9"]
+FEE_CODES = [("AA157", "초진 진찰료"), ("B0020", "물리치료-기본"), ("D2200", "일반혈액검사(CBC)"), ("F1010", "처방료")]
+
+
+def _make_claims(n: int, items_per_claim: int) -> List[SimpleNamespace]:
+    rng = random.Random(42)
+    claims = []
+    for i in range(n):
+        items = []
+        for _ in range(items_per_claim):
+            code, name = rng.choice(FEE_CODES)
+            price = rng.randint(5000, 50000)
+            items.append(SimpleNamespace(
+                item_type=SimpleNamespace(value="TREATMENT"), code=code, name=name,
+                quantity=1, unit_price=price, total_price=price,
+            ))
+        total = sum(it.total_price for it in items)
+        claims.append(SimpleNamespace(
+            id=i, claim_number=f"CLM-202601-{i:06d}", service_date=date(2026, 1, 1 + i % 28),
+            claim_date=date(2026, 2, 1), ykiho="12345678", specialty_code="01",
+            patient_chart_no=f"P{i:07d}", patient_age=rng.randint(1, 90), patient_gender=rng.choice("MF"),
+            primary_dx_code=rng.choice(DX_CODES), secondary_dx_codes=rng.sample(DX_CODES, 2),
+            total_amount=total, insurance_amount=int(total * 0.7), copay_amount=total - int(total * 0.7),
+            items=items,
+        ))
+    return claims
+
+
+def _legacy(service: HIRAEDIService, claims) -> int:
+    """기존 submit_claims: 검증 1회 + 청구 XML 목록 + ElementTree 래퍼 + 저장용 UTF-8 크기 계산"""
+    for idx, claim in enumerate(claims):
+        service._claim_errors(idx, claim)
+    xml_messages = [service._build_claim_xml(c) for c in claims]
+    root = Element("EDIBatchMessage")
+    SubElement(root, "MessageID").text = "MM-BENCH"
+    SubElement(root, "BatchID").text = "1"
+    SubElement(root, "Timestamp").text = datetime.utcnow().isoformat()
+    SubElement(root, "ClaimCount").text = str(len(xml_messages))
+    claims_elem = SubElement(root, "Claims")
+    for xml in xml_messages:
+        SubElement(claims_elem, "ClaimData").text = xml
+    combined_xml = tostring(root, encoding="unicode")
+    return len(combined_xml.encode("utf-8"))
+
+
+def _stream(service: HIRAEDIService, claims) -> int:
+    writer = EDIBatchWriter("MM-BENCH", 1, len(claims))
+    for idx, claim in enumerate(claims):
+        if not service._claim_errors(idx, claim):
+            writer.write_claim(service._build_claim_xml(claim))
+    return len(writer.finish())
+
+
+def _measure(fn, *args, trace: bool = True) -> dict:
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    stored = fn(*args)
+    total = time.perf_counter() - started
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"total": total, "peak_mb": peak / 1024 / 1024, "stored_mb": stored / 1024 / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EDI 배치 작성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--items", type=int, default=6, help="청구당 항목 수")
+    parser.add_argument("--no-trace", action="store_true", help="메모리 추적 끄기 (시간 측정 정확도 우선)")
+    args = parser.parse_args()
+
+    service = HIRAEDIService(simulation_mode=True)
+    print(f"{'N':>7} {'mode':>7} {'total s':>8} {'peak MB':>8} {'stored MB':>10}")
+    for n in args.sizes:
+        claims = _make_claims(n, args.items)
+        for mode, fn in (("legacy", _legacy), ("stream", _stream)):
+            r = _measure(fn, service, claims, trace=not args.no_trace)
+            print(f"{n:>7} {mode:>7} {r['total']:>8.2f} {r['peak_mb']:>8.1f} {r['stored_mb']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+내보내기 벤치마크 — 기존 방식(pandas로 전체 파일 생성) vs 스트리밍 (app.core.export_stream)
+
+사용법:
+    python -m scripts.bench_export
+    python -m scripts.bench_export --sizes 10000 100000 1000000 --formats csv excel
+    python -m scripts.bench_export --sizes 1000000 --formats csv --skip-legacy
+
+DB 없이 합성 행으로 포맷 비용만 측정 (서버사이드 커서와 같은 배치 크기로 공급).
+측정 항목:
+    - total: 마지막 바이트까지 시간
+    - first: 첫 바이트까지 시간 (TTFB)
+    - peak: tracemalloc 기준 파이썬 힙 최대 사용량 (추적 오버헤드로 시간이 크게 늘어나므로
+      시간만 볼 때는 --no-trace)
+    - size: 출력 바이트 수
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from io import BytesIO
+from typing import Any, AsyncIterator, List
+
+from app.core.export_stream import csv_stream, xlsx_stream
+from app.services.prospect import EXPORT_COLUMNS, EXPORT_FETCH_SIZE
+
+DEPTS = ["내과", "정형외과", "피부과", "소아청소년과", "이비인후과", "안과", "치과"]
+
+
+def _make_row(i: int, rng: random.Random) -> List[Any]:
+    return [
+        f"서울특별시 강남구 테헤란로 {i % 500 + 1}길 {i % 97 + 1}",
+        rng.choice(["NEW_BUILD", "VACANCY", "RELOCATION"]),
+        rng.randint(30, 100),
+        ", ".join(rng.sample(DEPTS, 2)),
+        rng.choice(["NEW", "CONTACTED", "CONVERTED"]),
+        str(datetime(2026, 1, 1) + timedelta(minutes=i)),
+    ]
+
+
+async def _batches(n: int, batch_size: int = EXPORT_FETCH_SIZE) -> AsyncIterator[List[List[Any]]]:
+    rng = random.Random(42)
+    for start in range(0, n, batch_size):
+        yield [_make_row(i, rng) for i in range(start, min(n, start + batch_size))]
+        await asyncio.sleep(0)  # 커서 fetch 자리 — 이벤트 루프 양보
+
+
+async def _legacy(n: int, fmt: str) -> AsyncIterator[bytes]:
+    """기존 export_prospects: 전체 행 → DataFrame → 완성된 bytes 1개"""
+    import pandas as pd
+
+    rows = []
+    async for batch in _batches(n):
+        rows.extend(batch)
+    df = pd.DataFrame(rows, columns=EXPORT_COLUMNS)
+    output = BytesIO()
+    if fmt == "excel":
+        df.to_excel(output, index=False, engine="openpyxl")
+    else:
+        df.to_csv(output, index=False, encoding="utf-8-sig")
+    yield output.getvalue()
+
+
+async def _measure(stream: AsyncIterator[bytes], trace: bool = True) -> dict:
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    first = None
+    size = 0
+    async for chunk in stream:
+        if first is None:
+            first = time.perf_counter() - started
+        size += len(chunk)
+    total = time.perf_counter() - started
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"total": total, "first": first or total, "peak_mb": peak / 1024 / 1024, "size_mb": size / 1024 / 1024}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="내보내기 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--formats", nargs="+", default=["csv", "excel"], choices=["csv", "excel"])
+    parser.add_argument("--no-trace", action="store_true", help="메모리 추적 끄기 (시간 측정 정확도 우선)")
+    parser.add_argument("--skip-legacy", action="store_true", help="기존 방식 측정 생략 (대용량에서 느림)")
+    args = parser.parse_args()
+
+    print(f"{'fmt':>6} {'N':>8} {'mode':>7} {'total s':>8} {'first s':>8} {'peak MB':>8} {'size MB':>8}")
+    for fmt in args.formats:
+        for n in args.sizes:
+            modes = [] if args.skip_legacy else [("legacy", lambda: _legacy(n, fmt))]
+            if fmt == "excel":
+                modes.append(("stream", lambda: xlsx_stream(EXPORT_COLUMNS, _batches(n))))
+            else:
+                modes.append(("stream", lambda: csv_stream(EXPORT_COLUMNS, _batches(n))))
+            for mode, factory in modes:
+                r = await _measure(factory(), trace=not args.no_trace)
+                print(
+                    f"{fmt:>6} {n:>8} {mode:>7} {r['total']:>8.2f} {r['first']:>8.3f} "
+                    f"{r['peak_mb']:>8.1f} {r['size_mb']:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""
+거리 계산 마이크로 벤치마크 — 스칼라 haversine 루프 vs app.core.geo (NumPy)
+
+사용법:
+    python -m scripts.bench_geo
+    python -m scripts.bench_geo --sizes 1000 10000 100000 --repeat 5
+
+측정 항목 (점 N개, 반경 1km):
+    - loop: 기존 방식 (dict 순회 + math haversine + 반경 필터 + 정렬)
+    - kernel: within_radius (좌표 배열이 이미 있을 때)
+    - dicts: annotate_distances (dict 목록 → 배열 변환 포함, 서비스 코드 실제 경로)
+    - knn: k_nearest (k=20)
+"""
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from app.core.geo import annotate_distances, coords_array, haversine_m, k_nearest, within_radius
+
+CENTER = (37.5000, 127.0365)  # 역삼동
+RADIUS_M = 1000
+SPREAD_DEG = 0.2  # 중심 ±0.2° (~±20km) 에 무작위 분포
+
+
+def _make_points(n: int, seed: int = 42) -> List[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "latitude": CENTER[0] + rng.uniform(-SPREAD_DEG, SPREAD_DEG),
+            "longitude": CENTER[1] + rng.uniform(-SPREAD_DEG, SPREAD_DEG),
+        }
+        for _ in range(n)
+    ]
+
+
+def _scalar_loop(points: List[dict]) -> List[dict]:
+    nearby = []
+    for p in points:
+        d = haversine_m(CENTER[0], CENTER[1], p["latitude"], p["longitude"])
+        if d <= RADIUS_M:
+            p["distance"] = round(d)
+            nearby.append(p)
+    nearby.sort(key=lambda x: x["distance"])
+    return nearby
+
+
+def _best_ms(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="haversine 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'N':>8} {'loop ms':>10} {'kernel ms':>10} {'dicts ms':>10} {'knn ms':>10} {'speedup':>9} {'match':>6}")
+    for n in args.sizes:
+        points = _make_points(n)
+        lats, lngs = coords_array(points)
+
+        loop_ms = _best_ms(lambda: _scalar_loop(points), args.repeat)
+        kernel_ms = _best_ms(lambda: within_radius(CENTER[0], CENTER[1], lats, lngs, RADIUS_M), args.repeat)
+        dicts_ms = _best_ms(lambda: annotate_distances(CENTER[0], CENTER[1], points, radius_m=RADIUS_M), args.repeat)
+        knn_ms = _best_ms(lambda: k_nearest(CENTER[0], CENTER[1], lats, lngs, 20), args.repeat)
+
+        # 결과 일치 확인 (같은 점 집합 + 같은 거리 순서. 반올림 동률의 순서 차이는 허용)
+        expected = _scalar_loop(points)
+        actual = annotate_distances(CENTER[0], CENTER[1], points, radius_m=RADIUS_M)
+        same = {id(p) for p in expected} == {id(p) for p in actual} and (
+            [p["distance"] for p in expected] == [p["distance"] for p in actual]
+        )
+        match = "ok" if same else "DIFF"
+
+        print(
+            f"{n:>8} {loop_ms:>10.2f} {kernel_ms:>10.3f} {dicts_ms:>10.2f} {knn_ms:>10.3f} "
+            f"{loop_ms / max(kernel_ms, 1e-6):>8.1f}x {match:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+로그인 폭주 부하 테스트 — 이벤트 루프에서 bcrypt 직접 호출 vs 해시 전용 스레드 풀
+
+사용법:
+    python -m scripts.bench_login
+    python -m scripts.bench_login --logins 50 --rounds 12
+
+DB 없이 비밀번호 검증만 하는 로그인 엔드포인트와 관계없는 /ping 엔드포인트를 같은 앱에 두고
+(httpx ASGITransport, 단일 이벤트 루프 = uvicorn 워커 1개), 로그인 N건을 동시에 보내는 동안
+/ping을 주기적으로 호출해 두 엔드포인트의 지연 시간을 측정.
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from app.core.config import settings
+from app.core.security import pwd_context, verify_password_async
+
+PASSWORD = "correct horse battery staple"
+
+
+def _build_app(hashed: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login/blocking")
+    async def login_blocking():
+        if not pwd_context.verify(PASSWORD, hashed):
+            raise HTTPException(status_code=401)
+        return {"ok": True}
+
+    @app.post("/login/pool")
+    async def login_pool():
+        valid, _ = await verify_password_async(PASSWORD, hashed)
+        if not valid:
+            raise HTTPException(status_code=401)
+        return {"ok": True}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def _pct(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+async def _storm(client: httpx.AsyncClient, path: str, logins: int, ping_interval: float) -> dict:
+    login_ms: List[float] = []
+    ping_ms: List[float] = []
+    done = asyncio.Event()
+
+    # 로그인은 동시에 도착한 것으로 보고 폭주 시작 시점부터, ping은 보내려던 시점부터 응답까지 측정
+    # (이벤트 루프가 막혀 있던 시간이 지연에 포함되도록)
+    async def one_login(started: float):
+        response = await client.post(path)
+        response.raise_for_status()
+        login_ms.append(time.perf_counter() - started)
+
+    async def pinger():
+        scheduled = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            await client.get("/ping")
+            ping_ms.append(time.perf_counter() - scheduled)
+            scheduled = max(scheduled + ping_interval, time.perf_counter())
+
+    ping_task = asyncio.create_task(pinger())
+    await asyncio.sleep(ping_interval)
+    started = time.perf_counter()
+    await asyncio.gather(*(one_login(started) for _ in range(logins)))
+    total = time.perf_counter() - started
+    done.set()
+    await ping_task
+    return {
+        "total_s": total,
+        "login_p50": _pct(login_ms, 0.5),
+        "login_p95": _pct(login_ms, 0.95),
+        "ping_n": len(ping_ms),
+        "ping_p50": _pct(ping_ms, 0.5),
+        "ping_p95": _pct(ping_ms, 0.95),
+        "ping_max": max(ping_ms) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="로그인 폭주 부하 테스트")
+    parser.add_argument("--logins", type=int, default=20, help="동시 로그인 수")
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS, help="bcrypt 비용")
+    parser.add_argument("--ping-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    hashed = pwd_context.hash(PASSWORD, rounds=args.rounds)
+    app = _build_app(hashed)
+    print(f"bcrypt rounds={args.rounds}, hash workers={settings.PASSWORD_HASH_WORKERS}, logins={args.logins}")
+    print(f"{'mode':>9} {'total s':>8} {'login p50':>10} {'login p95':>10} {'pings':>6} {'ping p50':>9} {'ping p95':>9} {'ping max':>9}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        idle = []
+        for _ in range(50):
+            started = time.perf_counter()
+            await client.get("/ping")
+            idle.append(time.perf_counter() - started)
+        print(f"{'idle':>9} {'':>8} {'':>10} {'':>10} {len(idle):>6} {_pct(idle, 0.5):>7.1f}ms {_pct(idle, 0.95):>7.1f}ms {max(idle) * 1000:>7.0f}ms")
+        for mode in ("blocking", "pool"):
+            r = await _storm(client, f"/login/{mode}", args.logins, args.ping_interval)
+            print(
+                f"{mode:>9} {r['total_s']:>8.2f} {r['login_p50']:>8.0f}ms {r['login_p95']:>8.0f}ms "
+                f"{r['ping_n']:>6} {r['ping_p50']:>7.1f}ms {r['ping_p95']:>7.1f}ms {r['ping_max']:>7.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())